@@ -11,6 +11,7 @@ Key Changes:
 - Added support for extended ranges (10000+)
 """
 
+import sys
 import time
 from enum import IntEnum
 from typing import Dict,List,Any
@@ -70,17 +71,28 @@ class StreamlinedDiscoveryTranslator:
                 if (isinstance (obj,type) and
                         issubclass (obj,IntEnum) and
                         obj != IntEnum and
-                        hasattr (obj,'__members__') and
-                        len (obj.__members__) > 0):
+                        len (obj) > 0):
 
                     # Register every code in this enum
                     for enum_item in obj:
                         self._code_registry [enum_item.value] = {
-                            'name':enum_item.name.lower (),
+                            'name':sys.intern (enum_item.name.lower ()),
                             'enum_class_name':obj.__name__,
                             'system':self._determine_system_from_code (enum_item.value)
                             }
 
+                # Plain-int code tables carry their own value -> name map
+                elif (isinstance (obj,type) and
+                        issubclass (obj,uis.CodeTable) and
+                        obj != uis.CodeTable):
+
+                    for value,member_name in obj.NAMES.items ():
+                        self._code_registry [value] = {
+                            'name':sys.intern (member_name.lower ()),
+                            'enum_class_name':obj.__name__,
+                            'system':self._determine_system_from_code (value)
+                            }
+
             except (AttributeError,TypeError,ValueError) as e:
                 errors.append (f"{name}: {type (e).__name__} - {str (e)}")
                 continue
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Tests for the Universal Integer Code System tables and translator
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add the current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import universal_integer_system as uis
+from universal_integer_system import AppType, CodeMigration, CodeTable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestCodeTable(unittest.TestCase):
+    """Plain-int code tables such as AppType."""
+
+    def test_members_are_plain_ints(self):
+        self.assertIs(type(AppType.LIFE_COACH), int)
+        self.assertEqual(AppType.LIFE_COACH, 16000)
+        self.assertEqual(AppType.NAMES[16000], "LIFE_COACH")
+
+    def test_app_type_values_are_unique(self):
+        self.assertEqual(AppType.ADMIN_DASHBOARD, 16200)
+        self.assertEqual(AppType.ZAPIER_CONNECTOR, 16303)
+        self.assertEqual(AppType.NAMES[AppType.DISCORD_BOT], "DISCORD_BOT")
+
+    def test_duplicate_values_rejected(self):
+        with self.assertRaises(ValueError):
+            class Broken(CodeTable):
+                FIRST = 1
+                SECOND = 1
+
+    def test_app_types_are_translated(self):
+        translator = uis.UniversalTranslator()
+        self.assertEqual(translator.translate_code(AppType.LIFE_COACH), "life.coach")
+        self.assertEqual(translator.translate_code(AppType.ZAPIER_CONNECTOR), "zapier.connector")
+
+
+class TestUniversalTranslator(unittest.TestCase):
+    """Translation helpers on the global translator."""
+
+    def test_global_translator_is_shared(self):
+        from universal_integer_system import universal_translator
+        self.assertIs(universal_translator, uis.get_universal_translator())
+        self.assertEqual(universal_translator.translate_code(11), "active")
+
+    def test_translate_code(self):
+        translator = uis.get_universal_translator()
+        self.assertEqual(translator.translate_code(0), "unknown")
+        self.assertEqual(translator.translate_code(uis.BusinessEvent.ORDER_PLACED), "order.placed")
+        self.assertEqual(translator.translate_code(AppType.DISCORD_BOT), "discord.bot")
+        self.assertEqual(translator.translate_code(8), "unknown.code.8")
+        self.assertEqual(translator.translate_code(-5), "unknown.code.-5")
+        self.assertEqual(translator.translate_code(10**6), "unknown.code.1000000")
+
+    def test_translate_code_non_int(self):
+        translator = uis.get_universal_translator()
+        self.assertEqual(translator.translate_code(11.0), "active")
+        self.assertEqual(translator.translate_code(8.5), "unknown.code.8.5")
+        self.assertEqual(translator.translate_code(None), "unknown.code.None")
+        self.assertEqual(translator.translate_code("11"), "unknown.code.11")
+        self.assertEqual(translator.format_code_with_context(11.0), "11.0(active) [universal.status]")
+
+    def test_get_range_info(self):
+        translator = uis.get_universal_translator()
+        info = translator.get_range_info(0, 49)
+        expected = sum(1 for code in range(0, 50) if translator.is_valid_code(code))
+        self.assertEqual(info["defined"], expected)
+        self.assertEqual(info["total"], 50)
+        self.assertEqual(info["available"], 50 - expected)
+        self.assertEqual(translator.get_range_info(6006, 6019)["defined"], 0)
+
+    def test_find_codes_by_pattern(self):
+        translator = uis.get_universal_translator()
+        items = sorted(translator._translation_map.items())
+        for pattern in ("failed", "FAIL", "ail", "password.changed", "d.c", "",
+                        ".", "..", "a..b", "status.", ".status", "ord.placed"):
+            with self.subTest(pattern=pattern):
+                expected = [(code, name) for code, name in items if pattern.lower() in name]
+                self.assertEqual(translator.find_codes_by_pattern(pattern), expected)
+
+    def test_get_category(self):
+        translator = uis.get_universal_translator()
+        self.assertEqual(translator.get_category(0), "universal.status")
+        self.assertEqual(translator.get_category(49), "universal.status")
+        self.assertEqual(translator.get_category(50), "universal.priority")
+        self.assertEqual(translator.get_category(6150), "business.event")
+        self.assertEqual(translator.get_category(99999), "behavioral.prediction")
+        self.assertEqual(translator.get_category(-1), "unknown.category")
+
+    def test_format_code_with_context_matches_uncached(self):
+        translator = uis.get_universal_translator()
+        for code in (0, 11, 8, -5, 6150, uis.BusinessEvent.ORDER_PLACED, AppType.DISCORD_BOT, 10**6):
+            with self.subTest(code=code):
+                expected = f"{code}({translator.translate_code(code)}) [{translator.get_category(code)}]"
+                self.assertEqual(translator.format_code_with_context(code), expected)
+                self.assertEqual(translator.format_code_with_context(code), translator._build_context(code))
+
+    def test_public_methods_are_real_methods(self):
+        translator = uis.get_universal_translator()
+        for name in ("translate_code", "get_category", "format_code_with_context", "is_valid_code"):
+            with self.subTest(name=name):
+                self.assertNotIn(name, vars(translator))
+
+    def test_subclass_overrides_are_honoured(self):
+        class Shouting(uis.UniversalTranslator):
+            def get_category(self, code_in_category):
+                return super().get_category(code_in_category).upper()
+
+        translator = Shouting()
+        self.assertEqual(translator.format_code_with_context(11), "11(active) [UNIVERSAL.STATUS]")
+
+
+class TestNameOf(unittest.TestCase):
+    """Flat code -> member name lookup."""
+
+    def test_names_from_any_class(self):
+        self.assertEqual(uis.name_of(11), "ACTIVE")
+        self.assertEqual(uis.name_of(int(uis.BusinessEvent.ORDER_PLACED)), "ORDER_PLACED")
+        self.assertEqual(uis.name_of(AppType.LIFE_COACH), "LIFE_COACH")
+
+    def test_unknown_code(self):
+        with self.assertRaises(KeyError):
+            uis.name_of(99999)
+
+    def test_lookup_code(self):
+        self.assertEqual(uis.lookup_code(11), (uis.UniversalStatus, "ACTIVE"))
+        self.assertEqual(uis.lookup_code(AppType.DATA_SYNC), (AppType, "DATA_SYNC"))
+        self.assertIsNone(uis.lookup_code(99999))
+
+
+class TestInValidRange(unittest.TestCase):
+    """Per-class defined-code bitmaps."""
+
+    def test_defined_codes(self):
+        for item in uis.BusinessProcess:
+            self.assertTrue(uis.in_valid_range(uis.BusinessProcess, item.value))
+        self.assertTrue(uis.in_valid_range(AppType, AppType.DISCORD_BOT))
+
+    def test_reserved_and_foreign_codes(self):
+        self.assertFalse(uis.in_valid_range(uis.BusinessProcess, 6010))  # Reserved: 6006-6019
+        self.assertFalse(uis.in_valid_range(uis.BusinessProcess, 11))
+        self.assertFalse(uis.in_valid_range(uis.BusinessProcess, 99999))
+
+
+class TestMembersOf(unittest.TestCase):
+    """Cached member tuples."""
+
+    def test_members_cached(self):
+        members = uis.members_of(uis.UniversalPriority)
+        self.assertEqual(members, tuple(uis.UniversalPriority))
+        self.assertIs(members, uis.members_of(uis.UniversalPriority))
+
+    def test_code_table_members(self):
+        self.assertIn(AppType.LIFE_COACH, uis.members_of(AppType))
+
+
+class TestCythonDeclarations(unittest.TestCase):
+    """The checked-in .pxd must match the code classes."""
+
+    def test_pxd_is_up_to_date(self):
+        pxd = Path(__file__).parent / "universal_codes.pxd"
+        self.assertEqual(pxd.read_text(), uis.render_cython_declarations())
+
+
+class TestExportIntConstants(unittest.TestCase):
+    """Plain-int copies of code classes for numeric kernels."""
+
+    def test_exports_exact_ints(self):
+        namespace = {}
+        constants = uis.export_int_constants(uis.MetricType, namespace)
+        self.assertEqual(namespace["RESPONSE_TIME"], 7200)
+        self.assertIs(type(constants["RESPONSE_TIME"]), int)
+        self.assertEqual(len(constants), len(uis.MetricType))
+
+
+class TestDispatchOn(unittest.TestCase):
+    """Code -> handler routing built by dispatch_on."""
+
+    def test_routes_codes_to_handlers(self):
+        @uis.dispatch_on(uis.BusinessEvent)
+        class Handlers:
+            def handle_6120(self, payload):
+                return ("placed", payload)
+
+            def handle_default(self, code, payload):
+                return ("default", code)
+
+        handlers = Handlers()
+        self.assertEqual(handlers.dispatch(uis.BusinessEvent.ORDER_PLACED, 1), ("placed", 1))
+        self.assertEqual(handlers.dispatch(6121, 1), ("default", 6121))
+
+    def test_missing_handler_without_default(self):
+        @uis.dispatch_on(uis.BusinessEvent)
+        class Handlers:
+            def handle_6120(self):
+                return "placed"
+
+        with self.assertRaises(LookupError):
+            Handlers().dispatch(6121)
+
+    def test_rejects_codes_outside_class(self):
+        with self.assertRaises(ValueError):
+            @uis.dispatch_on(uis.BusinessEvent)
+            class Handlers:
+                def handle_11(self):
+                    pass
+
+
+class TestGetRanges(unittest.TestCase):
+    """CodeMigration._get_ranges run detection."""
+
+    def test_ranges(self):
+        cases = [
+            ([], []),
+            ([5], [(5, 5)]),
+            ([3, 1, 2, 7, 9, 8, 20], [(1, 3), (7, 9), (20, 20)]),
+        ]
+        for codes, expected in cases:
+            with self.subTest(codes=codes):
+                self.assertEqual(CodeMigration._get_ranges(codes), expected)
+
+    def test_migration_report(self):
+        report = CodeMigration.generate_migration_report()
+        self.assertEqual(report["total_mappings"], len(CodeMigration.OLD_TO_NEW_MAP))
+        self.assertEqual(report["old_ranges"], [(1250, 1251)])
+        self.assertEqual(report["new_ranges"], [(2000, 2001)])
+
+
+@unittest.skipUnless(numpy, "numpy not installed")
+class TestBulkMigrateArray(unittest.TestCase):
+    """Vectorized CodeMigration.bulk_migrate_array."""
+
+    def test_matches_bulk_migrate(self):
+        codes = [1250, 1251, 1252, 0, 2000, 1250]
+        result = CodeMigration.bulk_migrate_array(codes)
+        self.assertEqual(result.tolist(), CodeMigration.bulk_migrate(codes))
+
+    def test_empty_input(self):
+        self.assertEqual(CodeMigration.bulk_migrate_array([]).size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
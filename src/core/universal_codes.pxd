@@ -0,0 +1,1859 @@
+# Generated by universal_integer_system.render_cython_declarations () - do not edit
+# cimport these from Cython extensions to use the codes as plain C ints
+
+cdef enum UniversalStatus:
+    UniversalStatus_UNKNOWN = 0
+    UniversalStatus_INITIALIZING = 1
+    UniversalStatus_INITIALIZED = 2
+    UniversalStatus_PENDING = 3
+    UniversalStatus_QUEUED = 4
+    UniversalStatus_SCHEDULED = 5
+    UniversalStatus_PREPARING = 6
+    UniversalStatus_READY = 7
+    UniversalStatus_STARTING = 10
+    UniversalStatus_ACTIVE = 11
+    UniversalStatus_RUNNING = 12
+    UniversalStatus_PROCESSING = 13
+    UniversalStatus_EXECUTING = 14
+    UniversalStatus_IN_PROGRESS = 15
+    UniversalStatus_BUSY = 16
+    UniversalStatus_WORKING = 17
+    UniversalStatus_COMPLETING = 20
+    UniversalStatus_COMPLETED = 21
+    UniversalStatus_SUCCEEDED = 22
+    UniversalStatus_FINISHED = 23
+    UniversalStatus_DONE = 24
+    UniversalStatus_FINALIZED = 25
+    UniversalStatus_ARCHIVED = 26
+    UniversalStatus_WARNING = 30
+    UniversalStatus_ERROR = 31
+    UniversalStatus_FAILED = 32
+    UniversalStatus_CRASHED = 33
+    UniversalStatus_TIMEOUT = 34
+    UniversalStatus_CANCELLED = 35
+    UniversalStatus_REJECTED = 36
+    UniversalStatus_INVALID = 37
+    UniversalStatus_CORRUPTED = 38
+    UniversalStatus_PAUSED = 40
+    UniversalStatus_SUSPENDED = 41
+    UniversalStatus_BLOCKED = 42
+    UniversalStatus_WAITING = 43
+    UniversalStatus_DEFERRED = 44
+    UniversalStatus_ON_HOLD = 45
+    UniversalStatus_HIBERNATED = 46
+
+cdef enum UniversalPriority:
+    UniversalPriority_LOWEST = 50
+    UniversalPriority_LOW = 52
+    UniversalPriority_BELOW_NORMAL = 54
+    UniversalPriority_NORMAL = 56
+    UniversalPriority_ABOVE_NORMAL = 58
+    UniversalPriority_HIGH = 60
+    UniversalPriority_URGENT = 62
+    UniversalPriority_CRITICAL = 64
+    UniversalPriority_EMERGENCY = 66
+    UniversalPriority_SYSTEM = 68
+
+cdef enum UniversalSeverity:
+    UniversalSeverity_TRACE = 70
+    UniversalSeverity_DEBUG = 72
+    UniversalSeverity_VERBOSE = 74
+    UniversalSeverity_INFO = 76
+    UniversalSeverity_NOTICE = 78
+    UniversalSeverity_WARNING = 80
+    UniversalSeverity_ERROR = 82
+    UniversalSeverity_CRITICAL = 84
+    UniversalSeverity_ALERT = 86
+    UniversalSeverity_EMERGENCY = 88
+
+cdef enum UniversalResult:
+    UniversalResult_SUCCESS = 90
+    UniversalResult_PARTIAL_SUCCESS = 91
+    UniversalResult_FAILURE = 92
+    UniversalResult_RETRY = 93
+    UniversalResult_SKIP = 94
+    UniversalResult_ABORT = 95
+    UniversalResult_ROLLBACK = 96
+
+cdef enum SystemEvent:
+    SystemEvent_SYSTEM_STARTUP = 100
+    SystemEvent_SYSTEM_READY = 101
+    SystemEvent_SYSTEM_SHUTDOWN = 102
+    SystemEvent_SYSTEM_RESTART = 103
+    SystemEvent_SYSTEM_UPGRADE = 104
+    SystemEvent_SYSTEM_MAINTENANCE = 105
+    SystemEvent_SYSTEM_HEALTH_CHECK = 106
+    SystemEvent_SYSTEM_BACKUP = 107
+    SystemEvent_SYSTEM_RESTORE = 108
+    SystemEvent_COMPONENT_REGISTERED = 120
+    SystemEvent_COMPONENT_STARTED = 121
+    SystemEvent_COMPONENT_STOPPED = 122
+    SystemEvent_COMPONENT_FAILED = 123
+    SystemEvent_COMPONENT_RECOVERED = 124
+    SystemEvent_COMPONENT_UPDATED = 125
+    SystemEvent_COMPONENT_REMOVED = 126
+    SystemEvent_CONFIG_LOADED = 140
+    SystemEvent_CONFIG_CHANGED = 141
+    SystemEvent_CONFIG_VALIDATED = 142
+    SystemEvent_CONFIG_INVALID = 143
+    SystemEvent_CONFIG_RELOADED = 144
+    SystemEvent_FEATURE_ENABLED = 145
+    SystemEvent_FEATURE_DISABLED = 146
+    SystemEvent_RESOURCE_ALLOCATED = 160
+    SystemEvent_RESOURCE_RELEASED = 161
+    SystemEvent_RESOURCE_EXHAUSTED = 162
+    SystemEvent_RESOURCE_SCALED = 163
+    SystemEvent_MEMORY_PRESSURE = 164
+    SystemEvent_CPU_THROTTLED = 165
+    SystemEvent_DISK_FULL = 166
+
+cdef enum UserEvent:
+    UserEvent_USER_LOGIN = 200
+    UserEvent_USER_LOGOUT = 201
+    UserEvent_USER_REGISTER = 202
+    UserEvent_USER_VERIFIED = 203
+    UserEvent_USER_BLOCKED = 204
+    UserEvent_USER_UNBLOCKED = 205
+    UserEvent_PASSWORD_CHANGED = 206
+    UserEvent_PASSWORD_RESET = 207
+    UserEvent_TWO_FACTOR_ENABLED = 208
+    UserEvent_TWO_FACTOR_VERIFIED = 209
+    UserEvent_SESSION_STARTED = 220
+    UserEvent_SESSION_RESUMED = 221
+    UserEvent_SESSION_EXPIRED = 222
+    UserEvent_SESSION_TERMINATED = 223
+    UserEvent_SESSION_IDLE = 224
+    UserEvent_SESSION_ACTIVE = 225
+    UserEvent_USER_ACTION = 240
+    UserEvent_USER_CREATED = 241
+    UserEvent_USER_UPDATED = 242
+    UserEvent_USER_DELETED = 243
+    UserEvent_USER_SEARCHED = 244
+    UserEvent_USER_FILTERED = 245
+    UserEvent_USER_EXPORTED = 246
+    UserEvent_USER_IMPORTED = 247
+    UserEvent_USER_ACTIVATED = 260
+    UserEvent_USER_DEACTIVATED = 261
+    UserEvent_USER_SUSPENDED = 262
+    UserEvent_USER_ARCHIVED = 263
+    UserEvent_ROLE_ASSIGNED = 264
+    UserEvent_ROLE_REMOVED = 265
+    UserEvent_PERMISSION_GRANTED = 266
+    UserEvent_PERMISSION_REVOKED = 267
+
+cdef enum WorkflowEvent:
+    WorkflowEvent_WORKFLOW_CREATED = 300
+    WorkflowEvent_WORKFLOW_STARTED = 301
+    WorkflowEvent_WORKFLOW_PAUSED = 302
+    WorkflowEvent_WORKFLOW_RESUMED = 303
+    WorkflowEvent_WORKFLOW_COMPLETED = 304
+    WorkflowEvent_WORKFLOW_FAILED = 305
+    WorkflowEvent_WORKFLOW_CANCELLED = 306
+    WorkflowEvent_WORKFLOW_TIMEOUT = 307
+    WorkflowEvent_WORKFLOW_RETRY = 308
+    WorkflowEvent_TASK_CREATED = 320
+    WorkflowEvent_TASK_ASSIGNED = 321
+    WorkflowEvent_TASK_STARTED = 322
+    WorkflowEvent_TASK_PROGRESS = 323
+    WorkflowEvent_TASK_COMPLETED = 324
+    WorkflowEvent_TASK_FAILED = 325
+    WorkflowEvent_TASK_SKIPPED = 326
+    WorkflowEvent_TASK_DELEGATED = 327
+    WorkflowEvent_PROCESS_INITIATED = 340
+    WorkflowEvent_PROCESS_APPROVED = 341
+    WorkflowEvent_PROCESS_REJECTED = 342
+    WorkflowEvent_PROCESS_ESCALATED = 343
+    WorkflowEvent_PROCESS_AUTOMATED = 344
+    WorkflowEvent_STEP_COMPLETED = 345
+    WorkflowEvent_CHECKPOINT_REACHED = 346
+    WorkflowEvent_MILESTONE_ACHIEVED = 347
+    WorkflowEvent_DECISION_REQUIRED = 360
+    WorkflowEvent_DECISION_MADE = 361
+    WorkflowEvent_DECISION_DEFERRED = 362
+    WorkflowEvent_APPROVAL_REQUESTED = 363
+    WorkflowEvent_APPROVAL_GRANTED = 364
+    WorkflowEvent_APPROVAL_DENIED = 365
+    WorkflowEvent_CONDITION_MET = 366
+    WorkflowEvent_CONDITION_FAILED = 367
+
+cdef enum ErrorEvent:
+    ErrorEvent_ERROR_OCCURRED = 400
+    ErrorEvent_EXCEPTION_THROWN = 401
+    ErrorEvent_VALIDATION_ERROR = 402
+    ErrorEvent_BUSINESS_RULE_VIOLATION = 403
+    ErrorEvent_CONSTRAINT_VIOLATION = 404
+    ErrorEvent_DATA_INTEGRITY_ERROR = 405
+    ErrorEvent_CONCURRENCY_ERROR = 406
+    ErrorEvent_TIMEOUT_ERROR = 407
+    ErrorEvent_SYSTEM_ERROR = 420
+    ErrorEvent_SERVICE_UNAVAILABLE = 421
+    ErrorEvent_DEPENDENCY_ERROR = 422
+    ErrorEvent_NETWORK_ERROR = 423
+    ErrorEvent_DATABASE_ERROR = 424
+    ErrorEvent_FILE_SYSTEM_ERROR = 425
+    ErrorEvent_MEMORY_ERROR = 426
+    ErrorEvent_HARDWARE_ERROR = 427
+    ErrorEvent_APPLICATION_ERROR = 440
+    ErrorEvent_LOGIC_ERROR = 441
+    ErrorEvent_STATE_ERROR = 442
+    ErrorEvent_CONFIGURATION_ERROR = 443
+    ErrorEvent_PERMISSION_ERROR = 444
+    ErrorEvent_AUTHENTICATION_ERROR = 445
+    ErrorEvent_RATE_LIMIT_ERROR = 446
+    ErrorEvent_QUOTA_EXCEEDED_ERROR = 447
+    ErrorEvent_ERROR_HANDLED = 460
+    ErrorEvent_ERROR_LOGGED = 461
+    ErrorEvent_ERROR_REPORTED = 462
+    ErrorEvent_RECOVERY_ATTEMPTED = 463
+    ErrorEvent_RECOVERY_SUCCEEDED = 464
+    ErrorEvent_RECOVERY_FAILED = 465
+    ErrorEvent_FALLBACK_ACTIVATED = 466
+    ErrorEvent_CIRCUIT_BREAKER_OPEN = 467
+    ErrorEvent_CIRCUIT_BREAKER_CLOSED = 468
+
+cdef enum CommunicationEvent:
+    CommunicationEvent_MESSAGE_SENT = 500
+    CommunicationEvent_MESSAGE_RECEIVED = 501
+    CommunicationEvent_MESSAGE_PROCESSED = 502
+    CommunicationEvent_MESSAGE_FAILED = 503
+    CommunicationEvent_MESSAGE_RETRY = 504
+    CommunicationEvent_MESSAGE_EXPIRED = 505
+    CommunicationEvent_MESSAGE_ACKNOWLEDGED = 506
+    CommunicationEvent_MESSAGE_REJECTED = 507
+    CommunicationEvent_REQUEST_SENT = 520
+    CommunicationEvent_REQUEST_RECEIVED = 521
+    CommunicationEvent_RESPONSE_SENT = 522
+    CommunicationEvent_RESPONSE_RECEIVED = 523
+    CommunicationEvent_REQUEST_TIMEOUT = 524
+    CommunicationEvent_REQUEST_CANCELLED = 525
+    CommunicationEvent_RESPONSE_CACHED = 526
+    CommunicationEvent_CACHE_HIT = 527
+    CommunicationEvent_CACHE_MISS = 528
+    CommunicationEvent_STREAM_STARTED = 540
+    CommunicationEvent_STREAM_DATA = 541
+    CommunicationEvent_STREAM_PAUSED = 542
+    CommunicationEvent_STREAM_RESUMED = 543
+    CommunicationEvent_STREAM_ENDED = 544
+    CommunicationEvent_STREAM_ERROR = 545
+    CommunicationEvent_BUFFER_FULL = 546
+    CommunicationEvent_BUFFER_EMPTY = 547
+    CommunicationEvent_CONNECTION_ESTABLISHED = 560
+    CommunicationEvent_CONNECTION_LOST = 561
+    CommunicationEvent_CONNECTION_RESTORED = 562
+    CommunicationEvent_HANDSHAKE_STARTED = 563
+    CommunicationEvent_HANDSHAKE_COMPLETED = 564
+    CommunicationEvent_HANDSHAKE_FAILED = 565
+    CommunicationEvent_PROTOCOL_ERROR = 566
+    CommunicationEvent_PROTOCOL_UPGRADED = 567
+
+cdef enum StateChangeEvent:
+    StateChangeEvent_STATE_CREATED = 600
+    StateChangeEvent_STATE_INITIALIZED = 601
+    StateChangeEvent_STATE_ACTIVATED = 602
+    StateChangeEvent_STATE_DEACTIVATED = 603
+    StateChangeEvent_STATE_UPDATED = 604
+    StateChangeEvent_STATE_DELETED = 605
+    StateChangeEvent_STATE_ARCHIVED = 606
+    StateChangeEvent_STATE_RESTORED = 607
+    StateChangeEvent_STATE_TRANSITION_START = 620
+    StateChangeEvent_STATE_TRANSITION_COMPLETE = 621
+    StateChangeEvent_STATE_TRANSITION_FAILED = 622
+    StateChangeEvent_STATE_VALIDATED = 623
+    StateChangeEvent_STATE_INVALID = 624
+    StateChangeEvent_STATE_LOCKED = 625
+    StateChangeEvent_STATE_UNLOCKED = 626
+    StateChangeEvent_STATE_ROLLED_BACK = 627
+    StateChangeEvent_STATE_SAVED = 640
+    StateChangeEvent_STATE_LOADED = 641
+    StateChangeEvent_STATE_CACHED = 642
+    StateChangeEvent_STATE_FLUSHED = 643
+    StateChangeEvent_STATE_SYNCHRONIZED = 644
+    StateChangeEvent_STATE_REPLICATED = 645
+    StateChangeEvent_STATE_BACKED_UP = 646
+    StateChangeEvent_CHECKPOINT_CREATED = 647
+    StateChangeEvent_STATE_CONSISTENT = 660
+    StateChangeEvent_STATE_INCONSISTENT = 661
+    StateChangeEvent_STATE_CONVERGED = 662
+    StateChangeEvent_STATE_DIVERGED = 663
+    StateChangeEvent_CONFLICT_DETECTED = 664
+    StateChangeEvent_CONFLICT_RESOLVED = 665
+    StateChangeEvent_MERGE_COMPLETED = 666
+    StateChangeEvent_SPLIT_COMPLETED = 667
+
+cdef enum IntegrationEvent:
+    IntegrationEvent_API_CALL_STARTED = 700
+    IntegrationEvent_API_CALL_COMPLETED = 701
+    IntegrationEvent_API_CALL_FAILED = 702
+    IntegrationEvent_API_RATE_LIMITED = 703
+    IntegrationEvent_API_AUTHENTICATED = 704
+    IntegrationEvent_API_UNAUTHORIZED = 705
+    IntegrationEvent_WEBHOOK_RECEIVED = 706
+    IntegrationEvent_WEBHOOK_PROCESSED = 707
+    IntegrationEvent_SYNC_STARTED = 720
+    IntegrationEvent_SYNC_PROGRESS = 721
+    IntegrationEvent_SYNC_COMPLETED = 722
+    IntegrationEvent_SYNC_FAILED = 723
+    IntegrationEvent_DATA_IMPORTED = 724
+    IntegrationEvent_DATA_EXPORTED = 725
+    IntegrationEvent_BATCH_PROCESSED = 726
+    IntegrationEvent_RECORD_SYNCED = 727
+    IntegrationEvent_INTEGRATION_CONNECTED = 740
+    IntegrationEvent_INTEGRATION_DISCONNECTED = 741
+    IntegrationEvent_INTEGRATION_HEALTHY = 742
+    IntegrationEvent_INTEGRATION_DEGRADED = 743
+    IntegrationEvent_INTEGRATION_FAILED = 744
+    IntegrationEvent_CREDENTIALS_UPDATED = 745
+    IntegrationEvent_TOKEN_REFRESHED = 746
+    IntegrationEvent_CERTIFICATE_RENEWED = 747
+    IntegrationEvent_DATA_TRANSFORMED = 760
+    IntegrationEvent_SCHEMA_MAPPED = 761
+    IntegrationEvent_FORMAT_CONVERTED = 762
+    IntegrationEvent_VALIDATION_PASSED = 763
+    IntegrationEvent_VALIDATION_FAILED = 764
+    IntegrationEvent_ENRICHMENT_APPLIED = 765
+    IntegrationEvent_FILTER_APPLIED = 766
+    IntegrationEvent_AGGREGATION_COMPLETED = 767
+
+cdef enum SystemMetadataEvent:
+    SystemMetadataEvent_METRIC_RECORDED = 900
+    SystemMetadataEvent_METRIC_AGGREGATED = 901
+    SystemMetadataEvent_THRESHOLD_EXCEEDED = 902
+    SystemMetadataEvent_THRESHOLD_NORMAL = 903
+    SystemMetadataEvent_ANOMALY_DETECTED = 904
+    SystemMetadataEvent_TREND_IDENTIFIED = 905
+    SystemMetadataEvent_AUDIT_LOG_CREATED = 920
+    SystemMetadataEvent_COMPLIANCE_CHECK = 921
+    SystemMetadataEvent_POLICY_VIOLATION = 922
+    SystemMetadataEvent_ACCESS_LOGGED = 923
+    SystemMetadataEvent_CHANGE_TRACKED = 924
+    SystemMetadataEvent_HEALTH_CHECK_PASSED = 940
+    SystemMetadataEvent_HEALTH_CHECK_FAILED = 941
+    SystemMetadataEvent_ALERT_TRIGGERED = 942
+    SystemMetadataEvent_ALERT_RESOLVED = 943
+    SystemMetadataEvent_PROBE_SUCCEEDED = 944
+    SystemMetadataEvent_PROBE_FAILED = 945
+    SystemMetadataEvent_GARBAGE_COLLECTED = 960
+    SystemMetadataEvent_CACHE_CLEARED = 961
+    SystemMetadataEvent_INDEX_REBUILT = 962
+    SystemMetadataEvent_STATISTICS_UPDATED = 963
+    SystemMetadataEvent_MAINTENANCE_COMPLETED = 964
+
+cdef enum UserRole:
+    UserRole_ANONYMOUS = 1000
+    UserRole_GUEST = 1001
+    UserRole_USER = 1002
+    UserRole_MEMBER = 1003
+    UserRole_SUBSCRIBER = 1004
+    UserRole_CONTRIBUTOR = 1005
+    UserRole_MODERATOR = 1006
+    UserRole_ADMINISTRATOR = 1007
+    UserRole_SUPER_ADMIN = 1008
+    UserRole_SYSTEM = 1009
+    UserRole_EMPLOYEE = 1020
+    UserRole_MANAGER = 1021
+    UserRole_DIRECTOR = 1022
+    UserRole_EXECUTIVE = 1023
+    UserRole_OWNER = 1024
+    UserRole_PARTNER = 1025
+    UserRole_CONTRACTOR = 1026
+    UserRole_VENDOR = 1027
+    UserRole_CLIENT = 1028
+    UserRole_DEVELOPER = 1040
+    UserRole_TESTER = 1041
+    UserRole_ANALYST = 1042
+    UserRole_DESIGNER = 1043
+    UserRole_ARCHITECT = 1044
+    UserRole_OPERATOR = 1045
+    UserRole_SUPPORT = 1046
+    UserRole_AUDITOR = 1047
+    UserRole_COMPLIANCE = 1048
+    UserRole_SERVICE_ACCOUNT = 1060
+    UserRole_API_CLIENT = 1061
+    UserRole_INTEGRATION = 1062
+    UserRole_SCHEDULER = 1063
+    UserRole_MONITOR = 1064
+    UserRole_BACKUP_SERVICE = 1065
+    UserRole_MIGRATION_SERVICE = 1066
+
+cdef enum Permission:
+    Permission_CREATE = 1100
+    Permission_READ = 1101
+    Permission_UPDATE = 1102
+    Permission_DELETE = 1103
+    Permission_LIST = 1104
+    Permission_SEARCH = 1105
+    Permission_FILTER = 1106
+    Permission_EXPORT = 1107
+    Permission_IMPORT = 1108
+    Permission_EXECUTE = 1120
+    Permission_APPROVE = 1121
+    Permission_REJECT = 1122
+    Permission_PUBLISH = 1123
+    Permission_UNPUBLISH = 1124
+    Permission_ARCHIVE = 1125
+    Permission_RESTORE = 1126
+    Permission_SHARE = 1127
+    Permission_TRANSFER = 1128
+    Permission_ADMIN_ACCESS = 1140
+    Permission_CONFIG_MANAGE = 1141
+    Permission_USER_MANAGE = 1142
+    Permission_ROLE_MANAGE = 1143
+    Permission_AUDIT_VIEW = 1144
+    Permission_SYSTEM_MONITOR = 1145
+    Permission_BACKUP_MANAGE = 1146
+    Permission_API_MANAGE = 1147
+    Permission_RESOURCE_ALLOCATE = 1160
+    Permission_RESOURCE_DEALLOCATE = 1161
+    Permission_QUOTA_MANAGE = 1162
+    Permission_LIMIT_OVERRIDE = 1163
+    Permission_PRIORITY_ACCESS = 1164
+    Permission_EXCLUSIVE_ACCESS = 1165
+
+cdef enum AuthenticationMethod:
+    AuthenticationMethod_PASSWORD = 1200
+    AuthenticationMethod_PIN = 1201
+    AuthenticationMethod_BIOMETRIC = 1202
+    AuthenticationMethod_TWO_FACTOR = 1203
+    AuthenticationMethod_MULTI_FACTOR = 1204
+    AuthenticationMethod_PASSWORDLESS = 1205
+    AuthenticationMethod_MAGIC_LINK = 1206
+    AuthenticationMethod_SESSION_TOKEN = 1220
+    AuthenticationMethod_JWT = 1221
+    AuthenticationMethod_OAUTH2 = 1222
+    AuthenticationMethod_API_KEY = 1223
+    AuthenticationMethod_BEARER_TOKEN = 1224
+    AuthenticationMethod_REFRESH_TOKEN = 1225
+    AuthenticationMethod_ACCESS_TOKEN = 1226
+    AuthenticationMethod_GOOGLE = 1240
+    AuthenticationMethod_FACEBOOK = 1241
+    AuthenticationMethod_GITHUB = 1242
+    AuthenticationMethod_MICROSOFT = 1243
+    AuthenticationMethod_APPLE = 1244
+    AuthenticationMethod_TWITTER = 1245
+    AuthenticationMethod_LINKEDIN = 1246
+    AuthenticationMethod_SAML = 1247
+    AuthenticationMethod_LDAP = 1248
+    AuthenticationMethod_ACTIVE_DIRECTORY = 1249
+    AuthenticationMethod_CERTIFICATE = 1260
+    AuthenticationMethod_SMART_CARD = 1261
+    AuthenticationMethod_HARDWARE_TOKEN = 1262
+    AuthenticationMethod_BLOCKCHAIN = 1263
+    AuthenticationMethod_WEBAUTHN = 1264
+    AuthenticationMethod_FIDO2 = 1265
+
+cdef enum AuthenticationEvent:
+    AuthenticationEvent_LOGIN_ATTEMPTED = 1300
+    AuthenticationEvent_LOGIN_SUCCEEDED = 1301
+    AuthenticationEvent_LOGIN_FAILED = 1302
+    AuthenticationEvent_LOGIN_BLOCKED = 1303
+    AuthenticationEvent_LOGIN_RATE_LIMITED = 1304
+    AuthenticationEvent_LOGOUT_INITIATED = 1305
+    AuthenticationEvent_LOGOUT_COMPLETED = 1306
+    AuthenticationEvent_TOKEN_ISSUED = 1320
+    AuthenticationEvent_TOKEN_VALIDATED = 1321
+    AuthenticationEvent_TOKEN_REFRESHED = 1322
+    AuthenticationEvent_TOKEN_EXPIRED = 1323
+    AuthenticationEvent_TOKEN_REVOKED = 1324
+    AuthenticationEvent_TOKEN_BLACKLISTED = 1325
+    AuthenticationEvent_PASSWORD_RESET_REQUESTED = 1340
+    AuthenticationEvent_PASSWORD_RESET_COMPLETED = 1341
+    AuthenticationEvent_PASSWORD_CHANGED = 1342
+    AuthenticationEvent_ACCOUNT_LOCKED = 1343
+    AuthenticationEvent_ACCOUNT_UNLOCKED = 1344
+    AuthenticationEvent_SUSPICIOUS_ACTIVITY = 1345
+    AuthenticationEvent_BRUTE_FORCE_DETECTED = 1346
+    AuthenticationEvent_MFA_CHALLENGED = 1360
+    AuthenticationEvent_MFA_VERIFIED = 1361
+    AuthenticationEvent_MFA_FAILED = 1362
+    AuthenticationEvent_MFA_ENABLED = 1363
+    AuthenticationEvent_MFA_DISABLED = 1364
+    AuthenticationEvent_MFA_METHOD_ADDED = 1365
+    AuthenticationEvent_MFA_METHOD_REMOVED = 1366
+
+cdef enum AuthorizationEvent:
+    AuthorizationEvent_ACCESS_GRANTED = 1400
+    AuthorizationEvent_ACCESS_DENIED = 1401
+    AuthorizationEvent_ACCESS_REVOKED = 1402
+    AuthorizationEvent_ACCESS_EXPIRED = 1403
+    AuthorizationEvent_PERMISSION_CHECK = 1404
+    AuthorizationEvent_ROLE_CHECK = 1405
+    AuthorizationEvent_POLICY_EVALUATED = 1406
+    AuthorizationEvent_ROLE_CREATED = 1420
+    AuthorizationEvent_ROLE_ASSIGNED = 1421
+    AuthorizationEvent_ROLE_REMOVED = 1422
+    AuthorizationEvent_ROLE_UPDATED = 1423
+    AuthorizationEvent_ROLE_DELETED = 1424
+    AuthorizationEvent_ROLE_INHERITED = 1425
+    AuthorizationEvent_ROLE_HIERARCHY_CHANGED = 1426
+    AuthorizationEvent_PERMISSION_GRANTED = 1440
+    AuthorizationEvent_PERMISSION_REVOKED = 1441
+    AuthorizationEvent_PERMISSION_UPDATED = 1442
+    AuthorizationEvent_PERMISSION_INHERITED = 1443
+    AuthorizationEvent_PERMISSION_OVERRIDDEN = 1444
+    AuthorizationEvent_PERMISSION_DELEGATED = 1445
+    AuthorizationEvent_POLICY_CREATED = 1460
+    AuthorizationEvent_POLICY_UPDATED = 1461
+    AuthorizationEvent_POLICY_DELETED = 1462
+    AuthorizationEvent_POLICY_ATTACHED = 1463
+    AuthorizationEvent_POLICY_DETACHED = 1464
+    AuthorizationEvent_POLICY_VIOLATION = 1465
+    AuthorizationEvent_POLICY_ENFORCED = 1466
+
+cdef enum SessionEvent:
+    SessionEvent_SESSION_CREATED = 1600
+    SessionEvent_SESSION_VALIDATED = 1601
+    SessionEvent_SESSION_INVALIDATED = 1602
+    SessionEvent_SESSION_EXPIRED = 1603
+    SessionEvent_SESSION_EXTENDED = 1604
+    SessionEvent_SESSION_TERMINATED = 1605
+    SessionEvent_SESSION_HIJACKED = 1606
+    SessionEvent_SESSION_ACTIVE = 1620
+    SessionEvent_SESSION_IDLE = 1621
+    SessionEvent_SESSION_LOCKED = 1622
+    SessionEvent_SESSION_UNLOCKED = 1623
+    SessionEvent_SESSION_MIGRATED = 1624
+    SessionEvent_SESSION_REPLICATED = 1625
+    SessionEvent_SESSION_DATA_STORED = 1640
+    SessionEvent_SESSION_DATA_RETRIEVED = 1641
+    SessionEvent_SESSION_DATA_UPDATED = 1642
+    SessionEvent_SESSION_DATA_DELETED = 1643
+    SessionEvent_SESSION_DATA_ENCRYPTED = 1644
+    SessionEvent_SESSION_DATA_DECRYPTED = 1645
+
+cdef enum SecurityEvent:
+    SecurityEvent_THREAT_DETECTED = 1800
+    SecurityEvent_ATTACK_DETECTED = 1801
+    SecurityEvent_INTRUSION_DETECTED = 1802
+    SecurityEvent_MALWARE_DETECTED = 1803
+    SecurityEvent_PHISHING_DETECTED = 1804
+    SecurityEvent_SQL_INJECTION_DETECTED = 1805
+    SecurityEvent_XSS_DETECTED = 1806
+    SecurityEvent_CSRF_DETECTED = 1807
+    SecurityEvent_THREAT_BLOCKED = 1820
+    SecurityEvent_IP_BLACKLISTED = 1821
+    SecurityEvent_IP_WHITELISTED = 1822
+    SecurityEvent_FIREWALL_RULE_ADDED = 1823
+    SecurityEvent_FIREWALL_RULE_REMOVED = 1824
+    SecurityEvent_SECURITY_ALERT = 1825
+    SecurityEvent_INCIDENT_CREATED = 1826
+    SecurityEvent_INCIDENT_RESOLVED = 1827
+    SecurityEvent_DATA_ENCRYPTED = 1840
+    SecurityEvent_DATA_DECRYPTED = 1841
+    SecurityEvent_KEY_GENERATED = 1842
+    SecurityEvent_KEY_ROTATED = 1843
+    SecurityEvent_KEY_EXPIRED = 1844
+    SecurityEvent_KEY_REVOKED = 1845
+    SecurityEvent_CERTIFICATE_ISSUED = 1846
+    SecurityEvent_CERTIFICATE_EXPIRED = 1847
+    SecurityEvent_CERTIFICATE_RENEWED = 1848
+    SecurityEvent_COMPLIANCE_CHECK_PASSED = 1860
+    SecurityEvent_COMPLIANCE_CHECK_FAILED = 1861
+    SecurityEvent_AUDIT_TRAIL_CREATED = 1862
+    SecurityEvent_DATA_RETENTION_APPLIED = 1863
+    SecurityEvent_DATA_PURGED = 1864
+    SecurityEvent_GDPR_REQUEST = 1865
+    SecurityEvent_PRIVACY_VIOLATION = 1866
+
+cdef enum ContainerType:
+    ContainerType_WEB_SERVER = 2000
+    ContainerType_APP_SERVER = 2001
+    ContainerType_API_GATEWAY = 2002
+    ContainerType_LOAD_BALANCER = 2003
+    ContainerType_REVERSE_PROXY = 2004
+    ContainerType_CDN_NODE = 2005
+    ContainerType_EDGE_SERVER = 2006
+    ContainerType_DATABASE_PRIMARY = 2020
+    ContainerType_DATABASE_REPLICA = 2021
+    ContainerType_DATABASE_CACHE = 2022
+    ContainerType_DATABASE_SHARD = 2023
+    ContainerType_DATABASE_PROXY = 2024
+    ContainerType_MESSAGE_BROKER = 2040
+    ContainerType_QUEUE_WORKER = 2041
+    ContainerType_EVENT_BUS = 2042
+    ContainerType_STREAM_PROCESSOR = 2043
+    ContainerType_METRICS_COLLECTOR = 2060
+    ContainerType_LOG_AGGREGATOR = 2061
+    ContainerType_TRACE_COLLECTOR = 2062
+    ContainerType_HEALTH_MONITOR = 2063
+    ContainerType_ALERT_MANAGER = 2064
+    ContainerType_FIREWALL = 2080
+    ContainerType_IDS = 2081
+    ContainerType_IPS = 2082
+    ContainerType_WAF = 2083
+    ContainerType_SECURITY_SCANNER = 2084
+    ContainerType_FILE_STORAGE = 2100
+    ContainerType_OBJECT_STORAGE = 2101
+    ContainerType_BLOCK_STORAGE = 2102
+    ContainerType_BACKUP_STORAGE = 2103
+    ContainerType_COMPUTE_NODE = 2120
+    ContainerType_BATCH_PROCESSOR = 2121
+    ContainerType_JOB_SCHEDULER = 2122
+    ContainerType_TASK_RUNNER = 2123
+    ContainerType_NETWORK_ROUTER = 2140
+    ContainerType_VPN_GATEWAY = 2141
+    ContainerType_NAT_GATEWAY = 2142
+    ContainerType_DNS_SERVER = 2143
+    ContainerType_DHCP_SERVER = 2144
+
+cdef enum ContainerLifecycle:
+    ContainerLifecycle_CONTAINER_REQUESTED = 2200
+    ContainerLifecycle_CONTAINER_PROVISIONING = 2201
+    ContainerLifecycle_CONTAINER_CREATED = 2202
+    ContainerLifecycle_CONTAINER_CONFIGURED = 2203
+    ContainerLifecycle_CONTAINER_INITIALIZING = 2204
+    ContainerLifecycle_CONTAINER_INITIALIZED = 2205
+    ContainerLifecycle_CONTAINER_STARTING = 2220
+    ContainerLifecycle_CONTAINER_STARTED = 2221
+    ContainerLifecycle_CONTAINER_READY = 2222
+    ContainerLifecycle_CONTAINER_HEALTHY = 2223
+    ContainerLifecycle_CONTAINER_UNHEALTHY = 2224
+    ContainerLifecycle_CONTAINER_DEGRADED = 2225
+    ContainerLifecycle_CONTAINER_UPDATING = 2240
+    ContainerLifecycle_CONTAINER_DRAINING = 2241
+    ContainerLifecycle_CONTAINER_PAUSED = 2242
+    ContainerLifecycle_CONTAINER_SUSPENDED = 2243
+    ContainerLifecycle_CONTAINER_HIBERNATING = 2244
+    ContainerLifecycle_CONTAINER_MAINTENANCE = 2245
+    ContainerLifecycle_CONTAINER_STOPPING = 2260
+    ContainerLifecycle_CONTAINER_STOPPED = 2261
+    ContainerLifecycle_CONTAINER_TERMINATING = 2262
+    ContainerLifecycle_CONTAINER_TERMINATED = 2263
+    ContainerLifecycle_CONTAINER_FAILED = 2264
+    ContainerLifecycle_CONTAINER_CRASHED = 2265
+
+cdef enum ContainerOrchestration:
+    ContainerOrchestration_CONTAINER_SCHEDULED = 2300
+    ContainerOrchestration_CONTAINER_RESCHEDULED = 2301
+    ContainerOrchestration_CONTAINER_ASSIGNED = 2302
+    ContainerOrchestration_CONTAINER_EVICTED = 2303
+    ContainerOrchestration_PLACEMENT_CONSTRAINT_MET = 2304
+    ContainerOrchestration_PLACEMENT_CONSTRAINT_FAILED = 2305
+    ContainerOrchestration_SCALE_UP_INITIATED = 2320
+    ContainerOrchestration_SCALE_DOWN_INITIATED = 2321
+    ContainerOrchestration_REPLICA_ADDED = 2322
+    ContainerOrchestration_REPLICA_REMOVED = 2323
+    ContainerOrchestration_AUTO_SCALE_TRIGGERED = 2324
+    ContainerOrchestration_SCALE_LIMIT_REACHED = 2325
+    ContainerOrchestration_LOAD_BALANCED = 2340
+    ContainerOrchestration_BACKEND_ADDED = 2341
+    ContainerOrchestration_BACKEND_REMOVED = 2342
+    ContainerOrchestration_HEALTH_CHECK_PASSED = 2343
+    ContainerOrchestration_HEALTH_CHECK_FAILED = 2344
+    ContainerOrchestration_CIRCUIT_BREAKER_OPEN = 2345
+    ContainerOrchestration_CIRCUIT_BREAKER_CLOSED = 2346
+    ContainerOrchestration_SERVICE_REGISTERED = 2360
+    ContainerOrchestration_SERVICE_DEREGISTERED = 2361
+    ContainerOrchestration_SERVICE_DISCOVERED = 2362
+    ContainerOrchestration_ENDPOINT_ADDED = 2363
+    ContainerOrchestration_ENDPOINT_REMOVED = 2364
+    ContainerOrchestration_DNS_UPDATED = 2365
+
+cdef enum ContainerResource:
+    ContainerResource_CPU_ALLOCATED = 2400
+    ContainerResource_CPU_LIMIT_SET = 2401
+    ContainerResource_CPU_THROTTLED = 2402
+    ContainerResource_CPU_BURST = 2403
+    ContainerResource_CPU_QUOTA_EXCEEDED = 2404
+    ContainerResource_MEMORY_ALLOCATED = 2420
+    ContainerResource_MEMORY_LIMIT_SET = 2421
+    ContainerResource_MEMORY_PRESSURE = 2422
+    ContainerResource_MEMORY_OOM = 2423
+    ContainerResource_MEMORY_SWAP_ENABLED = 2424
+    ContainerResource_STORAGE_ALLOCATED = 2440
+    ContainerResource_STORAGE_MOUNTED = 2441
+    ContainerResource_STORAGE_UNMOUNTED = 2442
+    ContainerResource_STORAGE_FULL = 2443
+    ContainerResource_STORAGE_EXPANDED = 2444
+    ContainerResource_NETWORK_ATTACHED = 2460
+    ContainerResource_NETWORK_DETACHED = 2461
+    ContainerResource_BANDWIDTH_ALLOCATED = 2462
+    ContainerResource_BANDWIDTH_THROTTLED = 2463
+    ContainerResource_PORT_ALLOCATED = 2464
+    ContainerResource_PORT_RELEASED = 2465
+
+cdef enum ContainerManagement:
+    ContainerManagement_DEPLOYMENT_STARTED = 2500
+    ContainerManagement_DEPLOYMENT_PROGRESS = 2501
+    ContainerManagement_DEPLOYMENT_COMPLETED = 2502
+    ContainerManagement_DEPLOYMENT_FAILED = 2503
+    ContainerManagement_DEPLOYMENT_ROLLED_BACK = 2504
+    ContainerManagement_BLUE_GREEN_SWITCH = 2505
+    ContainerManagement_CANARY_DEPLOYED = 2506
+    ContainerManagement_UPDATE_STARTED = 2520
+    ContainerManagement_UPDATE_DOWNLOADING = 2521
+    ContainerManagement_UPDATE_APPLYING = 2522
+    ContainerManagement_UPDATE_COMPLETED = 2523
+    ContainerManagement_UPDATE_FAILED = 2524
+    ContainerManagement_ROLLBACK_INITIATED = 2525
+    ContainerManagement_ROLLBACK_COMPLETED = 2526
+    ContainerManagement_BACKUP_STARTED = 2540
+    ContainerManagement_BACKUP_COMPLETED = 2541
+    ContainerManagement_BACKUP_FAILED = 2542
+    ContainerManagement_RESTORE_STARTED = 2543
+    ContainerManagement_RESTORE_COMPLETED = 2544
+    ContainerManagement_RESTORE_FAILED = 2545
+    ContainerManagement_SNAPSHOT_CREATED = 2546
+    ContainerManagement_SNAPSHOT_DELETED = 2547
+    ContainerManagement_MIGRATION_STARTED = 2560
+    ContainerManagement_MIGRATION_PROGRESS = 2561
+    ContainerManagement_MIGRATION_COMPLETED = 2562
+    ContainerManagement_MIGRATION_FAILED = 2563
+    ContainerManagement_DATA_SYNC_STARTED = 2564
+    ContainerManagement_DATA_SYNC_COMPLETED = 2565
+
+cdef enum InfrastructureComponent:
+    InfrastructureComponent_PHYSICAL_SERVER = 3000
+    InfrastructureComponent_VIRTUAL_MACHINE = 3001
+    InfrastructureComponent_CONTAINER_HOST = 3002
+    InfrastructureComponent_KUBERNETES_NODE = 3003
+    InfrastructureComponent_COMPUTE_CLUSTER = 3004
+    InfrastructureComponent_NETWORK_SWITCH = 3020
+    InfrastructureComponent_NETWORK_ROUTER = 3021
+    InfrastructureComponent_FIREWALL_DEVICE = 3022
+    InfrastructureComponent_LOAD_BALANCER_DEVICE = 3023
+    InfrastructureComponent_VPN_CONCENTRATOR = 3024
+    InfrastructureComponent_SAN = 3040
+    InfrastructureComponent_NAS = 3041
+    InfrastructureComponent_STORAGE_ARRAY = 3042
+    InfrastructureComponent_BACKUP_DEVICE = 3043
+    InfrastructureComponent_TAPE_LIBRARY = 3044
+    InfrastructureComponent_KUBERNETES_MASTER = 3060
+    InfrastructureComponent_ETCD_CLUSTER = 3061
+    InfrastructureComponent_CONTAINER_REGISTRY = 3062
+    InfrastructureComponent_ARTIFACT_REPOSITORY = 3063
+    InfrastructureComponent_CI_CD_SERVER = 3064
+
+cdef enum DeploymentType:
+    DeploymentType_ROLLING_UPDATE = 3500
+    DeploymentType_BLUE_GREEN = 3501
+    DeploymentType_CANARY = 3502
+    DeploymentType_FEATURE_FLAG = 3503
+    DeploymentType_A_B_TESTING = 3504
+    DeploymentType_SHADOW = 3505
+    DeploymentType_DEVELOPMENT = 3520
+    DeploymentType_TESTING = 3521
+    DeploymentType_STAGING = 3522
+    DeploymentType_PRODUCTION = 3523
+    DeploymentType_DISASTER_RECOVERY = 3524
+    DeploymentType_DEMO = 3525
+    DeploymentType_SANDBOX = 3526
+    DeploymentType_ON_PREMISE = 3540
+    DeploymentType_CLOUD = 3541
+    DeploymentType_HYBRID = 3542
+    DeploymentType_EDGE = 3543
+    DeploymentType_MOBILE = 3544
+    DeploymentType_IOT = 3545
+    DeploymentType_AWS = 3560
+    DeploymentType_AZURE = 3561
+    DeploymentType_GCP = 3562
+    DeploymentType_ALIBABA = 3563
+    DeploymentType_IBM_CLOUD = 3564
+    DeploymentType_ORACLE_CLOUD = 3565
+    DeploymentType_DIGITAL_OCEAN = 3566
+
+cdef enum DatabaseType:
+    DatabaseType_POSTGRESQL = 4000
+    DatabaseType_MYSQL = 4001
+    DatabaseType_MARIADB = 4002
+    DatabaseType_ORACLE = 4003
+    DatabaseType_SQL_SERVER = 4004
+    DatabaseType_SQLITE = 4005
+    DatabaseType_MONGODB = 4020
+    DatabaseType_CASSANDRA = 4021
+    DatabaseType_DYNAMODB = 4022
+    DatabaseType_COUCHDB = 4023
+    DatabaseType_REDIS = 4024
+    DatabaseType_ELASTICSEARCH = 4025
+    DatabaseType_TIMESERIES_DB = 4040
+    DatabaseType_GRAPH_DB = 4041
+    DatabaseType_VECTOR_DB = 4042
+    DatabaseType_DOCUMENT_DB = 4043
+    DatabaseType_KEY_VALUE_DB = 4044
+    DatabaseType_OBJECT_DB = 4045
+    DatabaseType_SNOWFLAKE = 4060
+    DatabaseType_REDSHIFT = 4061
+    DatabaseType_BIGQUERY = 4062
+    DatabaseType_SYNAPSE = 4063
+    DatabaseType_CLICKHOUSE = 4064
+
+cdef enum DatabaseOperation:
+    DatabaseOperation_DB_CONNECT = 4100
+    DatabaseOperation_DB_DISCONNECT = 4101
+    DatabaseOperation_DB_QUERY = 4102
+    DatabaseOperation_DB_INSERT = 4103
+    DatabaseOperation_DB_UPDATE = 4104
+    DatabaseOperation_DB_DELETE = 4105
+    DatabaseOperation_DB_TRANSACTION_START = 4106
+    DatabaseOperation_DB_TRANSACTION_COMMIT = 4107
+    DatabaseOperation_DB_TRANSACTION_ROLLBACK = 4108
+    DatabaseOperation_DB_BACKUP = 4120
+    DatabaseOperation_DB_RESTORE = 4121
+    DatabaseOperation_DB_REPLICATE = 4122
+    DatabaseOperation_DB_MIGRATE = 4123
+    DatabaseOperation_DB_OPTIMIZE = 4124
+    DatabaseOperation_DB_VACUUM = 4125
+    DatabaseOperation_DB_ANALYZE = 4126
+    DatabaseOperation_INDEX_CREATE = 4140
+    DatabaseOperation_INDEX_DROP = 4141
+    DatabaseOperation_INDEX_REBUILD = 4142
+    DatabaseOperation_INDEX_OPTIMIZE = 4143
+    DatabaseOperation_INDEX_SCAN = 4144
+    DatabaseOperation_SCHEMA_CREATE = 4160
+    DatabaseOperation_SCHEMA_ALTER = 4161
+    DatabaseOperation_SCHEMA_DROP = 4162
+    DatabaseOperation_SCHEMA_MIGRATE = 4163
+    DatabaseOperation_SCHEMA_VALIDATE = 4164
+
+cdef enum StorageType:
+    StorageType_HOT_STORAGE = 4200
+    StorageType_WARM_STORAGE = 4201
+    StorageType_COLD_STORAGE = 4202
+    StorageType_ARCHIVE_STORAGE = 4203
+    StorageType_CACHE_STORAGE = 4204
+    StorageType_BLOCK_STORAGE = 4220
+    StorageType_FILE_STORAGE = 4221
+    StorageType_OBJECT_STORAGE = 4222
+    StorageType_TAPE_STORAGE = 4223
+    StorageType_MEMORY_STORAGE = 4224
+    StorageType_NFS = 4240
+    StorageType_SMB = 4241
+    StorageType_ISCSI = 4242
+    StorageType_FC = 4243
+    StorageType_S3 = 4244
+    StorageType_SWIFT = 4245
+    StorageType_DEDUPLICATION = 4260
+    StorageType_COMPRESSION = 4261
+    StorageType_ENCRYPTION = 4262
+    StorageType_REPLICATION = 4263
+    StorageType_SNAPSHOT = 4264
+    StorageType_TIERING = 4265
+
+cdef enum DataOperation:
+    DataOperation_EXTRACT_STARTED = 4400
+    DataOperation_TRANSFORM_STARTED = 4401
+    DataOperation_LOAD_STARTED = 4402
+    DataOperation_ETL_COMPLETED = 4403
+    DataOperation_ETL_FAILED = 4404
+    DataOperation_DATA_VALIDATED = 4420
+    DataOperation_DATA_CLEANSED = 4421
+    DataOperation_DATA_ENRICHED = 4422
+    DataOperation_DATA_DEDUPLICATED = 4423
+    DataOperation_DATA_STANDARDIZED = 4424
+    DataOperation_DATA_IMPORTED = 4440
+    DataOperation_DATA_EXPORTED = 4441
+    DataOperation_DATA_MIGRATED = 4442
+    DataOperation_DATA_SYNCED = 4443
+    DataOperation_DATA_ARCHIVED = 4444
+    DataOperation_DATA_PURGED = 4445
+    DataOperation_AGGREGATION_STARTED = 4460
+    DataOperation_CALCULATION_PERFORMED = 4461
+    DataOperation_REPORT_GENERATED = 4462
+    DataOperation_DASHBOARD_UPDATED = 4463
+    DataOperation_METRIC_CALCULATED = 4464
+
+cdef enum CacheOperation:
+    CacheOperation_CACHE_GET = 4600
+    CacheOperation_CACHE_SET = 4601
+    CacheOperation_CACHE_DELETE = 4602
+    CacheOperation_CACHE_HIT = 4603
+    CacheOperation_CACHE_MISS = 4604
+    CacheOperation_CACHE_EXPIRED = 4605
+    CacheOperation_CACHE_CLEARED = 4620
+    CacheOperation_CACHE_WARMED = 4621
+    CacheOperation_CACHE_INVALIDATED = 4622
+    CacheOperation_CACHE_REFRESHED = 4623
+    CacheOperation_CACHE_RESIZED = 4624
+    CacheOperation_LRU_EVICTION = 4640
+    CacheOperation_LFU_EVICTION = 4641
+    CacheOperation_TTL_EVICTION = 4642
+    CacheOperation_WRITE_THROUGH = 4643
+    CacheOperation_WRITE_BACK = 4644
+    CacheOperation_WRITE_AROUND = 4645
+    CacheOperation_CACHE_REPLICATED = 4660
+    CacheOperation_CACHE_PARTITIONED = 4661
+    CacheOperation_CACHE_NODE_ADDED = 4662
+    CacheOperation_CACHE_NODE_REMOVED = 4663
+    CacheOperation_CACHE_REBALANCED = 4664
+
+cdef enum BackupOperation:
+    BackupOperation_FULL_BACKUP = 4800
+    BackupOperation_INCREMENTAL_BACKUP = 4801
+    BackupOperation_DIFFERENTIAL_BACKUP = 4802
+    BackupOperation_SNAPSHOT_BACKUP = 4803
+    BackupOperation_CONTINUOUS_BACKUP = 4804
+    BackupOperation_BACKUP_SCHEDULED = 4820
+    BackupOperation_BACKUP_STARTED = 4821
+    BackupOperation_BACKUP_PROGRESS = 4822
+    BackupOperation_BACKUP_COMPLETED = 4823
+    BackupOperation_BACKUP_FAILED = 4824
+    BackupOperation_BACKUP_VERIFIED = 4825
+    BackupOperation_RESTORE_REQUESTED = 4840
+    BackupOperation_RESTORE_STARTED = 4841
+    BackupOperation_RESTORE_PROGRESS = 4842
+    BackupOperation_RESTORE_COMPLETED = 4843
+    BackupOperation_RESTORE_FAILED = 4844
+    BackupOperation_POINT_IN_TIME_RESTORE = 4845
+    BackupOperation_RETENTION_POLICY_APPLIED = 4860
+    BackupOperation_BACKUP_EXPIRED = 4861
+    BackupOperation_BACKUP_DELETED = 4862
+    BackupOperation_BACKUP_ARCHIVED = 4863
+    BackupOperation_BACKUP_REPLICATED = 4864
+
+cdef enum AIModelType:
+    AIModelType_GPT = 5000
+    AIModelType_BERT = 5001
+    AIModelType_T5 = 5002
+    AIModelType_LLAMA = 5003
+    AIModelType_CLAUDE = 5004
+    AIModelType_GEMINI = 5005
+    AIModelType_CNN = 5020
+    AIModelType_YOLO = 5021
+    AIModelType_RESNET = 5022
+    AIModelType_VIT = 5023
+    AIModelType_GAN = 5024
+    AIModelType_RNN = 5040
+    AIModelType_LSTM = 5041
+    AIModelType_TRANSFORMER = 5042
+    AIModelType_DIFFUSION = 5043
+    AIModelType_VAE = 5044
+    AIModelType_RECOMMENDATION = 5060
+    AIModelType_CLASSIFICATION = 5061
+    AIModelType_REGRESSION = 5062
+    AIModelType_CLUSTERING = 5063
+    AIModelType_ANOMALY_DETECTION = 5064
+
+cdef enum AIOperation:
+    AIOperation_TRAINING_STARTED = 5100
+    AIOperation_TRAINING_EPOCH = 5101
+    AIOperation_TRAINING_CHECKPOINT = 5102
+    AIOperation_TRAINING_COMPLETED = 5103
+    AIOperation_TRAINING_FAILED = 5104
+    AIOperation_VALIDATION_PERFORMED = 5105
+    AIOperation_INFERENCE_REQUESTED = 5120
+    AIOperation_INFERENCE_STARTED = 5121
+    AIOperation_INFERENCE_COMPLETED = 5122
+    AIOperation_INFERENCE_FAILED = 5123
+    AIOperation_BATCH_INFERENCE = 5124
+    AIOperation_STREAMING_INFERENCE = 5125
+    AIOperation_MODEL_LOADED = 5140
+    AIOperation_MODEL_UNLOADED = 5141
+    AIOperation_MODEL_DEPLOYED = 5142
+    AIOperation_MODEL_VERSIONED = 5143
+    AIOperation_MODEL_ARCHIVED = 5144
+    AIOperation_MODEL_OPTIMIZED = 5145
+    AIOperation_DATA_PREPROCESSING = 5160
+    AIOperation_DATA_AUGMENTATION = 5161
+    AIOperation_FEATURE_EXTRACTION = 5162
+    AIOperation_EMBEDDING_GENERATED = 5163
+    AIOperation_TOKENIZATION = 5164
+
+cdef enum AITrainingEvent:
+    AITrainingEvent_DATASET_LOADED = 5200
+    AITrainingEvent_DATASET_SPLIT = 5201
+    AITrainingEvent_HYPERPARAMETER_SET = 5202
+    AITrainingEvent_OPTIMIZER_INITIALIZED = 5203
+    AITrainingEvent_LOSS_CALCULATED = 5204
+    AITrainingEvent_GRADIENT_COMPUTED = 5205
+    AITrainingEvent_WEIGHTS_UPDATED = 5206
+    AITrainingEvent_EPOCH_STARTED = 5220
+    AITrainingEvent_EPOCH_COMPLETED = 5221
+    AITrainingEvent_BATCH_PROCESSED = 5222
+    AITrainingEvent_LEARNING_RATE_ADJUSTED = 5223
+    AITrainingEvent_EARLY_STOPPING = 5224
+    AITrainingEvent_CONVERGENCE_DETECTED = 5225
+    AITrainingEvent_VALIDATION_STARTED = 5240
+    AITrainingEvent_TEST_STARTED = 5241
+    AITrainingEvent_METRIC_CALCULATED = 5242
+    AITrainingEvent_ACCURACY_IMPROVED = 5243
+    AITrainingEvent_OVERFITTING_DETECTED = 5244
+    AITrainingEvent_UNDERFITTING_DETECTED = 5245
+    AITrainingEvent_GPU_ALLOCATED = 5260
+    AITrainingEvent_GPU_MEMORY_FULL = 5261
+    AITrainingEvent_DISTRIBUTED_TRAINING = 5262
+    AITrainingEvent_CHECKPOINT_SAVED = 5263
+    AITrainingEvent_TRAINING_RESUMED = 5264
+
+cdef enum AIAgentType:
+    AIAgentType_CHAT_AGENT = 5400
+    AIAgentType_VOICE_ASSISTANT = 5401
+    AIAgentType_CUSTOMER_SERVICE = 5402
+    AIAgentType_PERSONAL_ASSISTANT = 5403
+    AIAgentType_THERAPY_AGENT = 5404
+    AIAgentType_EDUCATION_AGENT = 5405
+    AIAgentType_CODE_AGENT = 5420
+    AIAgentType_RESEARCH_AGENT = 5421
+    AIAgentType_ANALYSIS_AGENT = 5422
+    AIAgentType_WRITING_AGENT = 5423
+    AIAgentType_DESIGN_AGENT = 5424
+    AIAgentType_PLANNING_AGENT = 5425
+    AIAgentType_TRADING_AGENT = 5440
+    AIAgentType_MEDICAL_AGENT = 5441
+    AIAgentType_LEGAL_AGENT = 5442
+    AIAgentType_CREATIVE_AGENT = 5443
+    AIAgentType_GAMING_AGENT = 5444
+    AIAgentType_MONITORING_AGENT = 5460
+    AIAgentType_SECURITY_AGENT = 5461
+    AIAgentType_OPTIMIZATION_AGENT = 5462
+    AIAgentType_ORCHESTRATION_AGENT = 5463
+    AIAgentType_LEARNING_AGENT = 5464
+
+cdef enum AIAgentEvent:
+    AIAgentEvent_AGENT_CREATED = 5500
+    AIAgentEvent_AGENT_INITIALIZED = 5501
+    AIAgentEvent_AGENT_STARTED = 5502
+    AIAgentEvent_AGENT_READY = 5503
+    AIAgentEvent_AGENT_BUSY = 5504
+    AIAgentEvent_AGENT_IDLE = 5505
+    AIAgentEvent_AGENT_STOPPED = 5506
+    AIAgentEvent_AGENT_TERMINATED = 5507
+    AIAgentEvent_AGENT_RECEIVED_MESSAGE = 5520
+    AIAgentEvent_AGENT_PROCESSING = 5521
+    AIAgentEvent_AGENT_RESPONDED = 5522
+    AIAgentEvent_AGENT_DELEGATED = 5523
+    AIAgentEvent_AGENT_ESCALATED = 5524
+    AIAgentEvent_AGENT_COLLABORATED = 5525
+    AIAgentEvent_AGENT_LEARNED = 5540
+    AIAgentEvent_AGENT_ADAPTED = 5541
+    AIAgentEvent_AGENT_IMPROVED = 5542
+    AIAgentEvent_PATTERN_RECOGNIZED = 5543
+    AIAgentEvent_BEHAVIOR_MODIFIED = 5544
+    AIAgentEvent_SKILL_ACQUIRED = 5545
+    AIAgentEvent_CONTEXT_LOADED = 5560
+    AIAgentEvent_CONTEXT_SAVED = 5561
+    AIAgentEvent_MEMORY_UPDATED = 5562
+    AIAgentEvent_STATE_CHECKPOINT = 5563
+    AIAgentEvent_PERSONALITY_ADJUSTED = 5564
+    AIAgentEvent_GOAL_UPDATED = 5565
+
+cdef enum LearningEvent:
+    LearningEvent_SUPERVISED_LEARNING = 5600
+    LearningEvent_UNSUPERVISED_LEARNING = 5601
+    LearningEvent_REINFORCEMENT_LEARNING = 5602
+    LearningEvent_TRANSFER_LEARNING = 5603
+    LearningEvent_META_LEARNING = 5604
+    LearningEvent_CONTINUAL_LEARNING = 5605
+    LearningEvent_LEARNING_STARTED = 5620
+    LearningEvent_LEARNING_PROGRESS = 5621
+    LearningEvent_LEARNING_COMPLETED = 5622
+    LearningEvent_KNOWLEDGE_GAINED = 5623
+    LearningEvent_SKILL_IMPROVED = 5624
+    LearningEvent_CONCEPT_MASTERED = 5625
+    LearningEvent_ADAPTATION_TRIGGERED = 5640
+    LearningEvent_BEHAVIOR_ADAPTED = 5641
+    LearningEvent_STRATEGY_ADJUSTED = 5642
+    LearningEvent_PREFERENCE_LEARNED = 5643
+    LearningEvent_PATTERN_ADAPTED = 5644
+    LearningEvent_CONTEXT_ADAPTED = 5645
+    LearningEvent_FEEDBACK_RECEIVED = 5660
+    LearningEvent_REWARD_CALCULATED = 5661
+    LearningEvent_PENALTY_APPLIED = 5662
+    LearningEvent_PERFORMANCE_EVALUATED = 5663
+    LearningEvent_IMPROVEMENT_MEASURED = 5664
+
+cdef enum BehavioralDomain:
+    BehavioralDomain_PHYSICAL_FITNESS = 5700
+    BehavioralDomain_NUTRITION_HABITS = 5701
+    BehavioralDomain_SLEEP_QUALITY = 5702
+    BehavioralDomain_ENERGY_MANAGEMENT = 5703
+    BehavioralDomain_BODY_AWARENESS = 5704
+    BehavioralDomain_CHRONIC_CONDITION_MANAGEMENT = 5705
+    BehavioralDomain_EMOTIONAL_REGULATION = 5710
+    BehavioralDomain_STRESS_RESPONSE = 5711
+    BehavioralDomain_ANXIETY_MANAGEMENT = 5712
+    BehavioralDomain_DEPRESSION_COPING = 5713
+    BehavioralDomain_TRAUMA_HEALING = 5714
+    BehavioralDomain_GRIEF_PROCESSING = 5715
+    BehavioralDomain_FOCUS_CONCENTRATION = 5720
+    BehavioralDomain_MEMORY_RETENTION = 5721
+    BehavioralDomain_LEARNING_STRATEGIES = 5722
+    BehavioralDomain_SKILL_ACQUISITION = 5723
+    BehavioralDomain_PROBLEM_SOLVING = 5724
+    BehavioralDomain_DECISION_MAKING = 5725
+    BehavioralDomain_HABIT_FORMATION = 5730
+    BehavioralDomain_HABIT_BREAKING = 5731
+    BehavioralDomain_ROUTINE_OPTIMIZATION = 5732
+    BehavioralDomain_PROCRASTINATION_PATTERNS = 5733
+    BehavioralDomain_MOTIVATION_SUSTAINING = 5734
+    BehavioralDomain_COMMUNICATION_PATTERNS = 5740
+    BehavioralDomain_CONFLICT_NAVIGATION = 5741
+    BehavioralDomain_INTIMACY_BUILDING = 5742
+    BehavioralDomain_BOUNDARY_SETTING = 5743
+    BehavioralDomain_SOCIAL_CONFIDENCE = 5744
+    BehavioralDomain_FAMILY_DYNAMICS = 5745
+    BehavioralDomain_CAREER_NAVIGATION = 5750
+    BehavioralDomain_LEADERSHIP_DEVELOPMENT = 5751
+    BehavioralDomain_PERFORMANCE_OPTIMIZATION = 5752
+    BehavioralDomain_PROFESSIONAL_RELATIONSHIPS = 5753
+    BehavioralDomain_WORK_LIFE_BALANCE = 5754
+    BehavioralDomain_ENTREPRENEURIAL_MINDSET = 5755
+    BehavioralDomain_SPENDING_PATTERNS = 5760
+    BehavioralDomain_SAVING_DISCIPLINE = 5761
+    BehavioralDomain_FINANCIAL_PLANNING = 5762
+    BehavioralDomain_MONEY_MINDSET = 5763
+    BehavioralDomain_INVESTMENT_BEHAVIOR = 5764
+    BehavioralDomain_SELF_AWARENESS = 5765
+    BehavioralDomain_CONFIDENCE_BUILDING = 5766
+    BehavioralDomain_IDENTITY_DEVELOPMENT = 5767
+    BehavioralDomain_PURPOSE_FINDING = 5768
+    BehavioralDomain_VALUE_ALIGNMENT = 5769
+    BehavioralDomain_CHANGE_ADAPTATION = 5770
+    BehavioralDomain_TRANSITION_NAVIGATION = 5771
+    BehavioralDomain_LOSS_ADJUSTMENT = 5772
+    BehavioralDomain_NEW_PHASE_PREPARATION = 5773
+    BehavioralDomain_MEANING_MAKING = 5774
+    BehavioralDomain_SPIRITUAL_PRACTICE = 5775
+    BehavioralDomain_MINDFULNESS_PRESENCE = 5776
+    BehavioralDomain_EXISTENTIAL_EXPLORATION = 5777
+    BehavioralDomain_DIGITAL_BOUNDARIES = 5778
+    BehavioralDomain_TECHNOLOGY_BALANCE = 5779
+    BehavioralDomain_REMOTE_WORK_ADAPTATION = 5780
+    BehavioralDomain_ONLINE_RELATIONSHIP_MANAGEMENT = 5781
+    BehavioralDomain_CRISIS_RESPONSE = 5782
+    BehavioralDomain_ADDICTION_RECOVERY = 5783
+    BehavioralDomain_RELAPSE_PREVENTION = 5784
+    BehavioralDomain_EMERGENCY_PREPAREDNESS = 5785
+    BehavioralDomain_TIME_MANAGEMENT = 5786
+    BehavioralDomain_ENVIRONMENT_OPTIMIZATION = 5787
+    BehavioralDomain_MINIMALISM_SIMPLIFICATION = 5788
+    BehavioralDomain_SUSTAINABILITY_PRACTICES = 5789
+    BehavioralDomain_TRAVEL_ADAPTATION = 5790
+    BehavioralDomain_CREATIVE_FLOW = 5791
+    BehavioralDomain_ARTISTIC_EXPRESSION = 5792
+    BehavioralDomain_INNOVATION_THINKING = 5793
+    BehavioralDomain_HOBBY_ENGAGEMENT = 5794
+    BehavioralDomain_AGING_ADAPTATION = 5795
+    BehavioralDomain_RETIREMENT_TRANSITION = 5796
+    BehavioralDomain_LEGACY_BUILDING = 5797
+    BehavioralDomain_GENERATIONAL_WISDOM = 5798
+
+cdef enum NeuralNetworkEvent:
+    NeuralNetworkEvent_FORWARD_PASS = 5800
+    NeuralNetworkEvent_BACKWARD_PASS = 5801
+    NeuralNetworkEvent_WEIGHT_UPDATE = 5802
+    NeuralNetworkEvent_BIAS_UPDATE = 5803
+    NeuralNetworkEvent_ACTIVATION_COMPUTED = 5804
+    NeuralNetworkEvent_DROPOUT_APPLIED = 5805
+    NeuralNetworkEvent_LAYER_ADDED = 5820
+    NeuralNetworkEvent_LAYER_REMOVED = 5821
+    NeuralNetworkEvent_LAYER_FROZEN = 5822
+    NeuralNetworkEvent_LAYER_UNFROZEN = 5823
+    NeuralNetworkEvent_ATTENTION_COMPUTED = 5824
+    NeuralNetworkEvent_POOLING_APPLIED = 5825
+    NeuralNetworkEvent_GRADIENT_VANISHING = 5840
+    NeuralNetworkEvent_GRADIENT_EXPLODING = 5841
+    NeuralNetworkEvent_DEAD_NEURONS = 5842
+    NeuralNetworkEvent_SATURATION_DETECTED = 5843
+    NeuralNetworkEvent_SPARSITY_INCREASED = 5844
+    NeuralNetworkEvent_PRUNING_APPLIED = 5860
+    NeuralNetworkEvent_QUANTIZATION_APPLIED = 5861
+    NeuralNetworkEvent_DISTILLATION_PERFORMED = 5862
+    NeuralNetworkEvent_ARCHITECTURE_SEARCH = 5863
+    NeuralNetworkEvent_HYPERPARAMETER_TUNED = 5864
+
+cdef enum BusinessProcess:
+    BusinessProcess_ORDER_PROCESSING = 6000
+    BusinessProcess_PAYMENT_PROCESSING = 6001
+    BusinessProcess_INVENTORY_MANAGEMENT = 6002
+    BusinessProcess_CUSTOMER_ONBOARDING = 6003
+    BusinessProcess_ACCOUNT_MANAGEMENT = 6004
+    BusinessProcess_BILLING_CYCLE = 6005
+    BusinessProcess_TICKET_MANAGEMENT = 6020
+    BusinessProcess_COMPLAINT_HANDLING = 6021
+    BusinessProcess_REFUND_PROCESSING = 6022
+    BusinessProcess_ESCALATION_PROCESS = 6023
+    BusinessProcess_FEEDBACK_COLLECTION = 6024
+    BusinessProcess_APPROVAL_WORKFLOW = 6040
+    BusinessProcess_DOCUMENT_PROCESSING = 6041
+    BusinessProcess_COMPLIANCE_CHECK = 6042
+    BusinessProcess_AUDIT_PROCESS = 6043
+    BusinessProcess_REPORTING_PROCESS = 6044
+    BusinessProcess_DATA_ANALYSIS = 6060
+    BusinessProcess_REPORT_GENERATION = 6061
+    BusinessProcess_DASHBOARD_UPDATE = 6062
+    BusinessProcess_KPI_CALCULATION = 6063
+    BusinessProcess_TREND_ANALYSIS = 6064
+
+cdef enum BusinessEvent:
+    BusinessEvent_TRANSACTION_INITIATED = 6100
+    BusinessEvent_TRANSACTION_AUTHORIZED = 6101
+    BusinessEvent_TRANSACTION_COMPLETED = 6102
+    BusinessEvent_TRANSACTION_FAILED = 6103
+    BusinessEvent_TRANSACTION_REVERSED = 6104
+    BusinessEvent_TRANSACTION_DISPUTED = 6105
+    BusinessEvent_ORDER_PLACED = 6120
+    BusinessEvent_ORDER_CONFIRMED = 6121
+    BusinessEvent_ORDER_PROCESSED = 6122
+    BusinessEvent_ORDER_SHIPPED = 6123
+    BusinessEvent_ORDER_DELIVERED = 6124
+    BusinessEvent_ORDER_CANCELLED = 6125
+    BusinessEvent_ORDER_RETURNED = 6126
+    BusinessEvent_CUSTOMER_REGISTERED = 6140
+    BusinessEvent_CUSTOMER_VERIFIED = 6141
+    BusinessEvent_CUSTOMER_UPGRADED = 6142
+    BusinessEvent_CUSTOMER_DOWNGRADED = 6143
+    BusinessEvent_CUSTOMER_CHURNED = 6144
+    BusinessEvent_CUSTOMER_REACTIVATED = 6145
+    BusinessEvent_INVOICE_GENERATED = 6160
+    BusinessEvent_PAYMENT_RECEIVED = 6161
+    BusinessEvent_PAYMENT_FAILED = 6162
+    BusinessEvent_REFUND_ISSUED = 6163
+    BusinessEvent_CREDIT_APPLIED = 6164
+    BusinessEvent_SUBSCRIPTION_RENEWED = 6165
+
+cdef enum WorkflowOrchestration:
+    WorkflowOrchestration_ORCHESTRATION_STARTED = 6200
+    WorkflowOrchestration_ORCHESTRATION_PAUSED = 6201
+    WorkflowOrchestration_ORCHESTRATION_RESUMED = 6202
+    WorkflowOrchestration_ORCHESTRATION_COMPLETED = 6203
+    WorkflowOrchestration_ORCHESTRATION_FAILED = 6204
+    WorkflowOrchestration_ORCHESTRATION_TIMEOUT = 6205
+    WorkflowOrchestration_BRANCH_EVALUATED = 6220
+    WorkflowOrchestration_CONDITION_CHECKED = 6221
+    WorkflowOrchestration_LOOP_STARTED = 6222
+    WorkflowOrchestration_LOOP_ITERATION = 6223
+    WorkflowOrchestration_LOOP_COMPLETED = 6224
+    WorkflowOrchestration_PARALLEL_SPLIT = 6225
+    WorkflowOrchestration_PARALLEL_JOIN = 6226
+    WorkflowOrchestration_TASK_SCHEDULED = 6240
+    WorkflowOrchestration_TASK_DISPATCHED = 6241
+    WorkflowOrchestration_TASK_CLAIMED = 6242
+    WorkflowOrchestration_TASK_RELEASED = 6243
+    WorkflowOrchestration_TASK_ESCALATED = 6244
+    WorkflowOrchestration_TASK_TIMED_OUT = 6245
+    WorkflowOrchestration_STATE_PERSISTED = 6260
+    WorkflowOrchestration_STATE_RESTORED = 6261
+    WorkflowOrchestration_CHECKPOINT_CREATED = 6262
+    WorkflowOrchestration_ROLLBACK_INITIATED = 6263
+    WorkflowOrchestration_COMPENSATION_TRIGGERED = 6264
+
+cdef enum DecisionPoint:
+    DecisionPoint_APPROVAL_PENDING = 6400
+    DecisionPoint_APPROVAL_GRANTED = 6401
+    DecisionPoint_APPROVAL_DENIED = 6402
+    DecisionPoint_APPROVAL_ESCALATED = 6403
+    DecisionPoint_APPROVAL_EXPIRED = 6404
+    DecisionPoint_APPROVAL_DELEGATED = 6405
+    DecisionPoint_CREDIT_CHECK = 6420
+    DecisionPoint_RISK_ASSESSMENT = 6421
+    DecisionPoint_ELIGIBILITY_CHECK = 6422
+    DecisionPoint_PRICING_DECISION = 6423
+    DecisionPoint_ROUTING_DECISION = 6424
+    DecisionPoint_PRIORITY_DECISION = 6425
+    DecisionPoint_RULE_EVALUATED = 6440
+    DecisionPoint_THRESHOLD_CHECKED = 6441
+    DecisionPoint_POLICY_APPLIED = 6442
+    DecisionPoint_ALGORITHM_EXECUTED = 6443
+    DecisionPoint_ML_PREDICTION = 6444
+    DecisionPoint_SCORE_CALCULATED = 6445
+    DecisionPoint_MANUAL_REVIEW = 6460
+    DecisionPoint_EXPERT_OPINION = 6461
+    DecisionPoint_OVERRIDE_APPLIED = 6462
+    DecisionPoint_EXCEPTION_GRANTED = 6463
+    DecisionPoint_WAIVER_APPROVED = 6464
+
+cdef enum BusinessRule:
+    BusinessRule_FIELD_VALIDATION = 6600
+    BusinessRule_FORMAT_VALIDATION = 6601
+    BusinessRule_RANGE_VALIDATION = 6602
+    BusinessRule_DEPENDENCY_VALIDATION = 6603
+    BusinessRule_CONSISTENCY_CHECK = 6604
+    BusinessRule_COMPLETENESS_CHECK = 6605
+    BusinessRule_PRICE_CALCULATION = 6620
+    BusinessRule_TAX_CALCULATION = 6621
+    BusinessRule_DISCOUNT_CALCULATION = 6622
+    BusinessRule_FEE_CALCULATION = 6623
+    BusinessRule_COMMISSION_CALCULATION = 6624
+    BusinessRule_INTEREST_CALCULATION = 6625
+    BusinessRule_ACCESS_POLICY = 6640
+    BusinessRule_RETENTION_POLICY = 6641
+    BusinessRule_ESCALATION_POLICY = 6642
+    BusinessRule_APPROVAL_POLICY = 6643
+    BusinessRule_SECURITY_POLICY = 6644
+    BusinessRule_COMPLIANCE_POLICY = 6645
+    BusinessRule_LIMIT_CHECK = 6660
+    BusinessRule_QUOTA_CHECK = 6661
+    BusinessRule_CAPACITY_CHECK = 6662
+    BusinessRule_AVAILABILITY_CHECK = 6663
+    BusinessRule_COMPATIBILITY_CHECK = 6664
+
+cdef enum DomainSpecific:
+    DomainSpecific_CART_UPDATED = 6800
+    DomainSpecific_CHECKOUT_STARTED = 6801
+    DomainSpecific_PAYMENT_PROCESSED = 6802
+    DomainSpecific_INVENTORY_UPDATED = 6803
+    DomainSpecific_SHIPPING_CALCULATED = 6804
+    DomainSpecific_TRACKING_UPDATED = 6805
+    DomainSpecific_APPOINTMENT_SCHEDULED = 6820
+    DomainSpecific_PRESCRIPTION_CREATED = 6821
+    DomainSpecific_LAB_RESULT_RECEIVED = 6822
+    DomainSpecific_INSURANCE_VERIFIED = 6823
+    DomainSpecific_PATIENT_ADMITTED = 6824
+    DomainSpecific_PATIENT_DISCHARGED = 6825
+    DomainSpecific_ACCOUNT_OPENED = 6840
+    DomainSpecific_TRANSACTION_POSTED = 6841
+    DomainSpecific_STATEMENT_GENERATED = 6842
+    DomainSpecific_FRAUD_DETECTED = 6843
+    DomainSpecific_LOAN_APPROVED = 6844
+    DomainSpecific_INVESTMENT_EXECUTED = 6845
+    DomainSpecific_PRODUCTION_STARTED = 6860
+    DomainSpecific_QUALITY_CHECK = 6861
+    DomainSpecific_DEFECT_DETECTED = 6862
+    DomainSpecific_BATCH_COMPLETED = 6863
+    DomainSpecific_MAINTENANCE_SCHEDULED = 6864
+    DomainSpecific_EQUIPMENT_FAILURE = 6865
+
+cdef enum HealthStatus:
+    HealthStatus_HEALTHY = 7000
+    HealthStatus_DEGRADED = 7001
+    HealthStatus_UNHEALTHY = 7002
+    HealthStatus_CRITICAL = 7003
+    HealthStatus_UNKNOWN = 7004
+    HealthStatus_RECOVERING = 7005
+    HealthStatus_SERVICE_UP = 7020
+    HealthStatus_SERVICE_DOWN = 7021
+    HealthStatus_SERVICE_DEGRADED = 7022
+    HealthStatus_SERVICE_MAINTENANCE = 7023
+    HealthStatus_PARTIAL_OUTAGE = 7024
+    HealthStatus_FULL_OUTAGE = 7025
+    HealthStatus_COMPONENT_HEALTHY = 7040
+    HealthStatus_COMPONENT_WARNING = 7041
+    HealthStatus_COMPONENT_ERROR = 7042
+    HealthStatus_COMPONENT_FAILING = 7043
+    HealthStatus_DEPENDENCY_UNHEALTHY = 7044
+    HealthStatus_SYSTEM_OPTIMAL = 7060
+    HealthStatus_SYSTEM_STRESSED = 7061
+    HealthStatus_SYSTEM_OVERLOADED = 7062
+    HealthStatus_SYSTEM_FAILING = 7063
+    HealthStatus_RESOURCE_EXHAUSTED = 7064
+
+cdef enum MonitoringEvent:
+    MonitoringEvent_MONITOR_STARTED = 7100
+    MonitoringEvent_MONITOR_STOPPED = 7101
+    MonitoringEvent_PROBE_EXECUTED = 7102
+    MonitoringEvent_CHECK_PERFORMED = 7103
+    MonitoringEvent_METRIC_COLLECTED = 7104
+    MonitoringEvent_SAMPLE_TAKEN = 7105
+    MonitoringEvent_ANOMALY_DETECTED = 7120
+    MonitoringEvent_PATTERN_DETECTED = 7121
+    MonitoringEvent_TREND_DETECTED = 7122
+    MonitoringEvent_SPIKE_DETECTED = 7123
+    MonitoringEvent_DROP_DETECTED = 7124
+    MonitoringEvent_BASELINE_DEVIATION = 7125
+    MonitoringEvent_THRESHOLD_SET = 7140
+    MonitoringEvent_THRESHOLD_ADJUSTED = 7141
+    MonitoringEvent_THRESHOLD_EXCEEDED = 7142
+    MonitoringEvent_THRESHOLD_WARNING = 7143
+    MonitoringEvent_THRESHOLD_CRITICAL = 7144
+    MonitoringEvent_THRESHOLD_CLEARED = 7145
+    MonitoringEvent_MONITOR_CONFIGURED = 7160
+    MonitoringEvent_MONITOR_UPDATED = 7161
+    MonitoringEvent_MONITOR_DISABLED = 7162
+    MonitoringEvent_MONITOR_ENABLED = 7163
+    MonitoringEvent_SCHEDULE_CHANGED = 7164
+
+cdef enum MetricType:
+    MetricType_RESPONSE_TIME = 7200
+    MetricType_THROUGHPUT = 7201
+    MetricType_LATENCY = 7202
+    MetricType_ERROR_RATE = 7203
+    MetricType_SUCCESS_RATE = 7204
+    MetricType_AVAILABILITY = 7205
+    MetricType_CPU_USAGE = 7220
+    MetricType_MEMORY_USAGE = 7221
+    MetricType_DISK_USAGE = 7222
+    MetricType_NETWORK_USAGE = 7223
+    MetricType_BANDWIDTH_USAGE = 7224
+    MetricType_CONNECTION_COUNT = 7225
+    MetricType_TRANSACTION_COUNT = 7240
+    MetricType_REVENUE = 7241
+    MetricType_CONVERSION_RATE = 7242
+    MetricType_USER_COUNT = 7243
+    MetricType_SESSION_DURATION = 7244
+    MetricType_BOUNCE_RATE = 7245
+    MetricType_CUSTOM_COUNTER = 7260
+    MetricType_CUSTOM_GAUGE = 7261
+    MetricType_CUSTOM_HISTOGRAM = 7262
+    MetricType_CUSTOM_SUMMARY = 7263
+    MetricType_CUSTOM_TIMER = 7264
+
+cdef enum AlertType:
+    AlertType_INFO_ALERT = 7400
+    AlertType_WARNING_ALERT = 7401
+    AlertType_ERROR_ALERT = 7402
+    AlertType_CRITICAL_ALERT = 7403
+    AlertType_EMERGENCY_ALERT = 7404
+    AlertType_PERFORMANCE_ALERT = 7420
+    AlertType_AVAILABILITY_ALERT = 7421
+    AlertType_SECURITY_ALERT = 7422
+    AlertType_CAPACITY_ALERT = 7423
+    AlertType_COMPLIANCE_ALERT = 7424
+    AlertType_BUSINESS_ALERT = 7425
+    AlertType_ALERT_TRIGGERED = 7440
+    AlertType_ALERT_ACKNOWLEDGED = 7441
+    AlertType_ALERT_ESCALATED = 7442
+    AlertType_ALERT_RESOLVED = 7443
+    AlertType_ALERT_EXPIRED = 7444
+    AlertType_ALERT_SUPPRESSED = 7445
+    AlertType_NOTIFICATION_SENT = 7460
+    AlertType_INCIDENT_CREATED = 7461
+    AlertType_RUNBOOK_EXECUTED = 7462
+    AlertType_AUTO_REMEDIATION = 7463
+    AlertType_MANUAL_INTERVENTION = 7464
+
+cdef enum NotificationType:
+    NotificationType_EMAIL_NOTIFICATION = 7500
+    NotificationType_SMS_NOTIFICATION = 7501
+    NotificationType_PUSH_NOTIFICATION = 7502
+    NotificationType_WEBHOOK_NOTIFICATION = 7503
+    NotificationType_SLACK_NOTIFICATION = 7504
+    NotificationType_TEAMS_NOTIFICATION = 7505
+    NotificationType_PAGERDUTY_NOTIFICATION = 7506
+    NotificationType_NOTIFICATION_QUEUED = 7520
+    NotificationType_NOTIFICATION_SENT = 7521
+    NotificationType_NOTIFICATION_DELIVERED = 7522
+    NotificationType_NOTIFICATION_FAILED = 7523
+    NotificationType_NOTIFICATION_BOUNCED = 7524
+    NotificationType_NOTIFICATION_READ = 7525
+    NotificationType_SYSTEM_NOTIFICATION = 7540
+    NotificationType_USER_NOTIFICATION = 7541
+    NotificationType_ADMIN_NOTIFICATION = 7542
+    NotificationType_BROADCAST_NOTIFICATION = 7543
+    NotificationType_SCHEDULED_NOTIFICATION = 7544
+    NotificationType_SUBSCRIPTION_CREATED = 7560
+    NotificationType_SUBSCRIPTION_UPDATED = 7561
+    NotificationType_SUBSCRIPTION_DELETED = 7562
+    NotificationType_PREFERENCE_UPDATED = 7563
+    NotificationType_DO_NOT_DISTURB = 7564
+
+cdef enum LoggingEvent:
+    LoggingEvent_LOG_WRITTEN = 7600
+    LoggingEvent_LOG_ROTATED = 7601
+    LoggingEvent_LOG_ARCHIVED = 7602
+    LoggingEvent_LOG_DELETED = 7603
+    LoggingEvent_LOG_SHIPPED = 7604
+    LoggingEvent_LOG_INDEXED = 7605
+    LoggingEvent_LOG_TRACE = 7620
+    LoggingEvent_LOG_DEBUG = 7621
+    LoggingEvent_LOG_INFO = 7622
+    LoggingEvent_LOG_WARN = 7623
+    LoggingEvent_LOG_ERROR = 7624
+    LoggingEvent_LOG_FATAL = 7625
+    LoggingEvent_AUDIT_STARTED = 7640
+    LoggingEvent_AUDIT_COMPLETED = 7641
+    LoggingEvent_AUDIT_FINDING = 7642
+    LoggingEvent_AUDIT_VIOLATION = 7643
+    LoggingEvent_AUDIT_CLEARED = 7644
+    LoggingEvent_AUDIT_REPORT = 7645
+    LoggingEvent_LOG_PARSED = 7660
+    LoggingEvent_LOG_FILTERED = 7661
+    LoggingEvent_LOG_AGGREGATED = 7662
+    LoggingEvent_LOG_CORRELATED = 7663
+    LoggingEvent_PATTERN_EXTRACTED = 7664
+
+cdef enum PerformanceEvent:
+    PerformanceEvent_PERFORMANCE_BASELINE = 7800
+    PerformanceEvent_PERFORMANCE_DEGRADED = 7801
+    PerformanceEvent_PERFORMANCE_IMPROVED = 7802
+    PerformanceEvent_PERFORMANCE_OPTIMAL = 7803
+    PerformanceEvent_SLA_MET = 7804
+    PerformanceEvent_SLA_BREACH = 7805
+    PerformanceEvent_OPTIMIZATION_STARTED = 7820
+    PerformanceEvent_OPTIMIZATION_APPLIED = 7821
+    PerformanceEvent_CACHE_OPTIMIZED = 7822
+    PerformanceEvent_QUERY_OPTIMIZED = 7823
+    PerformanceEvent_INDEX_OPTIMIZED = 7824
+    PerformanceEvent_CODE_OPTIMIZED = 7825
+    PerformanceEvent_BOTTLENECK_DETECTED = 7840
+    PerformanceEvent_CPU_BOTTLENECK = 7841
+    PerformanceEvent_MEMORY_BOTTLENECK = 7842
+    PerformanceEvent_IO_BOTTLENECK = 7843
+    PerformanceEvent_NETWORK_BOTTLENECK = 7844
+    PerformanceEvent_DATABASE_BOTTLENECK = 7845
+    PerformanceEvent_LOAD_TEST_STARTED = 7860
+    PerformanceEvent_STRESS_TEST_STARTED = 7861
+    PerformanceEvent_BENCHMARK_COMPLETED = 7862
+    PerformanceEvent_PERFORMANCE_REGRESSION = 7863
+    PerformanceEvent_PERFORMANCE_PASSED = 7864
+
+cdef enum APIIntegration:
+    APIIntegration_API_REGISTERED = 8000
+    APIIntegration_API_DEPLOYED = 8001
+    APIIntegration_API_UPDATED = 8002
+    APIIntegration_API_DEPRECATED = 8003
+    APIIntegration_API_RETIRED = 8004
+    APIIntegration_API_VERSIONED = 8005
+    APIIntegration_API_REQUEST = 8020
+    APIIntegration_API_RESPONSE = 8021
+    APIIntegration_API_ERROR = 8022
+    APIIntegration_API_TIMEOUT = 8023
+    APIIntegration_API_RATE_LIMITED = 8024
+    APIIntegration_API_THROTTLED = 8025
+    APIIntegration_API_AUTHENTICATED = 8040
+    APIIntegration_API_AUTHORIZED = 8041
+    APIIntegration_API_UNAUTHORIZED = 8042
+    APIIntegration_API_KEY_GENERATED = 8043
+    APIIntegration_API_KEY_REVOKED = 8044
+    APIIntegration_API_TOKEN_EXPIRED = 8045
+    APIIntegration_ENDPOINT_CREATED = 8060
+    APIIntegration_ENDPOINT_UPDATED = 8061
+    APIIntegration_ENDPOINT_DELETED = 8062
+    APIIntegration_ROUTE_CONFIGURED = 8063
+    APIIntegration_POLICY_APPLIED = 8064
+    APIIntegration_QUOTA_ENFORCED = 8065
+
+cdef enum MessageQueueEvent:
+    MessageQueueEvent_MESSAGE_PUBLISHED = 8200
+    MessageQueueEvent_MESSAGE_CONSUMED = 8201
+    MessageQueueEvent_MESSAGE_ACKNOWLEDGED = 8202
+    MessageQueueEvent_MESSAGE_REJECTED = 8203
+    MessageQueueEvent_MESSAGE_REQUESTED = 8204
+    MessageQueueEvent_MESSAGE_EXPIRED = 8205
+    MessageQueueEvent_QUEUE_CREATED = 8220
+    MessageQueueEvent_QUEUE_DELETED = 8221
+    MessageQueueEvent_QUEUE_PURGED = 8222
+    MessageQueueEvent_QUEUE_BOUND = 8223
+    MessageQueueEvent_QUEUE_UNBOUND = 8224
+    MessageQueueEvent_DLQ_MESSAGE = 8225
+    MessageQueueEvent_TOPIC_CREATED = 8240
+    MessageQueueEvent_TOPIC_DELETED = 8241
+    MessageQueueEvent_SUBSCRIPTION_CREATED = 8242
+    MessageQueueEvent_SUBSCRIPTION_DELETED = 8243
+    MessageQueueEvent_EXCHANGE_DECLARED = 8244
+    MessageQueueEvent_ROUTING_KEY_SET = 8245
+    MessageQueueEvent_CONSUMER_STARTED = 8260
+    MessageQueueEvent_CONSUMER_STOPPED = 8261
+    MessageQueueEvent_CONSUMER_ERROR = 8262
+    MessageQueueEvent_CONSUMER_REBALANCE = 8263
+    MessageQueueEvent_CONSUMER_LAG = 8264
+
+cdef enum ThirdPartyService:
+    ThirdPartyService_STRIPE_INTEGRATION = 8400
+    ThirdPartyService_PAYPAL_INTEGRATION = 8401
+    ThirdPartyService_SQUARE_INTEGRATION = 8402
+    ThirdPartyService_PAYMENT_GATEWAY = 8403
+    ThirdPartyService_CRYPTO_PAYMENT = 8404
+    ThirdPartyService_AWS_SERVICE = 8420
+    ThirdPartyService_AZURE_SERVICE = 8421
+    ThirdPartyService_GCP_SERVICE = 8422
+    ThirdPartyService_CLOUDFLARE = 8423
+    ThirdPartyService_CDN_SERVICE = 8424
+    ThirdPartyService_TWILIO_SMS = 8440
+    ThirdPartyService_SENDGRID_EMAIL = 8441
+    ThirdPartyService_MAILGUN = 8442
+    ThirdPartyService_SLACK_API = 8443
+    ThirdPartyService_DISCORD_API = 8444
+    ThirdPartyService_GOOGLE_ANALYTICS = 8460
+    ThirdPartyService_MIXPANEL = 8461
+    ThirdPartyService_SEGMENT = 8462
+    ThirdPartyService_AMPLITUDE = 8463
+    ThirdPartyService_HOTJAR = 8464
+
+cdef enum WebhookEvent:
+    WebhookEvent_WEBHOOK_REGISTERED = 8600
+    WebhookEvent_WEBHOOK_VERIFIED = 8601
+    WebhookEvent_WEBHOOK_UPDATED = 8602
+    WebhookEvent_WEBHOOK_DELETED = 8603
+    WebhookEvent_WEBHOOK_ENABLED = 8604
+    WebhookEvent_WEBHOOK_DISABLED = 8605
+    WebhookEvent_WEBHOOK_TRIGGERED = 8620
+    WebhookEvent_WEBHOOK_SENT = 8621
+    WebhookEvent_WEBHOOK_DELIVERED = 8622
+    WebhookEvent_WEBHOOK_FAILED = 8623
+    WebhookEvent_WEBHOOK_RETRY = 8624
+    WebhookEvent_WEBHOOK_TIMEOUT = 8625
+    WebhookEvent_SIGNATURE_VERIFIED = 8640
+    WebhookEvent_SIGNATURE_INVALID = 8641
+    WebhookEvent_SECRET_ROTATED = 8642
+    WebhookEvent_IP_WHITELISTED = 8643
+    WebhookEvent_REPLAY_DETECTED = 8644
+    WebhookEvent_ENDPOINT_TESTED = 8660
+    WebhookEvent_PAYLOAD_VALIDATED = 8661
+    WebhookEvent_FILTER_APPLIED = 8662
+    WebhookEvent_TRANSFORMATION_APPLIED = 8663
+    WebhookEvent_BATCH_WEBHOOK = 8664
+
+cdef enum ProtocolEvent:
+    ProtocolEvent_HTTP_GET = 8800
+    ProtocolEvent_HTTP_POST = 8801
+    ProtocolEvent_HTTP_PUT = 8802
+    ProtocolEvent_HTTP_DELETE = 8803
+    ProtocolEvent_HTTP_PATCH = 8804
+    ProtocolEvent_HTTP_OPTIONS = 8805
+    ProtocolEvent_WS_CONNECTED = 8820
+    ProtocolEvent_WS_MESSAGE = 8821
+    ProtocolEvent_WS_DISCONNECTED = 8822
+    ProtocolEvent_WS_ERROR = 8823
+    ProtocolEvent_WS_PING = 8824
+    ProtocolEvent_WS_PONG = 8825
+    ProtocolEvent_GRPC_UNARY = 8840
+    ProtocolEvent_GRPC_STREAM_CLIENT = 8841
+    ProtocolEvent_GRPC_STREAM_SERVER = 8842
+    ProtocolEvent_GRPC_STREAM_BIDI = 8843
+    ProtocolEvent_GRPC_ERROR = 8844
+    ProtocolEvent_GQL_QUERY = 8860
+    ProtocolEvent_GQL_MUTATION = 8861
+    ProtocolEvent_GQL_SUBSCRIPTION = 8862
+    ProtocolEvent_GQL_ERROR = 8863
+    ProtocolEvent_GQL_VALIDATION = 8864
+
+cdef enum FrontendEvent:
+    FrontendEvent_PAGE_LOAD = 9000
+    FrontendEvent_PAGE_VIEW = 9001
+    FrontendEvent_PAGE_EXIT = 9002
+    FrontendEvent_PAGE_ERROR = 9003
+    FrontendEvent_PAGE_REFRESH = 9004
+    FrontendEvent_ROUTE_CHANGE = 9005
+    FrontendEvent_CLICK = 9020
+    FrontendEvent_DOUBLE_CLICK = 9021
+    FrontendEvent_RIGHT_CLICK = 9022
+    FrontendEvent_HOVER = 9023
+    FrontendEvent_FOCUS = 9024
+    FrontendEvent_BLUR = 9025
+    FrontendEvent_SCROLL = 9026
+    FrontendEvent_SWIPE = 9027
+    FrontendEvent_FORM_SUBMIT = 9040
+    FrontendEvent_FORM_RESET = 9041
+    FrontendEvent_FIELD_CHANGE = 9042
+    FrontendEvent_FIELD_VALIDATE = 9043
+    FrontendEvent_FIELD_ERROR = 9044
+    FrontendEvent_FILE_UPLOAD = 9045
+    FrontendEvent_MODAL_OPEN = 9060
+    FrontendEvent_MODAL_CLOSE = 9061
+    FrontendEvent_DROPDOWN_OPEN = 9062
+    FrontendEvent_TAB_SWITCH = 9063
+    FrontendEvent_ACCORDION_TOGGLE = 9064
+    FrontendEvent_NOTIFICATION_SHOW = 9065
+
+cdef enum MobileAppEvent:
+    MobileAppEvent_APP_INSTALLED = 9200
+    MobileAppEvent_APP_LAUNCHED = 9201
+    MobileAppEvent_APP_FOREGROUND = 9202
+    MobileAppEvent_APP_BACKGROUND = 9203
+    MobileAppEvent_APP_TERMINATED = 9204
+    MobileAppEvent_APP_UPDATED = 9205
+    MobileAppEvent_APP_CRASHED = 9206
+    MobileAppEvent_DEVICE_ROTATED = 9220
+    MobileAppEvent_NETWORK_CHANGED = 9221
+    MobileAppEvent_BATTERY_LOW = 9222
+    MobileAppEvent_MEMORY_WARNING = 9223
+    MobileAppEvent_PERMISSION_GRANTED = 9224
+    MobileAppEvent_PERMISSION_DENIED = 9225
+    MobileAppEvent_PUSH_RECEIVED = 9240
+    MobileAppEvent_PUSH_OPENED = 9241
+    MobileAppEvent_PUSH_DISMISSED = 9242
+    MobileAppEvent_PUSH_ACTION = 9243
+    MobileAppEvent_TOKEN_REGISTERED = 9244
+    MobileAppEvent_TOKEN_REFRESHED = 9245
+    MobileAppEvent_SCREEN_VIEW = 9260
+    MobileAppEvent_BUTTON_TAP = 9261
+    MobileAppEvent_GESTURE_DETECTED = 9262
+    MobileAppEvent_DEEPLINK_OPENED = 9263
+    MobileAppEvent_SHARE_INITIATED = 9264
+    MobileAppEvent_PURCHASE_INITIATED = 9265
+
+cdef enum IoTEvent:
+    IoTEvent_DEVICE_REGISTERED = 9400
+    IoTEvent_DEVICE_CONNECTED = 9401
+    IoTEvent_DEVICE_DISCONNECTED = 9402
+    IoTEvent_DEVICE_UPDATED = 9403
+    IoTEvent_DEVICE_REMOVED = 9404
+    IoTEvent_FIRMWARE_UPDATED = 9405
+    IoTEvent_SENSOR_READING = 9420
+    IoTEvent_TEMPERATURE_READING = 9421
+    IoTEvent_HUMIDITY_READING = 9422
+    IoTEvent_PRESSURE_READING = 9423
+    IoTEvent_MOTION_DETECTED = 9424
+    IoTEvent_LOCATION_UPDATED = 9425
+    IoTEvent_DEVICE_ONLINE = 9440
+    IoTEvent_DEVICE_OFFLINE = 9441
+    IoTEvent_BATTERY_STATUS = 9442
+    IoTEvent_SIGNAL_STRENGTH = 9443
+    IoTEvent_DEVICE_ERROR = 9444
+    IoTEvent_MAINTENANCE_REQUIRED = 9445
+    IoTEvent_COMMAND_SENT = 9460
+    IoTEvent_COMMAND_RECEIVED = 9461
+    IoTEvent_COMMAND_EXECUTED = 9462
+    IoTEvent_COMMAND_FAILED = 9463
+    IoTEvent_CONFIG_UPDATED = 9464
+    IoTEvent_REBOOT_INITIATED = 9465
+
+cdef enum PlatformSpecific:
+    PlatformSpecific_POST_CREATED = 9600
+    PlatformSpecific_POST_LIKED = 9601
+    PlatformSpecific_POST_SHARED = 9602
+    PlatformSpecific_COMMENT_ADDED = 9603
+    PlatformSpecific_FOLLOW_USER = 9604
+    PlatformSpecific_UNFOLLOW_USER = 9605
+    PlatformSpecific_COURSE_ENROLLED = 9620
+    PlatformSpecific_LESSON_STARTED = 9621
+    PlatformSpecific_LESSON_COMPLETED = 9622
+    PlatformSpecific_QUIZ_SUBMITTED = 9623
+    PlatformSpecific_CERTIFICATE_EARNED = 9624
+    PlatformSpecific_PROGRESS_UPDATED = 9625
+    PlatformSpecific_GAME_STARTED = 9640
+    PlatformSpecific_LEVEL_COMPLETED = 9641
+    PlatformSpecific_ACHIEVEMENT_UNLOCKED = 9642
+    PlatformSpecific_SCORE_UPDATED = 9643
+    PlatformSpecific_PLAYER_JOINED = 9644
+    PlatformSpecific_PLAYER_LEFT = 9645
+    PlatformSpecific_STREAM_STARTED = 9660
+    PlatformSpecific_STREAM_PAUSED = 9661
+    PlatformSpecific_STREAM_RESUMED = 9662
+    PlatformSpecific_STREAM_ENDED = 9663
+    PlatformSpecific_QUALITY_CHANGED = 9664
+    PlatformSpecific_BUFFER_EVENT = 9665
+
+cdef enum IndustrySpecific:
+    IndustrySpecific_PATIENT_ADMITTED = 10000
+    IndustrySpecific_PATIENT_DISCHARGED = 10001
+    IndustrySpecific_MEDICATION_PRESCRIBED = 10002
+    IndustrySpecific_LAB_TEST_ORDERED = 10003
+    IndustrySpecific_DIAGNOSIS_RECORDED = 10004
+    IndustrySpecific_INSURANCE_CLAIMED = 10005
+    IndustrySpecific_TRADE_EXECUTED = 11000
+    IndustrySpecific_PORTFOLIO_REBALANCED = 11001
+    IndustrySpecific_RISK_CALCULATED = 11002
+    IndustrySpecific_COMPLIANCE_CHECKED = 11003
+    IndustrySpecific_FRAUD_DETECTED = 11004
+    IndustrySpecific_KYC_COMPLETED = 11005
+    IndustrySpecific_PRODUCT_VIEWED = 12000
+    IndustrySpecific_CART_ABANDONED = 12001
+    IndustrySpecific_WISHLIST_UPDATED = 12002
+    IndustrySpecific_REVIEW_SUBMITTED = 12003
+    IndustrySpecific_RECOMMENDATION_SHOWN = 12004
+    IndustrySpecific_PROMOTION_APPLIED = 12005
+    IndustrySpecific_STUDENT_ENROLLED = 13000
+    IndustrySpecific_ASSIGNMENT_SUBMITTED = 13001
+    IndustrySpecific_GRADE_POSTED = 13002
+    IndustrySpecific_ATTENDANCE_MARKED = 13003
+    IndustrySpecific_COURSE_COMPLETED = 13004
+    IndustrySpecific_DEGREE_AWARDED = 13005
+    IndustrySpecific_PERMIT_ISSUED = 14000
+    IndustrySpecific_LICENSE_RENEWED = 14001
+    IndustrySpecific_TAX_FILED = 14002
+    IndustrySpecific_BENEFIT_CLAIMED = 14003
+    IndustrySpecific_CITATION_ISSUED = 14004
+    IndustrySpecific_PUBLIC_RECORD_UPDATED = 14005
+
+cdef enum BehavioralPrediction:
+    BehavioralPrediction_PATTERN_DETECTED = 15000
+    BehavioralPrediction_BEHAVIOR_PREDICTED = 15001
+    BehavioralPrediction_ANOMALY_IDENTIFIED = 15002
+    BehavioralPrediction_TREND_FORECASTED = 15003
+    BehavioralPrediction_CHURN_RISK_HIGH = 15004
+    BehavioralPrediction_ENGAGEMENT_DECLINING = 15005
+    BehavioralPrediction_INTERVENTION_RECOMMENDED = 15200
+    BehavioralPrediction_PERSONALIZATION_APPLIED = 15201
+    BehavioralPrediction_OFFER_TRIGGERED = 15202
+    BehavioralPrediction_CONTENT_ADAPTED = 15203
+    BehavioralPrediction_WORKFLOW_OPTIMIZED = 15204
+    BehavioralPrediction_MODEL_IMPROVED = 15400
+    BehavioralPrediction_ACCURACY_INCREASED = 15401
+    BehavioralPrediction_FALSE_POSITIVE_REDUCED = 15402
+    BehavioralPrediction_PREDICTION_VALIDATED = 15403
+    BehavioralPrediction_FEEDBACK_INCORPORATED = 15404
+
+cdef enum BehavioralMetric:
+    BehavioralMetric_FREQUENCY_MEASURE = 15800
+    BehavioralMetric_INTENSITY_LEVEL = 15801
+    BehavioralMetric_DURATION_TRACKED = 15802
+    BehavioralMetric_CONSISTENCY_SCORE = 15803
+    BehavioralMetric_TREND_DIRECTION = 15804
+    BehavioralMetric_VARIABILITY_INDEX = 15805
+    BehavioralMetric_BASELINE_ESTABLISHED = 15806
+    BehavioralMetric_DEVIATION_DETECTED = 15807
+    BehavioralMetric_PATTERN_STRENGTH = 15808
+    BehavioralMetric_HABIT_SCORE = 15809
+    BehavioralMetric_IMPROVEMENT_RATE = 15810
+    BehavioralMetric_GOAL_PROXIMITY = 15811
+    BehavioralMetric_MILESTONE_REACHED = 15812
+    BehavioralMetric_SETBACK_RECORDED = 15813
+    BehavioralMetric_RECOVERY_TIME = 15814
+    BehavioralMetric_MOMENTUM_SCORE = 15815
+    BehavioralMetric_BREAKTHROUGH_MOMENT = 15816
+    BehavioralMetric_PLATEAU_DETECTED = 15817
+    BehavioralMetric_BEHAVIOR_INITIATED = 15820
+    BehavioralMetric_BEHAVIOR_MAINTAINED = 15821
+    BehavioralMetric_BEHAVIOR_STRENGTHENED = 15822
+    BehavioralMetric_BEHAVIOR_WEAKENED = 15823
+    BehavioralMetric_BEHAVIOR_EXTINCT = 15824
+    BehavioralMetric_BEHAVIOR_RELAPSED = 15825
+    BehavioralMetric_BEHAVIOR_TRANSFORMED = 15826
+    BehavioralMetric_BEHAVIOR_INTEGRATED = 15827
+    BehavioralMetric_INTERVENTION_APPLIED = 15830
+    BehavioralMetric_INTERVENTION_EFFECTIVE = 15831
+    BehavioralMetric_INTERVENTION_INEFFECTIVE = 15832
+    BehavioralMetric_STRATEGY_ADJUSTED = 15833
+    BehavioralMetric_SUPPORT_ACTIVATED = 15834
+    BehavioralMetric_RESISTANCE_ENCOUNTERED = 15835
+    BehavioralMetric_BREAKTHROUGH_ACHIEVED = 15836
+    BehavioralMetric_PATTERN_IDENTIFIED = 15840
+    BehavioralMetric_CORRELATION_FOUND = 15841
+    BehavioralMetric_PREDICTION_GENERATED = 15842
+    BehavioralMetric_INSIGHT_DISCOVERED = 15843
+    BehavioralMetric_RECOMMENDATION_CREATED = 15844
+    BehavioralMetric_RISK_ASSESSED = 15845
+    BehavioralMetric_OPPORTUNITY_IDENTIFIED = 15846
+
+cdef enum AppType:
+    AppType_LIFE_COACH = 16000
+    AppType_THERAPIST = 16001
+    AppType_FITNESS = 16002
+    AppType_COUPLES = 16003
+    AppType_COMPANION = 16004
+    AppType_CAREER_STRATEGIST = 16005
+    AppType_EXECUTIVE_COACH = 16006
+    AppType_FINANCIAL_WELLNESS = 16007
+    AppType_SPIRITUAL_GUIDE = 16008
+    AppType_ACCOUNTABILITY_PARTNER = 16009
+    AppType_CREATIVITY_COACH = 16010
+    AppType_PARENT_COACH = 16011
+    AppType_TRANSITION_GUIDE = 16012
+    AppType_PERFORMANCE_COACH = 16013
+    AppType_HABITS_TRACKER = 16014
+    AppType_NUTRITION_COACH = 16015
+    AppType_SLEEP_COACH = 16016
+    AppType_STRESS_MANAGEMENT = 16017
+    AppType_ADDICTION_RECOVERY = 16018
+    AppType_CHRONIC_ILLNESS = 16019
+    AppType_MENTAL_HEALTH = 16020
+    AppType_STUDY_COACH = 16021
+    AppType_LANGUAGE_COACH = 16022
+    AppType_SKILL_DEVELOPMENT = 16023
+    AppType_READING_COACH = 16024
+    AppType_MEMORY_COACH = 16025
+    AppType_DATING_COACH = 16030
+    AppType_FAMILY_COACH = 16031
+    AppType_SOCIAL_SKILLS = 16032
+    AppType_DIVORCE_COACH = 16033
+    AppType_CONFLICT_RESOLUTION = 16034
+    AppType_PREPPER_COACH = 16040
+    AppType_RETIREMENT_COACH = 16041
+    AppType_STUDENT_COACH = 16042
+    AppType_AGING_COACH = 16043
+    AppType_GRIEF_COUNSELOR = 16044
+    AppType_TRAUMA_RECOVERY = 16045
+    AppType_CRISIS_SUPPORT = 16046
+    AppType_ENTREPRENEUR_COACH = 16050
+    AppType_REMOTE_WORK_COACH = 16051
+    AppType_COMMUNICATION_COACH = 16052
+    AppType_DECISION_COACH = 16053
+    AppType_PROCRASTINATION_COACH = 16054
+    AppType_CONFIDENCE_COACH = 16055
+    AppType_TRAVEL_COACH = 16060
+    AppType_HOBBY_COACH = 16061
+    AppType_MINIMALISM_COACH = 16062
+    AppType_SUSTAINABILITY_COACH = 16063
+    AppType_DIGITAL_WELLNESS = 16064
+    AppType_CUSTOM_COACH = 16070
+    AppType_ADMIN_DASHBOARD = 16200
+    AppType_ANALYTICS_HUB = 16201
+    AppType_COACH_TRAINING = 16202
+    AppType_USER_ONBOARDING = 16203
+    AppType_API_GATEWAY = 16300
+    AppType_WEBHOOK_MANAGER = 16301
+    AppType_DATA_SYNC = 16302
+    AppType_ZAPIER_CONNECTOR = 16303
+    AppType_SLACK_INTEGRATION = 16304
+    AppType_TEAMS_INTEGRATION = 16305
+    AppType_DISCORD_BOT = 16306
@@ -30,8 +30,12 @@ Usage:
     meaning = translate_code(11)    # Returns "active"
 """
 
+import sys
+from bisect import bisect_left,bisect_right
 from enum import IntEnum
-from typing import Dict,Tuple,Any,List
+from functools import lru_cache
+from itertools import groupby
+from typing import Dict,Tuple,Any,List,ClassVar,Iterable,Iterator,Optional,Callable
 
 
 # =============================================================================
@@ -2929,7 +2933,38 @@ class BehavioralMetric(IntEnum):
 
     # Future expansion: 15850-15899 (50 slots available)
 
-class AppType(IntEnum):
+class CodeTable:
+    """
+    Plain-int code table for codes used as hot-path discriminators.
+
+    Members are ordinary ``int`` class attributes, so ``AppType.LIFE_COACH``
+    is a plain class attribute load with no Enum descriptor machinery and
+    compares as a bare int. ``NAMES`` maps each value back to its member
+    name for logging and discovery.
+
+    Values must be unique within a table; a duplicate raises ValueError
+    when the class is defined.
+    """
+
+    __slots__ = ()
+    NAMES: ClassVar [Dict [int,str]] = {}
+
+    def __init_subclass__ (cls,**kwargs):
+        super ().__init_subclass__ (**kwargs)
+        names = {}
+        duplicates = []
+        for name,value in vars (cls).items ():
+            if name.isupper () and type (value) is int:
+                if value in names:
+                    duplicates.append (f"{name} -> {names [value]}")
+                else:
+                    names [value] = name
+        if duplicates:
+            raise ValueError (f"duplicate values found in {cls.__name__!r}: {', '.join (duplicates)}")
+        cls.NAMES = names
+
+
+class AppType (CodeTable):
     """Application types for coaching domains - Range: 16000-16999"""
 
     # Core Coaching Apps (16000-16049)
@@ -3010,12 +3045,10 @@ class AppType(IntEnum):
     API_GATEWAY = 16300
     WEBHOOK_MANAGER = 16301
     DATA_SYNC = 16302
-
-    # Integration Apps (16200-16299)
-    ZAPIER_CONNECTOR = 16200
-    SLACK_INTEGRATION = 16201
-    TEAMS_INTEGRATION = 16202
-    DISCORD_BOT = 16203
+    ZAPIER_CONNECTOR = 16303
+    SLACK_INTEGRATION = 16304
+    TEAMS_INTEGRATION = 16305
+    DISCORD_BOT = 16306
 
     # Reserved for core integrations: 16300-16499
 
@@ -3059,121 +3092,279 @@ class AppType(IntEnum):
     # Example: TEST_LOAD_SIMULATOR = 19500
 
 
+# =============================================================================
+# CODE INDEX
+# =============================================================================
+
+def _walk_subclasses (base: type) -> Iterator [type]:
+    """Yield every direct and indirect subclass of ``base``"""
+    subclass: type
+    for subclass in base.__subclasses__ ():
+        yield subclass
+        yield from _walk_subclasses (subclass)
+
+
+def _iter_code_classes ():
+    """Yield every IntEnum and CodeTable class defined in this module"""
+    for base in (IntEnum,CodeTable):
+        for code_class in _walk_subclasses (base):
+            if code_class.__module__ == __name__:
+                yield code_class
+
+
+def _build_code_index () -> Dict [int,Tuple [type,str]]:
+    """Flatten every code class into one code -> (class, member name) dict"""
+    code_index: Dict [int,Tuple [type,str]] = {}
+    for code_class in _iter_code_classes ():
+        if issubclass (code_class,CodeTable):
+            members = code_class.NAMES.items ()
+        else:
+            members = ((item.value,item.name) for item in code_class)
+
+        for code,member_name in members:
+            if code in code_index:
+                owner = code_index [code] [0].__name__
+                raise ValueError (f"code {code} is defined by both {owner} and {code_class.__name__}")
+            code_index [code] = (code_class,member_name)
+    return code_index
+
+
+_GLOBAL_CODE_INDEX = _build_code_index ()
+_CODE_NAMES = {code:member_name for code,(_,member_name) in _GLOBAL_CODE_INDEX.items ()}
+
+
+def _build_code_bitmaps () -> Dict [type,Tuple [int,bytes]]:
+    """One bitmap per class: bit (code - base) is set for every defined code"""
+    class_codes: Dict [type,List [int]] = {}
+    for code,(code_class,_) in _GLOBAL_CODE_INDEX.items ():
+        class_codes.setdefault (code_class,[]).append (code)
+
+    code_bitmaps = {}
+    for code_class,codes in class_codes.items ():
+        base = min (codes)
+        bitmap = bytearray ((max (codes) - base)//8 + 1)
+        for code in codes:
+            offset = code - base
+            bitmap [offset >> 3] |= 1 << (offset & 7)
+        code_bitmaps [code_class] = (base,bytes (bitmap))
+    return code_bitmaps
+
+
+_CODE_BITMAPS = _build_code_bitmaps ()
+
+
+def in_valid_range (code_class,code: int) -> bool:
+    """
+    True if ``code`` is defined by ``code_class``.
+
+    Reserved gaps inside a class range ("# Reserved: 6006-6019") and codes
+    outside it are rejected. Each class keeps a bitmap of its defined codes
+    (a few dozen bytes), so validating ingest traffic needs no set of members.
+    """
+    base,bitmap = _CODE_BITMAPS [code_class]
+    offset = code - base
+    if offset < 0 or offset >= len (bitmap) << 3:
+        return False
+    return bool (bitmap [offset >> 3] & (1 << (offset & 7)))
+
+
+@lru_cache (maxsize=None)
+def members_of (code_class) -> Tuple [int,...]:
+    """
+    All members of a code class as a tuple, built once per class.
+
+    Use this instead of ``list (SomeEnum)`` when enumerating codes for UI
+    rendering or serialization; iterating an IntEnum rebuilds the sequence
+    from ``_member_names_`` on every call. CodeTable classes yield their
+    plain int values.
+    """
+    if issubclass (code_class,CodeTable):
+        return tuple (code_class.NAMES)
+    return tuple (code_class)
+
+
+def lookup_code (code: int) -> Optional [Tuple [type,str]]:
+    """
+    Decode a bare int into its (class, member name), e.g.
+    lookup_code (7142) -> (MonitoringEvent, "THRESHOLD_EXCEEDED").
+
+    Returns None for codes that are not defined.
+    """
+    return _GLOBAL_CODE_INDEX.get (code)
+
+
+def name_of (code: int) -> str:
+    """
+    Member name for any defined code, e.g. name_of (11) -> "ACTIVE".
+
+    Works on bare ints from any class, so hot paths can keep codes as plain
+    ints and only resolve names when logging. Raises KeyError for codes that
+    are not defined.
+    """
+    return _CODE_NAMES [code]
+
+
 # =============================================================================
 # TRANSLATION SYSTEM
 # =============================================================================
 
+# Member name -> readable form ("ORDER_PLACED" -> "order.placed") in one pass
+_NAME_TRANS = str.maketrans ({**{chr (c):chr (c + 32) for c in range (ord ('A'),ord ('Z') + 1)},'_':'.'})
+
+# Category ranges for context: each label covers codes from its threshold up
+# to the next one (ascending, in matching order, shared by all translators)
+_CATEGORY_THRESHOLDS: Tuple [int,...] = (
+    0,50,70,90,100,200,300,400,500,600,700,900,1000,1100,1200,1300,1400,1600,
+    1800,2000,2200,2300,2400,2500,3000,3500,4000,4100,4200,4400,4600,4800,5000,
+    5100,5200,5400,5500,5600,5800,6000,6100,6200,6400,6600,6800,7000,7100,7200,
+    7400,7500,7600,7800,8000,8200,8400,8600,8800,9000,9200,9400,9600,10000,
+    11000,12000,13000,14000,15000
+    )
+_CATEGORY_LABELS: Tuple [str,...] = (
+    "universal.status",
+    "universal.priority",
+    "universal.severity",
+    "universal.result",
+    "system.event",
+    "user.event",
+    "workflow.event",
+    "error.event",
+    "communication.event",
+    "state.change",
+    "integration.event",
+    "system.metadata",
+    "auth.role",
+    "auth.permission",
+    "auth.method",
+    "auth.event",
+    "auth.authorization",
+    "auth.session",
+    "auth.security",
+    "container.type",
+    "container.lifecycle",
+    "container.orchestration",
+    "container.resource",
+    "container.management",
+    "infrastructure.component",
+    "deployment.type",
+    "database.type",
+    "database.operation",
+    "storage.type",
+    "data.operation",
+    "cache.operation",
+    "backup.operation",
+    "ai.model",
+    "ai.operation",
+    "ai.training",
+    "ai.agent",
+    "ai.agent.event",
+    "ai.learning",
+    "neural.network",
+    "business.process",
+    "business.event",
+    "workflow.orchestration",
+    "decision.point",
+    "business.rule",
+    "domain.specific",
+    "health.status",
+    "monitoring.event",
+    "metric.type",
+    "alert.type",
+    "notification.type",
+    "logging.event",
+    "performance.event",
+    "api.integration",
+    "message.queue",
+    "third.party",
+    "webhook.event",
+    "protocol.event",
+    "frontend.event",
+    "mobile.app",
+    "iot.event",
+    "platform.specific",
+    "industry.healthcare",
+    "industry.finance",
+    "industry.ecommerce",
+    "industry.education",
+    "industry.government",
+    "behavioral.prediction"
+    )
+
+
 class UniversalTranslator:
     """Translates integer codes to human-readable strings"""
 
     def __init__ (self):
         self._translation_map = self._build_translation_map ()
         self._category_map = self._build_category_map ()
+        # Sorted defined codes so get_range_info can count a range by bisection
+        self._defined_codes = sorted (self._translation_map)
+        # Dot-segment -> codes index used to prune find_codes_by_pattern
+        self._token_index: Dict [str,List [int]] = {}
+        for code,translation in self._translation_map.items ():
+            for token in set (translation.split ('.')):
+                self._token_index.setdefault (token,[]).append (code)
+
+        # Codes are small non-negative ints, so translations also live in a
+        # list indexed by code (None marks undefined codes)
+        self._dense_translations: List [Optional [str]] = [None]*(self._defined_codes [-1] + 1)
+        for code,translation in self._translation_map.items ():
+            self._dense_translations [code] = translation
+        self._dense_size = len (self._dense_translations)
+        # (code, translation) in code order, for substring scans
+        self._sorted_translations = [(code,self._translation_map [code]) for code in self._defined_codes]
+
+        # Context strings depend only on the code, so those of defined codes
+        # are built once, through the (possibly overridden) methods below
+        self._dense_formatted: List [Optional [str]] = [None]*self._dense_size
+        for code in self._defined_codes:
+            self._dense_formatted [code] = self._build_context (code)
 
     @staticmethod
     def _build_translation_map () -> Dict [int,str]:
         """Build the complete translation map from all enums"""
         translation_map = {}
 
-        # Get all IntEnum classes in this module
-        import sys
-        current_module = sys.modules [__name__]
-
-        for name,obj in vars (current_module).items ():
-            if isinstance (obj,type) and issubclass (obj,IntEnum) and obj != IntEnum:
-                for item in obj:
-                    # Convert enum name to readable format
-                    readable = item.name.lower ().replace ('_','.')
-                    translation_map [item.value] = readable
+        # Member names are already interned identifiers, but the readable forms
+        # are fresh strings; interning shares the ones repeated across classes
+        # ("error", "password.changed", ...) and makes equal keys pointer-equal
+        for code_class in _iter_code_classes ():
+            for member_name,code in _class_members (code_class):
+                # Convert enum name to readable format
+                translation_map [code] = sys.intern (member_name.translate (_NAME_TRANS))
 
         return translation_map
 
     @staticmethod
     def _build_category_map () -> Dict [int,str]:
         """Build category ranges for better context"""
-        return {
-            0:"universal.status",
-            50:"universal.priority",
-            70:"universal.severity",
-            90:"universal.result",
-            100:"system.event",
-            200:"user.event",
-            300:"workflow.event",
-            400:"error.event",
-            500:"communication.event",
-            600:"state.change",
-            700:"integration.event",
-            900:"system.metadata",
-            1000:"auth.role",
-            1100:"auth.permission",
-            1200:"auth.method",
-            1300:"auth.event",
-            1400:"auth.authorization",
-            1600:"auth.session",
-            1800:"auth.security",
-            2000:"container.type",
-            2200:"container.lifecycle",
-            2300:"container.orchestration",
-            2400:"container.resource",
-            2500:"container.management",
-            3000:"infrastructure.component",
-            3500:"deployment.type",
-            4000:"database.type",
-            4100:"database.operation",
-            4200:"storage.type",
-            4400:"data.operation",
-            4600:"cache.operation",
-            4800:"backup.operation",
-            5000:"ai.model",
-            5100:"ai.operation",
-            5200:"ai.training",
-            5400:"ai.agent",
-            5500:"ai.agent.event",
-            5600:"ai.learning",
-            5800:"neural.network",
-            6000:"business.process",
-            6100:"business.event",
-            6200:"workflow.orchestration",
-            6400:"decision.point",
-            6600:"business.rule",
-            6800:"domain.specific",
-            7000:"health.status",
-            7100:"monitoring.event",
-            7200:"metric.type",
-            7400:"alert.type",
-            7500:"notification.type",
-            7600:"logging.event",
-            7800:"performance.event",
-            8000:"api.integration",
-            8200:"message.queue",
-            8400:"third.party",
-            8600:"webhook.event",
-            8800:"protocol.event",
-            9000:"frontend.event",
-            9200:"mobile.app",
-            9400:"iot.event",
-            9600:"platform.specific",
-            10000:"industry.healthcare",
-            11000:"industry.finance",
-            12000:"industry.ecommerce",
-            13000:"industry.education",
-            14000:"industry.government",
-            15000:"behavioral.prediction"
-            }
+        return dict (zip (_CATEGORY_THRESHOLDS,_CATEGORY_LABELS))
 
     def translate_code (self,code_to_be_translated: int) -> str:
         """Translate an integer code to its string representation"""
+        if isinstance (code_to_be_translated,int):
+            if 0 <= code_to_be_translated < self._dense_size:
+                translation = self._dense_translations [code_to_be_translated]
+                if translation is not None:
+                    return translation
+            return f"unknown.code.{code_to_be_translated}"
+        # Anything else (2.0 or None from decoded payloads) is looked up as before
         return self._translation_map.get (code_to_be_translated,f"unknown.code.{code_to_be_translated}")
 
     def get_category (self,code_in_category: int) -> str:
         """Get the category for a code based on its range"""
-        for threshold in sorted (self._category_map.keys (),reverse=True):
-            if code_in_category >= threshold:
-                return self._category_map [threshold]
-        return "unknown.category"
+        index = bisect_right (_CATEGORY_THRESHOLDS,code_in_category) - 1
+        return _CATEGORY_LABELS [index] if index >= 0 else "unknown.category"
 
     def format_code_with_context (self,context_of_code: int) -> str:
         """Format code with its translation and category"""
+        if isinstance (context_of_code,int) and 0 <= context_of_code < self._dense_size:
+            formatted = self._dense_formatted [context_of_code]
+            if formatted is not None:
+                return formatted
+        return self._build_context (context_of_code)
+
+    def _build_context (self,context_of_code: int) -> str:
         returned_translation_from_translate_code = self.translate_code (context_of_code)
         category = self.get_category (context_of_code)
         return f"{context_of_code}({returned_translation_from_translate_code}) [{category}]"
@@ -3182,12 +3373,9 @@ class UniversalTranslator:
         """Check if a code is defined in the system"""
         return code_to_be_checked in self._translation_map
 
-    def get_range_info (self,start: int,end: int) -> Dict [str,int]:
+    def get_range_info (self,start: int,end: int) -> Dict [str,float]:
         """Get statistics about codes in a range"""
-        defined = sum (
-            1 for code_in_range in range (start,end + 1)
-            if code_in_range in self._translation_map
-            )
+        defined = bisect_right (self._defined_codes,end) - bisect_left (self._defined_codes,start)
         return {
             "total":end - start + 1,
             "defined":defined,
@@ -3196,15 +3384,70 @@ class UniversalTranslator:
             }
 
     def find_codes_by_pattern (self,pattern: str) -> List [Tuple [int,str]]:
-        """Find all codes whose translation contains the pattern"""
+        """Find all codes whose translation contains the pattern, ordered by code"""
         pattern_lower = pattern.lower ()
-        return [(code_used_for_map_translation,map_translation)
-                for code_used_for_map_translation,map_translation in self._translation_map.items ()
-                if pattern_lower in map_translation]
+        if '.' not in pattern_lower:
+            # A pattern without dots can only match inside one segment, so scan
+            # the distinct segments instead of every translation
+            return self._codes_in_order (self._codes_with_token (lambda token:pattern_lower in token))
+
+        # A dotted pattern spans segments: its inner pieces are whole segments,
+        # the first ends a segment and the last starts one. Each piece narrows
+        # the candidates; the substring test then confirms the match
+        pieces = pattern_lower.split ('.')
+        candidates = None
+        for index,piece in enumerate (pieces):
+            if index == 0:
+                if not piece:
+                    continue
+                codes = self._codes_with_token (lambda token:token.endswith (piece))
+            elif index == len (pieces) - 1:
+                if not piece:
+                    continue
+                codes = self._codes_with_token (lambda token:token.startswith (piece))
+            else:
+                codes = set (self._token_index.get (piece,()))
+            candidates = codes if candidates is None else candidates & codes
+            if not candidates:
+                return []
+
+        if candidates is None:
+            # Only dots: no segment to index by
+            return [(code,translation) for code,translation in self._sorted_translations
+                    if pattern_lower in translation]
+        return [(code,translation) for code,translation in self._codes_in_order (candidates)
+                if pattern_lower in translation]
 
+    def _codes_with_token (self,match: Callable [[str],bool]) -> set:
+        """Codes having a segment accepted by match"""
+        matched_codes = set ()
+        for token,token_codes in self._token_index.items ():
+            if match (token):
+                matched_codes.update (token_codes)
+        return matched_codes
 
-# Create a global translator instance
-universal_translator = UniversalTranslator ()
+    def _codes_in_order (self,codes) -> List [Tuple [int,str]]:
+        return [(code,self._translation_map [code]) for code in sorted (codes)]
+
+
+# The global translator is built on first use, so importing the module for
+# its code classes does not pay for the translation and category maps
+_universal_translator = None
+
+
+def get_universal_translator () -> UniversalTranslator:
+    """Return the global translator instance, creating it on first call"""
+    global _universal_translator
+    if _universal_translator is None:
+        _universal_translator = UniversalTranslator ()
+    return _universal_translator
+
+
+def __getattr__ (name: str):
+    """Resolve ``universal_translator`` lazily (PEP 562)"""
+    if name == "universal_translator":
+        return get_universal_translator ()
+    raise AttributeError (f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
@@ -3230,38 +3473,173 @@ class CodeMigration:
     @classmethod
     def bulk_migrate (cls,old_codes: List [int]) -> List [int]:
         """Migrate a List of old codes"""
-        return [cls.migrate_code (c) for c in old_codes]
+        get = cls.OLD_TO_NEW_MAP.get
+        return [get (c,c) for c in old_codes]
+
+    @classmethod
+    def bulk_migrate_array (cls,old_codes):
+        """
+        Migrate a large batch of codes in one vectorized pass.
+
+        Takes any int array-like and returns a numpy int64 array. Requires the
+        optional numpy dependency (``pip install universal-integer-system[fast]``).
+        Codes without a mapping are passed through unchanged, as in migrate_code.
+        """
+        import numpy as np
+
+        codes = np.asarray (old_codes,dtype=np.int64)
+        old_sorted,new_sorted = cls._migration_arrays ()
+        if old_sorted.size == 0:
+            return codes.copy ()
+
+        # Binary search each code in the sorted old codes; a hit is a mapping
+        index = np.minimum (np.searchsorted (old_sorted,codes),old_sorted.size - 1)
+        return np.where (old_sorted [index] == codes,new_sorted [index],codes)
+
+    @classmethod
+    def _migration_arrays (cls):
+        """Sorted old codes and their new codes as numpy arrays, built on first use"""
+        arrays = cls.__dict__.get ("_migration_arrays_cache")
+        if arrays is None:
+            import numpy as np
+
+            old_codes = sorted (cls.OLD_TO_NEW_MAP)
+            arrays = (
+                np.array (old_codes,dtype=np.int64),
+                np.array ([cls.OLD_TO_NEW_MAP [c] for c in old_codes],dtype=np.int64)
+                )
+            cls._migration_arrays_cache = arrays
+        return arrays
 
     @classmethod
     def generate_migration_report (cls) -> Dict [str,Any]:
         """Generate a report of the migration mappings"""
         return {
             "total_mappings":len (cls.OLD_TO_NEW_MAP),
-            "old_ranges":cls._get_ranges (List(cls.OLD_TO_NEW_MAP.keys ())),
-            "new_ranges":cls._get_ranges (List(cls.OLD_TO_NEW_MAP.values ())),
+            "old_ranges":cls._get_ranges (cls.OLD_TO_NEW_MAP.keys ()),
+            "new_ranges":cls._get_ranges (cls.OLD_TO_NEW_MAP.values ()),
             "mappings":cls.OLD_TO_NEW_MAP
             }
 
     @staticmethod
-    def _get_ranges (codes: List [int]) -> List [Tuple [int,int]]:
-        """Get continuous ranges from a List of codes"""
-        if not codes:
-            return []
-
-        sorted_codes = sorted (codes)
+    def _get_ranges (codes: Iterable [int]) -> List [Tuple [int,int]]:
+        """Get continuous ranges from an iterable of codes"""
+        # Consecutive codes share the same code - position, so each group is a run
         ranges = []
-        start = sorted_codes [0]
-        end = sorted_codes [0]
+        for _,run in groupby (enumerate (sorted (codes)),lambda pair:pair [1] - pair [0]):
+            start = end = next (run) [1]
+            for _,end in run:
+                pass
+            ranges.append ((start,end))
+        return ranges
 
-        for some_sorted_code in sorted_codes [1:]:
-            if some_sorted_code == end + 1:
-                end = some_sorted_code
-            else:
-                ranges.append ((start,end))
-                start = end = some_sorted_code
 
-        ranges.append ((start,end))
-        return ranges
+# =============================================================================
+# CODE EXPORTS
+# =============================================================================
+
+def _class_members (code_class) -> List [Tuple [str,int]]:
+    """(name, value) pairs of a code class in definition order"""
+    if issubclass (code_class,CodeTable):
+        return [(member_name,code) for code,member_name in code_class.NAMES.items ()]
+    return [(item.name,item.value) for item in code_class]
+
+
+def export_int_constants (code_class,namespace: Optional [Dict [str,Any]] = None) -> Dict [str,int]:
+    """
+    Copy a code class into plain ``int`` constants, optionally into ``namespace``.
+
+    Numba cannot index arrays with IntEnum members and can mis-type them in
+    arithmetic, but it freezes plain-int module globals as literals. Numeric
+    kernels should bind the codes they use at module level instead of
+    importing the enum:
+
+        export_int_constants (MetricType,globals ())
+
+        @njit
+        def count_response_times (codes):
+            return (codes == RESPONSE_TIME).sum ()
+    """
+    constants = {member_name:code for member_name,code in _class_members (code_class)}
+    if namespace is not None:
+        namespace.update (constants)
+    return constants
+
+
+def render_cython_declarations () -> str:
+    """
+    Render every code class as Cython ``cdef enum`` declarations.
+
+    C enum members share a single namespace, so each member is prefixed with
+    its class name (``BusinessEvent_ORDER_PLACED``). The output is checked in
+    as ``universal_codes.pxd``; regenerate it after adding codes with:
+
+        python -c "import universal_integer_system as u; print (u.render_cython_declarations (), end='')" > universal_codes.pxd
+    """
+    lines = [
+        "# Generated by universal_integer_system.render_cython_declarations () - do not edit",
+        "# cimport these from Cython extensions to use the codes as plain C ints",
+        ]
+    for code_class in _iter_code_classes ():
+        lines.append ("")
+        lines.append (f"cdef enum {code_class.__name__}:")
+        for member_name,code in _class_members (code_class):
+            lines.append (f"    {code_class.__name__}_{member_name} = {code}")
+    return "\n".join (lines) + "\n"
+
+
+# =============================================================================
+# EVENT DISPATCH
+# =============================================================================
+
+def dispatch_on (code_class):
+    """
+    Class decorator that routes integer codes to ``handle_<code>`` methods.
+
+    The routing table is built once at decoration time, so ``dispatch`` is a
+    single dict lookup per event. Codes without a handler go to
+    ``handle_default(code, ...)`` when the class defines one; otherwise a
+    LookupError is raised. Handler codes that are not part of ``code_class``
+    are rejected with ValueError when the class is decorated.
+
+    Example:
+        @dispatch_on (BusinessEvent)
+        class OrderHandlers:
+            def handle_6120 (self,payload): ...  # ORDER_PLACED
+
+        OrderHandlers ().dispatch (BusinessEvent.ORDER_PLACED,payload)
+    """
+    if issubclass (code_class,CodeTable):
+        known_codes = set (code_class.NAMES)
+    else:
+        known_codes = {item.value for item in code_class}
+
+    def decorate (cls):
+        table = {}
+        for attr_name in dir (cls):
+            suffix = attr_name [len ("handle_"):]
+            if not attr_name.startswith ("handle_") or not suffix.isdigit ():
+                continue
+            code = int (suffix)
+            if code not in known_codes:
+                raise ValueError (f"{cls.__name__}.{attr_name} does not match a {code_class.__name__} code")
+            table [code] = getattr (cls,attr_name)
+
+        get_handler = table.get
+        default = getattr (cls,"handle_default",None)
+
+        def dispatch (self,code: int,*args,**kwargs):
+            handler = get_handler (code)
+            if handler is not None:
+                return handler (self,*args,**kwargs)
+            if default is not None:
+                return default (self,code,*args,**kwargs)
+            raise LookupError (f"{cls.__name__} has no handler for code {code}")
+
+        cls.dispatch = dispatch
+        return cls
+
+    return decorate
 
 
 # =============================================================================
@@ -3269,6 +3647,8 @@ class CodeMigration:
 # =============================================================================
 
 if __name__ == "__main__":
+    universal_translator = get_universal_translator ()
+
     # Example usage
     print ("Universal Integer Code System - Examples")
     print ("="*50)
@@ -7,6 +7,8 @@ Uses Pydantic V2 dataclasses for validation without BaseSettings bloat.
 """
 
 import os
+import sys
+import time
 import uuid
 from datetime import datetime
 from typing import Optional,Dict,Any,List
@@ -30,6 +32,29 @@ def _get_pulsar_url ():
         )
 
 
+def _coarse_clock (factory):
+    """
+    Wrap a datetime factory so it is called at most once per millisecond.
+
+    Used for created_at/updated_at defaults, where configs built in the same
+    millisecond can share one timestamp instead of each reading the clock.
+    """
+    cache = [0.0,None]
+
+    def now () -> datetime:
+        tick = time.monotonic ()
+        if tick - cache [0] > 0.001 or cache [1] is None:
+            cache [0] = tick
+            cache [1] = factory ()
+        return cache [1]
+
+    return now
+
+
+_coarse_utcnow = _coarse_clock (datetime.utcnow)
+_coarse_now = _coarse_clock (datetime.now)
+
+
 @dataclass
 class PulsarConfig:
     """Pulsar messaging configuration - unified for all containers"""
@@ -43,8 +68,8 @@ class PulsarConfig:
     environment: int = field (default_factory=lambda:int (os.getenv ('CONTAINER_ENV','0')))
     version: str = "1.0.0"
     # Lifecycle tracking
-    created_at: datetime = field (default_factory=datetime.utcnow)
-    updated_at: datetime = field (default_factory=datetime.utcnow)
+    created_at: datetime = field (default_factory=_coarse_utcnow)
+    updated_at: datetime = field (default_factory=_coarse_utcnow)
     status: int = 0  # From UniversalStatus
     # Autonomous system essentials
     priority: int = 60  # NORMAL priority
@@ -65,10 +90,20 @@ class PulsarConfig:
     consumer_subscription_name: str = field (
         default_factory=lambda:os.getenv ('PULSAR_SUBSCRIPTION','container-subscription')
         )
+    # Producer settings - a pulsar.CompressionType name (NONE, LZ4, ZLib, ZSTD, SNAPPY)
+    producer_compression: str = field (default_factory=lambda:os.getenv ('PULSAR_COMPRESSION','ZSTD'))
+
+    def __post_init__ (self):
+        # Topic names are rebuilt on every publish, so memoize them per config
+        self._topic_prefix = f"persistent://{self.tenant}/{self.namespace}/"
+        self._topic_cache: Dict [str,str] = {}
 
     def get_topic_name (self,topic: str) -> str:
         """Generate fully qualified topic name"""
-        return f"persistent://{self.tenant}/{self.namespace}/{topic}"
+        name = self._topic_cache.get (topic)
+        if name is None:
+            name = self._topic_cache [topic] = sys.intern (self._topic_prefix + topic)
+        return name
 
 
 @dataclass
@@ -174,8 +209,8 @@ class ContainerConsumerConfig:
     tenant: str
     namespace: str
     pulsar_url: str = "pulsar://localhost:6650"
-    created_at: datetime = field (default_factory=datetime.now)
-    updated_at: datetime = field (default_factory=datetime.now)
+    created_at: datetime = field (default_factory=_coarse_now)
+    updated_at: datetime = field (default_factory=_coarse_now)
     # Additional topics to listen to (beyond own container topic)
     additional_topics: List [str] = None
 
@@ -195,8 +230,11 @@ class ContainerProducerConfig:
         default_factory=lambda:os.getenv ('PULSAR_BATCHING','true').lower () == 'true'
         )
     producer_batch_size: int = field (default_factory=lambda:int (os.getenv ('PULSAR_BATCH_SIZE','1000')))
-    created_at: datetime = field (default_factory=datetime.now)
-    updated_at: datetime = field (default_factory=datetime.now)
+    # pulsar.CompressionType name; NONE suits producers that only send a few
+    # tiny messages per batch window, where compression cannot pay off
+    producer_compression: str = field (default_factory=lambda:os.getenv ('PULSAR_COMPRESSION','ZSTD'))
+    created_at: datetime = field (default_factory=_coarse_now)
+    updated_at: datetime = field (default_factory=_coarse_now)
 
     # Simple metadata
     auto_add_timestamp: bool = True
@@ -1,53 +1,79 @@
 # universal_integer_system/src/transports/health_server.py
 from aiohttp import web
-import json
+import orjson
+from prometheus_client import CONTENT_TYPE_LATEST,generate_latest
 from structlog import get_logger
 
 logger = get_logger (__name__)
 
 
+def _json_response (payload,status=200) -> web.Response:
+    """JSON response serialized with orjson"""
+    return web.Response (body=orjson.dumps (payload),status=status,content_type='application/json')
+
+
+def _wants_exposition (request) -> bool:
+    """Whether the client asked for the Prometheus text format, as scrapers do"""
+    accept = request.headers.get ('Accept','')
+    return 'text/plain' in accept or 'application/openmetrics-text' in accept
+
 
 class HealthServer:
-    """HTTP server for health checks and readiness probes"""
+    """
+    HTTP server for health checks and readiness probes
+
+    /metrics answers Prometheus scrapers (Accept: text/plain or openmetrics)
+    with the exposition format and every other client with the JSON summary;
+    /metrics/prom always returns the exposition format.
+    """
 
     def __init__ (self,system,port=8080):
         self.system = system
         self.port = port
         self.app = web.Application ()
+        self._runner = None
         self.setup_routes ()
 
     def setup_routes (self):
         self.app.router.add_get ('/health',self.health)
         self.app.router.add_get ('/ready',self.ready)
         self.app.router.add_get ('/metrics',self.metrics)
+        self.app.router.add_get ('/metrics/prom',self.prometheus_metrics)
 
     async def health (self,request):
         """Liveness probe endpoint"""
         health = await self.system.health_check ()
         status_code = 200 if health ['status'] == 'healthy' else 503
-        return web.json_response (health,status=status_code)
+        return _json_response (health,status=status_code)
 
     async def ready (self,request):
         """Readiness probe endpoint"""
         if self.system._configured and self.system._running:
-            return web.json_response ({"ready":True},status=200)
-        return web.json_response ({"ready":False},status=503)
+            return _json_response ({"ready":True},status=200)
+        return _json_response ({"ready":False},status=503)
+
+    async def prometheus_metrics (self,request):
+        """Prometheus scrape endpoint, served from this event loop"""
+        return web.Response (body=generate_latest (),headers={'Content-Type':CONTENT_TYPE_LATEST})
 
     async def metrics (self,request):
-        """Metrics endpoint (if not using Prometheus port)"""
-        # This could return custom metrics in JSON format
-        return web.json_response (
+        """Prometheus exposition for scrapers, otherwise the message summary as JSON"""
+        if _wants_exposition (request):
+            return await self.prometheus_metrics (request)
+        return _json_response (
             {
-                "messages_sent":self.system.metrics.messages_sent._value.sum (),
-                "messages_received":self.system.metrics.messages_received._value.sum (),
+                "messages_sent":self.system.metrics.sent_total,
+                "messages_received":self.system.metrics.received_total,
                 "active_producers":len (self.system._manager._producers),
                 "active_consumers":len (self.system._consumers)
                 }
             )
 
     async def start (self):
-        """Start health server"""
-        runner = web.AppRunner (self.app)
+        """Start health server; a no-op once it is running"""
+        if self._runner is not None:
+            return
+        runner = self._runner = web.AppRunner (self.app)
         await runner.setup ()
         site = web.TCPSite (runner,'0.0.0.0',self.port)
         await site.start ()
@@ -1,6 +1,6 @@
 # universal_integer_system/src/transports/metrics.py
 from prometheus_client import Counter,Histogram,Gauge,Info
-from prometheus_client import start_http_server
+import threading
 import time
 from functools import wraps
 import structlog
@@ -8,6 +8,11 @@ import structlog
 
 logger = structlog.get_logger ()
 
+# Cap on cached label children. Label values come from the integer code
+# system and configured topics, so the set is finite in practice; past the
+# cap children are still returned, just resolved through .labels() each time
+_MAX_CACHED_CHILDREN = 10000
+
 
 class Metrics:
     """Comprehensive metrics for the Universal Integer System"""
@@ -37,6 +42,11 @@ class Metrics:
             'uis_active_connections',
             'Current number of active Pulsar connections'
             )
+        self.connection_latency_seconds = Histogram (
+            'uis_connection_latency_seconds',
+            'Time taken to create a Pulsar client',
+            buckets=(0.01,0.05,0.1,0.25,0.5,1.0,2.5,5.0,10.0)
+            )
 
         # Message Metrics
         self.messages_sent = Counter (
@@ -49,6 +59,18 @@ class Metrics:
             'Total messages received',
             ['code','topic','status']
             )
+        # Plain running totals of the two counters above, for cheap reads.
+        # send_async callbacks update them from the client's I/O threads
+        self.sent_total = 0
+        self.received_total = 0
+        self._totals_lock = threading.Lock ()
+        # (metric, label values) -> labelled child, see child()
+        self._children = {}
+        self.messages_processed = Counter (
+            'uis_messages_processed_total',
+            'Messages handled and acknowledged by container consumers',
+            ['container']
+            )
         self.message_processing_duration = Histogram (
             'uis_message_processing_duration_seconds',
             'Time spent processing messages',
@@ -113,24 +135,48 @@ class Metrics:
             ['component']
             )
 
-    def start_server (self):
-        """Start Prometheus metrics server"""
-        start_http_server (self.port)
-        logger.info (f"📊 Metrics server started on port {self.port}")
+    def record_sent (self,code: str,topic: str,status: str):
+        """Count a sent message"""
+        with self._totals_lock:
+            self.sent_total += 1
+        self.child (self.messages_sent,code,topic,status).inc ()
+
+    def record_received (self,code: str,topic: str,status: str):
+        """Count a received message"""
+        with self._totals_lock:
+            self.received_total += 1
+        self.child (self.messages_received,code,topic,status).inc ()
+
+    def child (self,metric,*label_values: str):
+        """
+        Labelled child of one of these metrics, resolved once per label values
+
+        Values are positional, in the metric's labelnames order. Per-message
+        paths use this instead of .labels(), which validates on every call.
+        """
+        key = (metric,label_values)
+        child = self._children.get (key)
+        if child is None:
+            child = metric.labels (*label_values)
+            if len (self._children) < _MAX_CACHED_CHILDREN:
+                self._children [key] = child
+        return child
 
     def track_duration (self,metric: Histogram,**labels):
         """Decorator to track operation duration"""
 
+        # Resolve the labelled child once, not on every call
+        observe = metric.labels (**labels).observe
+
         def decorator (func):
             @wraps (func)
             def wrapper (*args,**kwargs):
-                start = time.time ()
+                start = time.perf_counter ()
                 try:
                     result = func (*args,**kwargs)
                     return result
                 finally:
-                    duration = time.time () - start
-                    metric.labels (**labels).observe (duration)
+                    observe (time.perf_counter () - start)
 
             return wrapper
 
@@ -1,8 +1,10 @@
 # universal_integer_system/src/transports/pulsar_connection_manager.py
 import asyncio
+import atexit
+import os
 import threading
-from datetime import datetime
-from typing import Optional
+import time
+from typing import Dict,Optional,Tuple
 import pulsar
 import structlog
 from metrics import Metrics
@@ -11,10 +13,60 @@ from health_server import HealthServer
 
 logger = structlog.get_logger ()
 
+# Process-wide clients keyed by (service_url, auth_token). Each pulsar.Client
+# owns its own I/O threads and broker connections, so container producers and
+# consumers share one per broker instead of creating their own.
+_shared_clients: Dict [Tuple [str,Optional [str]],pulsar.Client] = {}
+_shared_clients_lock = threading.Lock ()
+
+
+def get_shared_client (
+        service_url: str,
+        auth_token: Optional [str] = None,
+        metrics: Optional [Metrics] = None
+        ) -> pulsar.Client:
+    """
+    Get the process-wide client for a broker, creating it on first use
+
+    When metrics is given, the creation time is observed in
+    connection_latency_seconds; reusing an existing client records nothing.
+    """
+    key = (service_url,auth_token)
+    client = _shared_clients.get (key)
+    if client is not None:
+        return client
+    with _shared_clients_lock:
+        client = _shared_clients.get (key)
+        if client is None:
+            start_time = time.monotonic_ns ()
+            client = _shared_clients [key] = pulsar.Client (
+                service_url=service_url,
+                authentication=pulsar.AuthenticationToken (auth_token) if auth_token else None,
+                io_threads=max (2,(os.cpu_count () or 2)//2),
+                message_listener_threads=4,
+                operation_timeout_seconds=30
+                )
+            if metrics is not None:
+                metrics.connection_latency_seconds.observe ((time.monotonic_ns () - start_time)/1e9)
+        return client
+
+
+@atexit.register
+def _close_shared_clients ():
+    """Close the shared clients at interpreter exit"""
+    with _shared_clients_lock:
+        for client in _shared_clients.values ():
+            client.close ()
+        _shared_clients.clear ()
+
 
 class PulsarConnectionManager:
     """Production-ready connection management with metrics and monitoring"""
 
+    # How long a health verdict is reused; failures expire fast to spot recovery
+    HEALTHY_TTL_SECONDS = 5.0
+    UNHEALTHY_TTL_SECONDS = 0.5
+
     def __init__ (self,config,metrics: Optional [Metrics] = None):
         self.config = config
         self._client: Optional [pulsar.Client] = None
@@ -23,9 +75,30 @@ class PulsarConnectionManager:
         self._health_status = "unknown"
         self._last_error = None
         self._health_server = HealthServer (self)
+        # Labelled metric children, resolved once instead of per event
+        self._m_conn_ok = self.metrics.connections_total.labels (status='success')
+        self._m_conn_fail = self.metrics.connections_total.labels (status='failed')
+        self._m_err_conn_create = self.metrics.errors.labels (type='connection',operation='create')
+        self._m_hc_healthy = self.metrics.health_checks.labels (component='connection',status='healthy')
+        self._m_hc_unhealthy = self.metrics.health_checks.labels (component='connection',status='unhealthy')
+        self._m_hc_last = self.metrics.last_health_check.labels (component='connection')
+        # (expires_at, result) from the last broker probe
+        self._hc_cache: Optional [Tuple [float,dict]] = None
+        self._hc_lock = threading.Lock ()
+        # Fixed context is bound once rather than passed on every log call
+        self.log = logger.bind (
+            component="connection",
+            url=config.pulsar_url,
+            tenant=config.tenant,
+            namespace=config.namespace
+            )
 
     def get_client (self) -> pulsar.Client:
         """Get or create client with automatic reconnection and metrics"""
+        # Double-checked: once connected, callers never touch the lock
+        client = self._client
+        if client is not None:
+            return client
         with self._lock:
             if self._client is None:
                 self._client = self._create_client ()
@@ -33,30 +106,20 @@ class PulsarConnectionManager:
 
     def _create_client (self) -> pulsar.Client:
         """Create client with production-ready settings"""
-        start_time = datetime.time ()
+        start_time = time.monotonic_ns ()
 
         try:
-            logger.info (
-                "Creating Pulsar client",
-                url=self.config.pulsar_url,
-                tenant=self.config.tenant,
-                namespace=self.config.namespace
-                )
+            self.log.info ("Creating Pulsar client")
 
-            client = pulsar.Client (
-                service_url=self.config.pulsar_url,authentication=self._get_auth (),message_listener_threads=4
-                )
+            # The broker's process-wide client, shared with every other manager;
+            # connection latency is recorded only if this call creates it
+            client = get_shared_client (self.config.pulsar_url,self.config.auth_token,self.metrics)
 
             # Update metrics
-            connection_time = datetime.now ().timestamp ()
-            self.metrics.connections_total.labels (status='success').inc ()
+            self._m_conn_ok.inc ()
             self.metrics.active_connections.inc ()
 
-            logger.info (
-                "Pulsar connection established",
-                connection_time=connection_time,
-                url=self.config.pulsar_url
-                )
+            self.log.info ("Pulsar connection established")
 
             self._health_status = "healthy"
             self._last_error = None
@@ -64,15 +127,14 @@ class PulsarConnectionManager:
             return client
 
         except Exception as e:
-            connection_time = datetime.now().timestamp()
-            self.metrics.connections_total.labels (status='failed').inc ()
-            self.metrics.errors.labels (type='connection',operation='create').inc ()
+            connection_time = (time.monotonic_ns () - start_time)/1e9
+            self._m_conn_fail.inc ()
+            self._m_err_conn_create.inc ()
 
-            logger.error (
+            self.log.error (
                 "Failed to establish Pulsar connection",
                 error=str (e),
-                connection_time=connection_time,
-                url=self.config.pulsar_url
+                connection_time=connection_time
                 )
 
             self._health_status = "unhealthy"
@@ -80,20 +142,32 @@ class PulsarConnectionManager:
             raise
 
     def health_check (self) -> dict:
-        """Perform health check on connection"""
+        """Perform health check on connection, reusing a recent verdict"""
+        cached = self._hc_cache
+        if cached is not None and time.monotonic () < cached [0]:
+            return cached [1]
+
+        # Single flight: one thread probes the broker, the rest wait for it
+        with self._hc_lock:
+            cached = self._hc_cache
+            if cached is not None and time.monotonic () < cached [0]:
+                return cached [1]
+
+            result = self._probe_health ()
+            ttl = self.HEALTHY_TTL_SECONDS if result ["status"] == "healthy" else self.UNHEALTHY_TTL_SECONDS
+            self._hc_cache = (time.monotonic () + ttl,result)
+            return result
+
+    def _probe_health (self) -> dict:
+        """Check the connection against the broker"""
         try:
             if self._client:
                 # Try a simple operation
                 self._client.get_stats ()
 
 
-            self.metrics.health_checks.labels (
-                component='connection',
-                status='healthy'
-                ).inc ()
-            self.metrics.last_health_check.labels (
-                component='connection'
-                ).set (time.time ())
+            self._m_hc_healthy.inc ()
+            self._m_hc_last.set (time.time ())
 
             return {
                 "status":"healthy",
@@ -104,10 +178,7 @@ class PulsarConnectionManager:
                 }
 
         except Exception as e:
-            self.metrics.health_checks.labels (
-                component='connection',
-                status='unhealthy'
-                ).inc ()
+            self._m_hc_unhealthy.inc ()
 
             return {
                 "status":"unhealthy",
@@ -116,9 +187,8 @@ class PulsarConnectionManager:
                 }
 
     def close (self):
-        """Closes the shared connection with metrics"""
+        """Release the shared connection with metrics; the client closes at exit"""
         if self._client:
-            self._client.close ()
             self._client = None
             self.metrics.active_connections.dec ()
-            logger.info ("Pulsar connection closed")
\ No newline at end of file
+            self.log.info ("Pulsar connection closed")
\ No newline at end of file
@@ -6,25 +6,57 @@ Pure transport layer - just receives JSON messages from topics.
 No knowledge of integer codes or business logic.
 """
 
-import json
+import os
+import random
+import threading
 import time
-from typing import Dict,Any,Optional,List,Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict,Any,Optional,List,Callable,Tuple
 from dataclasses import dataclass
 
+import orjson
 import pulsar
+import structlog
 
 from config import ContainerConsumerConfig
+from metrics import Metrics
+from pulsar_connection_manager import get_shared_client
 
+# Subscribe retry backoff: starts at 10 ms, doubles per attempt up to 1 s
+_BACKOFF_INITIAL_S = 0.01
+_BACKOFF_MAX_S = 1.0
+
+logger = structlog.get_logger ()
 
-class ContainerConsumer:
-    """Generic consumer that works for any container type - pure transport"""
 
-    def __init__ (self,config: ContainerConsumerConfig,message_handler: Callable [[Dict [str,Any]],None]):
+class ContainerConsumer:
+    """
+    Generic consumer that works for any container type - pure transport
+
+    Handlers from every consumer in the process run on one shared, bounded
+    thread pool, so message_handler should return quickly; IO-heavy handlers
+    should hand work off to their own queue. When the pool's backlog is full,
+    new messages are negatively acknowledged and Pulsar redelivers them later.
+    """
+
+    _HANDLER_POOL = ThreadPoolExecutor (max_workers=max (4,os.cpu_count () or 1),thread_name_prefix="container-handler")
+    # Messages allowed to be queued or running on the pool at once
+    _HANDLER_SLOTS = threading.BoundedSemaphore (1000)
+
+    def __init__ (
+            self,
+            config: ContainerConsumerConfig,
+            message_handler: Callable [[Dict [str,Any]],None],
+            metrics: Optional [Metrics] = None
+            ):
         self.config = config
         self.message_handler = message_handler
         self.client = None
         self.consumer = None
-        self.running = False
+        self.running = threading.Event ()
+        self.log = logger.bind (component="container_consumer",container=config.container_name)
+        # Released once per handled message (and by stop) to wake start_processing
+        self._processed = threading.Semaphore (0)
 
         # Build topic list - each container gets its own topic + optional additional topics
         self.topics = [f"{config.tenant}://{config.namespace}/{config.container_name}"]
@@ -35,112 +67,191 @@ class ContainerConsumer:
                     full_topic = f"{config.tenant}://{config.namespace}/{topic}"
                 else:
                     full_topic = topic
-                self.topics.append (full_topic)
-
-        # Simple statistics
-        self.stats = {
-            'total_processed':0,
-            'errors':0
-            }
+                if full_topic not in self.topics:
+                    self.topics.append (full_topic)
+
+        # Simple statistics as plain ints; handlers of one consumer may run on
+        # several pool threads at once, hence the lock
+        self._total_processed = 0
+        self._errors = 0
+        self._rejected = 0
+        self._stats_lock = threading.Lock ()
+        # The client can only pause the listener after subscribe() returns, so
+        # messages may arrive before start_processing. They are held here and
+        # replayed once running is set; _held_lock orders that hand-over.
+        # Messages held when the consumer closes were never acked, so the
+        # broker redelivers them
+        self._held: List [Tuple [pulsar.Consumer,pulsar.Message]] = []
+        self._held_lock = threading.Lock ()
+        # Optional Prometheus counter for processed messages
+        self._m_processed = metrics.messages_processed.labels (container=config.container_name) if metrics else None
 
     def connect (self):
         """Connect to Pulsar and subscribe"""
         if self.client is None:
-            self.client = pulsar.Client (self.config.pulsar_url)
-
-            # Subscribe to topics - FIXED: Use official Pulsar API
-            if len (self.topics) == 1:
-                # Single topic subscription
-                self.consumer = self.client.subscribe (
-                    topic=self.topics [0],
+            client = get_shared_client (self.config.pulsar_url)
+            self.consumer = self._subscribe (client)
+            self.client = client
+
+            # Messages are delivered by the client's listener thread; pause it
+            # until start_processing. Anything delivered before the pause takes
+            # effect is held by _on_message rather than handled early
+            self.consumer.pause_message_listener ()
+
+            self.log.info ("Consumer subscribed",topics=self.topics)
+
+    def _subscribe (self,client: pulsar.Client) -> pulsar.Consumer:
+        """Subscribe, retrying transient failures with jittered exponential backoff"""
+        backoff = _BACKOFF_INITIAL_S
+        for attempt in range (self.config.max_retries + 1):
+            try:
+                # Subscribe to topics - FIXED: Use official Pulsar API
+                # A deep receiver queue lets the client prefetch while handlers run,
+                # so the message listener is fed from local memory rather than a
+                # broker round trip per message; while the listener is paused
+                # the queue fills up to its size and then stops fetching. Acks
+                # stay per message: Shared subscriptions reject cumulative acks,
+                # and the client groups individual acks into one broker request
+                # per ~100 ms
+                # Single and multiple topics both subscribe with the list
+                return client.subscribe (
+                    topic=self.topics,
                     subscription_name=self.config.subscription_name,
                     consumer_type=pulsar.ConsumerType.Shared,
-                    consumer_name=f"{self.config.container_name}_consumer"
+                    consumer_name=f"{self.config.container_name}_consumer",
+                    receiver_queue_size=10000,
+                    max_total_receiver_queue_size_across_partitions=50000,
+                    message_listener=self._on_message
                     )
-            else:
-                # Multi-topic subscription - CONFIRMED: Official API supports this
-                self.consumer = self.client.subscribe (
-                    topic=self.topics,  # Pass list directly to subscribe()
-                    subscription_name=self.config.subscription_name,
-                    consumer_type=pulsar.ConsumerType.Shared,
-                    consumer_name=f"{self.config.container_name}_consumer"
-                    )
-
-            print (f"✅ {self.config.container_name} consumer subscribed to {len (self.topics)} topics")
-            for topic in self.topics:
-                print (f"   📬 {topic}")
+            except pulsar.PulsarException as e:
+                if attempt == self.config.max_retries:
+                    raise
+                # First retry is almost immediate; jitter keeps consumers that
+                # failed together from retrying in lockstep
+                delay = backoff + random.uniform (0,backoff)
+                self.log.warning ("Subscribe failed, retrying",error=str (e),retry_in_ms=round (delay*1000))
+                time.sleep (delay)
+                backoff = min (_BACKOFF_MAX_S,backoff*2)
 
     def configure_schema (self,topic_name: str,schema_class):
         """Configure schema for a topic"""
         # Real implementation - Pulsar supports schemas
         if self.consumer and schema_class:
             # This would set up schema validation for the topic
-            print (f"📋 Configured schema {schema_class.__name__} for topic {topic_name}")
-
-    def start_processing (self,max_messages: Optional [int] = None):
-        """Start processing messages - pure transport"""
-        self.connect ()
-        self.running = True
-        processed = 0
-
-        print (f"🚀 {self.config.container_name} starting message processing...")
-
+            self.log.info ("Configured schema",schema=schema_class.__name__,topic=topic_name)
+
+    def _on_message (self,consumer,msg):
+        """Message listener - hands the message to the shared handler pool"""
+        if not self.running.is_set ():
+            with self._held_lock:
+                if not self.running.is_set ():
+                    self._held.append ((consumer,msg))
+                    return
+        self._submit (consumer,msg)
+
+    def _submit (self,consumer,msg):
+        if not self._HANDLER_SLOTS.acquire (blocking=False):
+            # Backpressure: let Pulsar redeliver once the pool catches up
+            consumer.negative_acknowledge (msg)
+            with self._stats_lock:
+                self._rejected += 1
+            return
         try:
-            while self.running:
-                try:
-                    # Receive message with timeout
-                    msg = self.consumer.receive (timeout_millis=1000)
+            self._HANDLER_POOL.submit (self._dispatch,consumer,msg)
+        except RuntimeError:
+            # Pool shut down at interpreter exit
+            self._HANDLER_SLOTS.release ()
+            consumer.negative_acknowledge (msg)
+
+    def _dispatch (self,consumer,msg):
+        """Parse, handle and acknowledge one message on a pool thread"""
+        try:
+            # Parse message data
+            message_data = orjson.loads (msg.data ())
+
+            # Call handler - no filtering, pass through
+            self.message_handler (message_data)
 
-                    try:
-                        # Parse message data
-                        message_data = json.loads (msg.data ().decode ('utf-8'))
+            # Acknowledge
+            consumer.acknowledge (msg)
 
-                        # Call handler - no filtering, pass through
-                        self.message_handler (message_data)
+            with self._stats_lock:
+                self._total_processed += 1
+            if self._m_processed is not None:
+                self._m_processed.inc ()
+            self._processed.release ()
 
-                        # Acknowledge
-                        self.consumer.acknowledge (msg)
+        except orjson.JSONDecodeError as e:
+            self.log.error ("JSON decode error",error=str (e))
+            consumer.negative_acknowledge (msg)
+            with self._stats_lock:
+                self._errors += 1
 
-                        self.stats ['total_processed'] += 1
-                        processed += 1
+        except Exception as e:
+            self.log.error ("Handler error",error=str (e))
+            consumer.negative_acknowledge (msg)
+            with self._stats_lock:
+                self._errors += 1
 
-                        if max_messages and processed >= max_messages:
-                            break
+        finally:
+            self._HANDLER_SLOTS.release ()
 
-                    except json.JSONDecodeError as e:
-                        print (f"❌ {self.config.container_name} JSON decode error: {e}")
-                        self.consumer.negative_acknowledge (msg)
-                        self.stats ['errors'] += 1
+    def start_processing (self,max_messages: Optional [int] = None):
+        """
+        Start processing messages - pure transport
 
-                    except Exception as e:
-                        print (f"❌ {self.config.container_name} handler error: {e}")
-                        self.consumer.negative_acknowledge (msg)
-                        self.stats ['errors'] += 1
+        Blocks until stop() is called or max_messages have been handled. The
+        listener pushes messages as they arrive, so an idle consumer sleeps
+        instead of polling.
+        """
+        self.connect ()
+        with self._held_lock:
+            self.running.set ()
+            held,self._held = self._held,[]
+        for consumer,msg in held:
+            self._submit (consumer,msg)
+        self.consumer.resume_message_listener ()
+        processed = 0
 
-                except pulsar.Timeout:
-                    # Normal timeout, continue
-                    continue
+        self.log.info ("Starting message processing")
 
-                except Exception as e:
-                    print (f"❌ {self.config.container_name} consumer error: {e}")
-                    time.sleep (1)  # Brief pause on errors
+        try:
+            while True:
+                self._processed.acquire ()
+                if not self.running.is_set ():
+                    break
+                processed += 1
+                if max_messages and processed >= max_messages:
+                    break
 
         except KeyboardInterrupt:
-            print (f"\n🛑 {self.config.container_name} stopping...")
+            self.log.info ("Stopping on interrupt")
 
         finally:
-            self.running = False
+            self.stop ()
             self.print_statistics ()
 
     def stop (self):
         """Stop processing"""
-        self.running = False
+        if self.running.is_set ():
+            self.running.clear ()
+            if self.consumer:
+                self.consumer.pause_message_listener ()
+            # Wake start_processing if it is waiting for the next message
+            self._processed.release ()
+
+    @property
+    def stats (self) -> Dict [str,int]:
+        """Processing statistics snapshot"""
+        return {
+            'total_processed':self._total_processed,
+            'errors':self._errors,
+            'rejected':self._rejected
+            }
 
     def print_statistics (self):
-        """Print simple processing statistics"""
-        print (f"📊 {self.config.container_name} statistics:")
-        print (f"   Processed: {self.stats ['total_processed']}")
-        print (f"   Errors: {self.stats ['errors']}")
+        """Log simple processing statistics"""
+        self.log.info ("Consumer statistics",**self.stats)
 
     def close (self):
         """Clean shutdown"""
@@ -148,17 +259,19 @@ class ContainerConsumer:
 
         if self.consumer:
             self.consumer.close ()
-        if self.client:
-            self.client.close ()
+            self.consumer = None
+        # The client is shared with the rest of the process and closed at exit
+        self.client = None
 
-        print (f"✅ {self.config.container_name} consumer closed")
+        self.log.info ("Consumer closed")
 
 
 def create_container_consumer (
         container_name: str,
         message_handler: Callable [[Dict [str,Any]],None],
         pulsar_url: str = "pulsar://localhost:6650",
-        additional_topics: List [str] = None
+        additional_topics: List [str] = None,
+        metrics: Optional [Metrics] = None
         ) -> ContainerConsumer:
     """Create a consumer for any container"""
     config = ContainerConsumerConfig (
@@ -167,7 +280,7 @@ def create_container_consumer (
         pulsar_url=pulsar_url,
         additional_topics=additional_topics or []
         )
-    return ContainerConsumer (config,message_handler)
+    return ContainerConsumer (config,message_handler,metrics)
 
 
 # Example usage - pure transport, no business logic:
@@ -203,7 +316,7 @@ if __name__ == "__main__":
     print ("   - 'persistent' was just Pulsar's default - not required!")
 
     try:
-        # In production: run these in separate threads/processes
+        # Handlers of all consumers share one pool; start_processing only waits
         neural_consumer.start_processing (max_messages=5)
     finally:
         neural_consumer.close ()
@@ -6,60 +6,189 @@ Pure transport layer - just sends JSON messages to topics.
 No knowledge of integer codes or business logic.
 """
 
-import json
+import copy
+import itertools
+import os
+import re
 import time
-import uuid
-from typing import Dict,Any,Optional
+from concurrent.futures import Future
+from typing import Dict,Any,Optional,List,Sequence,Tuple
 from dataclasses import dataclass
 from security import SetUpEncryption
 
+import orjson
 import pulsar
 
 from src.transports.pulsar.config import ContainerProducerConfig
+from pulsar_connection_manager import get_shared_client
+
+# Placeholder strings marking template holes are "@@<marker>-<slot>@@" with a
+# fresh random marker per registration, so fixed template content cannot
+# collide with them; they are split out of the encoded skeleton
+_HOLE_PATTERN = rb'"(@@%s-[a-z0-9_]+@@)"'
+# Template slots that are filled with auto metadata instead of a caller value
+_TIMESTAMP_SLOT = -1
+_MESSAGE_ID_SLOT = -2
 
 
 class ContainerProducer:
     """Generic producer that works for any container type - pure transport"""
 
+    # Shared by every encode; non-str keys keep json.dumps' handling of
+    # int-keyed payloads (e.g. dicts keyed by integer codes)
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
     def __init__ (self,config: ContainerProducerConfig):
         self.config = config
         self.client = None
         self.producer = None
         self.container_topic = f"{config.tenant}://{config.namespace}/{config.container_name}"
+        # Updated from the client's send callbacks
+        self.messages_sent = 0
+        self.send_errors = 0
+        # Message ids are prefix + sequence: unique per producer process and
+        # much cheaper than a uuid4 per message
+        self._id_prefix = f"{config.container_name}-{os.getpid ()}-{id (self):x}-"
+        self._seq = itertools.count ()
+        # name -> (encoded chunks, slot filling the hole after each chunk,
+        # number of caller values)
+        self._templates: Dict [str,Tuple [Tuple [bytes,...],Tuple [int,...],int]] = {}
 
     def connect (self):
         """Connect to Pulsar"""
         if self.client is None:
-            self.client = pulsar.Client (self.config.pulsar_url)
+            self.client = get_shared_client (self.config.pulsar_url)
             self.producer = self.client.create_producer (
                 topic=self.container_topic,
-                producer_name=f"{self.config.container_name}_producer"
+                producer_name=f"{self.config.container_name}_producer",
+                batching_enabled=self.config.producer_batching_enabled,
+                batching_max_messages=self.config.producer_batch_size,
+                batching_max_allowed_size_in_bytes=131072,
+                batching_max_publish_delay_ms=10,
+                compression_type=getattr (pulsar.CompressionType,self.config.producer_compression),
+                block_if_queue_full=True,
+                max_pending_messages=50000
                 )
             print (f"✅ {self.config.container_name} producer connected to {self.container_topic}")
 
-    def send_message (self,message_data: Dict [str,Any]) -> str:
-        """Send a message - pure transport, no business logic"""
+    def send_message (self,message_data: Dict [str,Any]) -> Future:
+        """
+        Send a message - pure transport, no business logic
+
+        The message is queued on the client's batch and this returns right
+        away; the returned Future resolves to the message id once the broker
+        acknowledges it. Callers that need the id wait on future.result().
+        """
         self.connect ()
 
         # Add basic metadata if configured
         if self.config.auto_add_timestamp and 'timestamp' not in message_data:
-            message_data ['timestamp'] = int (time.time ()*1000)
+            message_data ['timestamp'] = time.time_ns ()//1_000_000
 
         if self.config.auto_add_message_id and 'message_id' not in message_data:
-            message_data ['message_id'] = str (uuid.uuid4 ())
-
-        # Convert to JSON bytes and send
-        message_bytes = json.dumps (message_data).encode ('utf-8')
-        message_id = self.producer.send (message_bytes)
-
-        return str (message_id)
+            message_data ['message_id'] = self._id_prefix + str (next (self._seq))
+
+        # orjson encodes straight to bytes
+        return self._send_bytes (orjson.dumps (message_data,option=self._ORJSON_OPTS))
+
+    def register_template (self,name: str,template: Dict [str,Any],variable_paths: List [Tuple [str,...]]):
+        """
+        Pre-encode a message that is sent repeatedly with only a few leaves changing
+
+        variable_paths lists the key path of each changing leaf, e.g.
+        [("data","pattern"),("data","confidence")]; send_templated takes the
+        values in the same order. The rest of the envelope, including its
+        keys, is encoded once here. Every path must name an existing leaf.
+        """
+        marker = os.urandom (8).hex ()
+        skeleton = copy.deepcopy (template)
+        slots = {}
+        for index,path in enumerate (variable_paths):
+            parent = skeleton
+            for key in path [:-1]:
+                parent = parent [key]
+            if path [-1] not in parent:
+                raise KeyError (f"template {name!r} has no leaf at {path!r}")
+            token = f"@@{marker}-{index}@@"
+            parent [path [-1]] = token
+            slots [token] = index
+
+        # Auto metadata becomes holes too, mirroring send_message
+        if self.config.auto_add_timestamp and 'timestamp' not in skeleton:
+            token = f"@@{marker}-timestamp@@"
+            skeleton ['timestamp'] = token
+            slots [token] = _TIMESTAMP_SLOT
+        if self.config.auto_add_message_id and 'message_id' not in skeleton:
+            token = f"@@{marker}-message_id@@"
+            skeleton ['message_id'] = token
+            slots [token] = _MESSAGE_ID_SLOT
+
+        # Splitting on a capture group alternates chunk, token, chunk, ...
+        pattern = re.compile (_HOLE_PATTERN%marker.encode ())
+        parts = pattern.split (orjson.dumps (skeleton,option=self._ORJSON_OPTS))
+        self._templates [name] = (
+            tuple (parts [0::2]),
+            tuple (slots [token.decode ()] for token in parts [1::2]),
+            len (variable_paths)
+            )
+
+    def send_templated (self,name: str,values: Sequence [Any]) -> Future:
+        """Send a registered template, encoding only its variable leaves"""
+        self.connect ()
+        return self._send_bytes (self._render_template (name,values))
+
+    def _render_template (self,name: str,values: Sequence [Any]) -> bytes:
+        """Splice the encoded values into a registered template's chunks"""
+        chunks,slots,value_count = self._templates [name]
+        if len (values) != value_count:
+            raise ValueError (f"template {name!r} takes {value_count} values, got {len (values)}")
+        opts = self._ORJSON_OPTS
+        parts = [chunks [0]]
+        for slot,chunk in zip (slots,chunks [1:]):
+            if slot >= 0:
+                value = values [slot]
+            elif slot == _TIMESTAMP_SLOT:
+                value = time.time_ns ()//1_000_000
+            else:
+                value = self._id_prefix + str (next (self._seq))
+            parts.append (orjson.dumps (value,option=opts))
+            parts.append (chunk)
+
+        return b"".join (parts)
+
+    def _send_bytes (self,message_bytes: bytes) -> Future:
+        """Queue encoded bytes on the producer and return the message id Future"""
+        future = Future ()
+        self.producer.send_async (message_bytes,lambda res,msg_id:self._on_sent (future,res,msg_id))
+
+        return future
+
+    def _on_sent (self,future: Future,res,msg_id):
+        """send_async callback, runs on a client I/O thread"""
+        if res == pulsar.Result.Ok:
+            self.messages_sent += 1
+            future.set_result (str (msg_id))
+        else:
+            self.send_errors += 1
+            print (f"❌ {self.config.container_name} send failed: {res}")
+            future.set_exception (pulsar.PulsarException (res))
 
     def close (self):
         """Clean shutdown"""
         if self.producer:
-            self.producer.close ()
-        if self.client:
-            self.client.close ()
+            # Push out anything still sitting in the batch before closing; a
+            # failed flush must not keep the producer open
+            try:
+                self.producer.flush ()
+            except Exception as e:
+                print (f"❌ {self.config.container_name} flush on close failed: {e}")
+            try:
+                self.producer.close ()
+            except Exception as e:
+                print (f"❌ {self.config.container_name} producer close failed: {e}")
+            self.producer = None
+        # The client is shared with the rest of the process and closed at exit
+        self.client = None
         print (f"✅ {self.config.container_name} producer closed")
 
 
@@ -56,6 +56,9 @@ def setup_logging(level: str = "INFO", enable_loki: bool = True) -> None:
             structlog.processors.JSONRenderer() if enable_loki else structlog.dev.ConsoleRenderer(),
         ],
         context_class=dict,
+        # Calls below the configured level return immediately, before any
+        # event dict is built or processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, level.upper())),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
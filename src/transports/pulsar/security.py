@@ -1,19 +1,54 @@
 # universal_integer_system/src/transports/security.py
+import base64
 import os
-import json
+from typing import Union
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+import orjson
+
+# AES-GCM messages are version || nonce || ciphertext || tag. Fernet tokens
+# start with "g" (0x67) once base64 encoded, so the two never share a first byte
+_VERSION_AESGCM = b"\x01"
+_FERNET_PREFIX = b"gAAAAA"
+_NONCE_SIZE = 12
 
 
 class SetUpEncryption:
-    """Encryption and security setup"""
+    """
+    Encryption and security setup
+
+    Messages are sealed with AES-256-GCM behind a version byte. The AES key is
+    derived from ENCRYPTION_KEY (a Fernet key) with HKDF, so it never shares
+    key material with Fernet, whose tokens from older producers still decrypt.
+    """
     def __init__ (self):
         key = os.environ.get ('ENCRYPTION_KEY')
         if not key:
             raise ValueError ("Set ENCRYPTION_KEY env var")
         self.fernet = Fernet (key)
+        # The key schedule is set up once and reused for every message
+        self.aesgcm = AESGCM (
+            HKDF (
+                algorithm=hashes.SHA256 (),
+                length=32,
+                salt=None,
+                info=b"uis-aesgcm"
+                ).derive (base64.urlsafe_b64decode (key))
+            )
 
     def encrypt_json (self,data: dict) -> bytes:
-        return self.fernet.encrypt (json.dumps (data).encode ())
+        nonce = os.urandom (_NONCE_SIZE)
+        return _VERSION_AESGCM + nonce + self.aesgcm.encrypt (nonce,orjson.dumps (data),None)
 
-    def decrypt_json (self,encrypted: bytes) -> dict:
-        return json.loads (self.fernet.decrypt (encrypted))
+    def decrypt_json (self,encrypted: Union [bytes,str]) -> dict:
+        # Fernet accepted tokens stored as text, so str input still decrypts
+        if isinstance (encrypted,str):
+            encrypted = encrypted.encode ("ascii")
+        if encrypted [:1] == _VERSION_AESGCM:
+            nonce = encrypted [1:1 + _NONCE_SIZE]
+            return orjson.loads (self.aesgcm.decrypt (nonce,encrypted [1 + _NONCE_SIZE:],None))
+        if encrypted [:len (_FERNET_PREFIX)] == _FERNET_PREFIX:
+            return orjson.loads (self.fernet.decrypt (encrypted))
+        raise ValueError ("Unknown encrypted message format")
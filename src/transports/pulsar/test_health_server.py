@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for HealthServer's /metrics content negotiation, served in-process
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from aiohttp.test_utils import TestClient, TestServer
+from prometheus_client import CONTENT_TYPE_LATEST
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from health_server import HealthServer
+
+PROMETHEUS_ACCEPT = (
+    "application/openmetrics-text;version=1.0.0,application/openmetrics-text;version=0.0.1;q=0.75,"
+    "text/plain;version=0.0.4;q=0.5,*/*;q=0.1"
+)
+
+
+class TestMetricsEndpoint(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        system = SimpleNamespace(
+            metrics=SimpleNamespace(sent_total=3, received_total=2),
+            _manager=SimpleNamespace(_producers={"t": object()}),
+            _consumers=[],
+        )
+        self.client = TestClient(TestServer(HealthServer(system).app))
+        await self.client.start_server()
+        self.addAsyncCleanup(self.client.close)
+
+    async def test_scraper_gets_exposition(self):
+        response = await self.client.get("/metrics", headers={"Accept": PROMETHEUS_ACCEPT})
+        self.assertEqual(response.headers["Content-Type"], CONTENT_TYPE_LATEST)
+        self.assertIn("# TYPE", await response.text())
+
+    async def test_other_clients_get_json(self):
+        for accept in ("*/*", "application/json"):
+            with self.subTest(accept=accept):
+                response = await self.client.get("/metrics", headers={"Accept": accept})
+                self.assertEqual(response.content_type, "application/json")
+                self.assertEqual(
+                    await response.json(),
+                    {"messages_sent": 3, "messages_received": 2, "active_producers": 1, "active_consumers": 0},
+                )
+
+    async def test_prom_route_always_exposition(self):
+        response = await self.client.get("/metrics/prom")
+        self.assertEqual(response.headers["Content-Type"], CONTENT_TYPE_LATEST)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for Metrics running totals and label-child caching
+"""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from metrics import Metrics
+
+
+class TestMetrics(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Metrics registers its collectors globally, so one instance per process
+        cls.metrics = Metrics()
+
+    def test_totals_survive_concurrent_callbacks(self):
+        metrics = self.metrics
+        sent_before, received_before = metrics.sent_total, metrics.received_total
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, switch_interval)
+
+        def record():
+            for _ in range(5000):
+                metrics.record_sent("1001", "t", "success")
+                metrics.record_received("1001", "t", "success")
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(metrics.sent_total - sent_before, 20000)
+        self.assertEqual(metrics.received_total - received_before, 20000)
+
+    def test_child_is_cached(self):
+        child = self.metrics.child(self.metrics.send_latency, "t")
+        self.assertIs(self.metrics.child(self.metrics.send_latency, "t"), child)
+
+
+if __name__ == '__main__':
+    unittest.main()
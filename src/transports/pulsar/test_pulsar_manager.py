@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for PulsarManager's producer cache, against a mocked client
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pulsar.schema import Record, String
+
+# This directory for the flat transport imports, the repo root for src.*
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parents[3]))
+
+from pulsar_manager import PulsarManager
+
+
+class Event(Record):
+    name = String()
+
+
+class TestProducerCache(unittest.TestCase):
+
+    def setUp(self):
+        # AvroSchema needs the avro extra; the cache only cares about the Record class
+        patcher = mock.patch.object(PulsarManager, "_avro_for")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = PulsarManager(mock.Mock(), None, mock.Mock())
+
+    def test_same_schema_is_cached(self):
+        self.assertIs(self.manager.get_producer("a"), self.manager.get_producer("a"))
+        self.assertIs(self.manager.get_producer("b", Event), self.manager.get_producer("b", Event))
+        self.assertEqual(self.manager.connection.get_client.return_value.create_producer.call_count, 2)
+
+    def test_different_schema_raises(self):
+        self.manager.get_producer("a")
+        with self.assertRaisesRegex(ValueError, "uses schema bytes, not Event"):
+            self.manager.get_producer("a", Event)
+        self.manager.get_producer("b", Event)
+        with self.assertRaisesRegex(ValueError, "uses schema Event, not bytes"):
+            self.manager.get_producer("b")
+
+
+if __name__ == '__main__':
+    unittest.main()
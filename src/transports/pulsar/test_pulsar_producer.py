@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for ContainerProducer message templates: encoding only, no broker needed
+"""
+
+import copy
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import orjson
+
+# This directory for the flat transport imports, the repo root for src.*
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parents[3]))
+
+from pulsar_producer import ContainerProducer
+from src.transports.pulsar.config import ContainerProducerConfig
+
+
+def make_producer(**overrides) -> ContainerProducer:
+    settings = dict(container_name="test_container", auto_add_timestamp=False, auto_add_message_id=False)
+    settings.update(overrides)
+    return ContainerProducer(ContainerProducerConfig(**settings))
+
+
+def set_path(payload, path, value):
+    for key in path[:-1]:
+        payload = payload[key]
+    payload[path[-1]] = value
+
+
+class TestMessageTemplates(unittest.TestCase):
+
+    TEMPLATE = {
+        "type": "pattern",
+        "data": {"pattern": None, "confidence": 0.0, "tags": ["a", "b"]},
+        "source": {"node": "n1", "weight": 0},
+        7: "int key",
+    }
+    PATHS = [("data", "pattern"), ("data", "confidence"), ("source", "weight")]
+
+    def setUp(self):
+        self.producer = make_producer()
+        self.producer.register_template("t", self.TEMPLATE, self.PATHS)
+
+    def expected(self, values):
+        payload = copy.deepcopy(self.TEMPLATE)
+        for path, value in zip(self.PATHS, values):
+            set_path(payload, path, value)
+        return orjson.dumps(payload, option=ContainerProducer._ORJSON_OPTS)
+
+    def test_several_holes_match_full_encode(self):
+        for values in (["spiral", 0.93, 4], [None, 1, -1], [{"nested": [1, 2]}, 0.5, 10**12]):
+            with self.subTest(values=values):
+                self.assertEqual(self.producer._render_template("t", values), self.expected(values))
+
+    def test_values_needing_escapes(self):
+        for value in ('say "hi"', "back\\slash", "ünïcødé ✓ 🚀", "line\nbreak\ttab", "\u0000ctrl", "@@hole-0@@"):
+            with self.subTest(value=value):
+                rendered = self.producer._render_template("t", [value, 0.1, 1])
+                self.assertEqual(rendered, self.expected([value, 0.1, 1]))
+                self.assertEqual(orjson.loads(rendered)["data"]["pattern"], value)
+
+    def test_fixed_content_that_looks_like_a_hole(self):
+        template = {"data": {"x": 0}, "note": "@@hole-0@@", "@@hole-1@@": "@@hole-timestamp@@"}
+        self.producer.register_template("lookalike", template, [("data", "x")])
+        rendered = self.producer._render_template("lookalike", [42])
+        self.assertEqual(orjson.loads(rendered), {**template, "data": {"x": 42}})
+
+    def test_template_is_not_mutated(self):
+        self.assertIsNone(self.TEMPLATE["data"]["pattern"])
+
+    def test_missing_hole_key(self):
+        with self.assertRaises(KeyError):
+            self.producer.register_template("bad", self.TEMPLATE, [("data", "missing")])
+        with self.assertRaises(KeyError):
+            self.producer.register_template("bad", self.TEMPLATE, [("nope", "pattern")])
+        self.assertNotIn("bad", self.producer._templates)
+
+    def test_wrong_value_count(self):
+        with self.assertRaises(ValueError):
+            self.producer._render_template("t", ["only one"])
+        with self.assertRaises(ValueError):
+            self.producer._render_template("t", [1, 2, 3, 4])
+
+    def test_unknown_template(self):
+        with self.assertRaises(KeyError):
+            self.producer._render_template("never_registered", [])
+
+    def test_auto_metadata_matches_send_message(self):
+        producer = make_producer(auto_add_timestamp=True, auto_add_message_id=True)
+        producer.register_template("meta", {"data": {"x": 0}}, [("data", "x")])
+        with mock.patch("pulsar_producer.time.time_ns", return_value=1_700_000_000_123_456_789):
+            rendered = producer._render_template("meta", [5])
+        expected = orjson.dumps({
+            "data": {"x": 5},
+            "timestamp": 1_700_000_000_123,
+            "message_id": producer._id_prefix + "0",
+        })
+        self.assertEqual(rendered, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for SetUpEncryption: AES-GCM round trips, legacy Fernet tokens and tampering
+"""
+
+import base64
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from security import SetUpEncryption
+
+
+class TestSetUpEncryption(unittest.TestCase):
+
+    def setUp(self):
+        self.key = Fernet.generate_key().decode()
+        patcher = mock.patch.dict(os.environ, {'ENCRYPTION_KEY': self.key})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.enc = SetUpEncryption()
+        self.payload = {"code": 1001, "data": {"user": "ünïcode", "n": [1, 2, 3]}}
+
+    def test_round_trip(self):
+        token = self.enc.encrypt_json(self.payload)
+        self.assertEqual(token[:1], b"\x01")
+        self.assertEqual(self.enc.decrypt_json(token), self.payload)
+
+    def test_nonce_differs_per_message(self):
+        self.assertNotEqual(self.enc.encrypt_json(self.payload), self.enc.encrypt_json(self.payload))
+
+    def test_decrypts_legacy_fernet_token(self):
+        token = Fernet(self.key).encrypt(b'{"code":1001,"data":{}}')
+        self.assertTrue(token.startswith(b"gAAAAA"))
+        self.assertEqual(self.enc.decrypt_json(token), {"code": 1001, "data": {}})
+
+    def test_decrypts_str_tokens(self):
+        legacy = Fernet(self.key).encrypt(b'{"code":1001}').decode()
+        self.assertEqual(self.enc.decrypt_json(legacy), {"code": 1001})
+        # Tokens are ASCII; anything else is rejected like other bad input
+        with self.assertRaises(ValueError):
+            self.enc.decrypt_json("gAAAAAé")
+
+    def test_tampered_ciphertext_raises(self):
+        token = bytearray(self.enc.encrypt_json(self.payload))
+        token[-1] ^= 0x01
+        with self.assertRaises(InvalidTag):
+            self.enc.decrypt_json(bytes(token))
+
+    def test_aes_key_is_not_the_fernet_key(self):
+        # The raw Fernet key must not open AES-GCM messages
+        token = self.enc.encrypt_json(self.payload)
+        raw = AESGCM(base64.urlsafe_b64decode(self.key))
+        with self.assertRaises(InvalidTag):
+            raw.decrypt(token[1:13], token[13:], None)
+
+    def test_unknown_format_rejected(self):
+        with self.assertRaises(ValueError):
+            self.enc.decrypt_json(b"\x02" + os.urandom(40))
+
+    def test_missing_key(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            with self.assertRaises(ValueError):
+                SetUpEncryption()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for the UniversalSystem wire format: encoding only, no broker needed
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pulsar
+
+# This directory for the flat transport imports, src/core for the translator,
+# the repo root for src.*
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parents[2] / "core"))
+sys.path.insert(0, str(Path(__file__).parents[3]))
+
+import uis
+from uis import WireEvent
+
+
+class FakeMessage:
+
+    def __init__(self, data, properties):
+        self._data = data
+        self._properties = properties
+
+    def data(self):
+        return self._data
+
+    def properties(self):
+        return self._properties
+
+
+class TestWireFormat(unittest.TestCase):
+
+    def round_trip(self, wire_format, event):
+        encode, properties = uis._WIRE_FORMATS[wire_format]
+        return uis._decode_event(FakeMessage(encode(event), properties))
+
+    def test_msgpack_keeps_non_str_keys(self):
+        event = WireEvent(code=1001, name="x", data={1: "a", "b": {2: [3]}}, trace_id="t")
+        self.assertEqual(self.round_trip("msgpack", event), event)
+
+    def test_json_decodes_non_str_keys(self):
+        # JSON object keys are strings on the wire, so int keys come back as str
+        event = WireEvent(code=1001, name="x", data={1: "a"})
+        self.assertEqual(self.round_trip("json", event).data, {"1": "a"})
+
+
+def make_system(producer):
+    """UniversalSystem wired to mocks, bypassing configure() and the health server"""
+    system = object.__new__(uis.UniversalSystem)
+    system._configured = True
+    system._metrics_served = True
+    system._code_to_topic = []
+    system._encode, system._properties = uis._WIRE_FORMATS["msgpack"]
+    system._manager = mock.Mock()
+    system._manager.get_producer.return_value = producer
+    system.metrics = mock.Mock()
+    system._send_logger = mock.Mock()
+    return system
+
+
+class TestSendNowait(unittest.TestCase):
+
+    def test_latency_is_monotonic(self):
+        producer = mock.Mock()
+        system = make_system(producer)
+        with mock.patch.object(uis.UniversalSystem, "_get_topic_for_code", return_value="t"):
+            system.send_nowait(1001, {"k": 1})
+        on_sent = producer.send_async.call_args.args[1]
+        with mock.patch("uis.time.time", return_value=0.0):
+            on_sent(pulsar.Result.Ok, None)
+        observed = system.metrics.child.return_value.observe.call_args.args[0]
+        self.assertGreaterEqual(observed, 0.0)
+        self.assertLess(observed, 60.0)
+        system.metrics.record_sent.assert_called_once_with(code="1001", topic="t", status="success")
+
+    def test_failure_before_send_is_counted(self):
+        system = make_system(mock.Mock())
+        system._manager.get_producer.side_effect = RuntimeError("no producer")
+        with mock.patch.object(uis.UniversalSystem, "_get_topic_for_code", return_value="t"):
+            with self.assertRaises(RuntimeError):
+                system.send_nowait(1001, {})
+        system.metrics.record_sent.assert_called_once_with(code="1001", topic="t", status="failed")
+        system.metrics.child.assert_called_once_with(system.metrics.errors, "send", "send_nowait")
+        system._send_logger.error.assert_called_once()
+
+
+class TestEnvSettings(unittest.TestCase):
+
+    def test_wire_format(self):
+        with mock.patch.dict(os.environ, {"UIS_WIRE_FORMAT": "json"}):
+            self.assertIs(uis._env_wire_format(), uis._WIRE_FORMATS["json"])
+        with mock.patch.dict(os.environ, {"UIS_WIRE_FORMAT": "jsn"}):
+            with self.assertRaisesRegex(ValueError, "UIS_WIRE_FORMAT must be one of msgpack, json"):
+                uis._env_wire_format()
+
+    def test_env_int(self):
+        with mock.patch.dict(os.environ, {"UIS_LOG_SAMPLE": "0"}):
+            self.assertEqual(uis._env_int("UIS_LOG_SAMPLE", 5, minimum=0), 0)
+        for raw in ("-1", "often"):
+            with self.subTest(raw=raw), mock.patch.dict(os.environ, {"UIS_LOG_SAMPLE": raw}):
+                with self.assertRaisesRegex(ValueError, "UIS_LOG_SAMPLE"):
+                    uis._env_int("UIS_LOG_SAMPLE", 0, minimum=0)
+        with mock.patch.dict(os.environ, {"UIS_HANDLER_THREADS": "0"}):
+            with self.assertRaises(ValueError):
+                uis._env_int("UIS_HANDLER_THREADS", 32)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,21 @@
 # universal_integer_system/uis.py
-from typing import Dict,Any,Callable,Optional,List
+from typing import Dict,Any,Callable,Optional,List,Tuple
 import asyncio
-import json
+import itertools
+import os
+import random
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import msgspec
+import pulsar
 import structlog
 from metrics import Metrics
+from health_server import HealthServer
 from structlog import get_logger
 
-from src.core.discovery import StreamlinedDiscoveryTranslator
+from src.core.discovery import streamlined_translator
 from src.transports.pulsar.config import PulsarConfig
 from src.transports.pulsar.pulsar_connection_manager import PulsarConnectionManager
 from src.transports.pulsar.pulsar_manager import PulsarManager
@@ -16,6 +23,136 @@ from src.transports.pulsar.pulsar_manager import PulsarManager
 logger = structlog.get_logger ()
 
 
+class WireEvent (msgspec.Struct,frozen=True):
+    """
+    Event as carried on the wire; immutable once built
+
+    The timestamp comes from the message's publish time and the version is
+    the topic's, so neither is sent; older payloads that carry them still decode.
+    data takes any key type: msgpack keeps int keys, and a payload the decoder
+    rejected would be redelivered forever.
+    """
+    code: int
+    name: str
+    data: Dict [Any,Any]
+    trace_id: Optional [str] = None
+
+
+_WIRE_VERSION = "1.0"
+
+
+@dataclass
+class Event:
+    """Event as handed to handlers; slotted, as one is built per message"""
+    __slots__ = ("code","data","timestamp","version","trace_id")
+    code: int
+    data: Dict [Any,Any]
+    timestamp: float
+    version: str
+    trace_id: str
+
+
+# Events are sent as msgpack; the content_type property tells consumers how to
+# decode, and messages without it are read as JSON from older producers
+_CONTENT_TYPE = "application/msgpack"
+_PROPERTIES = {"content_type":_CONTENT_TYPE}
+_ENCODER = msgspec.msgpack.Encoder ()
+_DECODER = msgspec.msgpack.Decoder (WireEvent)
+_JSON_DECODER = msgspec.json.Decoder (WireEvent)
+
+# UIS_WIRE_FORMAT -> (encode, properties); "json" keeps JSON on the wire for
+# consumers that cannot read msgpack
+_WIRE_FORMATS = {
+    "msgpack":(_ENCODER.encode,_PROPERTIES),
+    "json":(msgspec.json.Encoder ().encode,{"content_type":"application/json"}),
+    }
+
+
+# Consume loop retry delay after a receive error: doubles up to the cap, reset
+# by the next successful receive
+_BACKOFF_INITIAL_S = 0.1
+_BACKOFF_MAX_S = 30.0
+
+# Trace ids are this process's random prefix plus a counter, which keeps them
+# unique across hosts without an entropy read per message
+_HOST_ID = uuid.uuid4 ().hex [:12]
+_trace_counter = itertools.count ()
+
+
+def _reset_trace_ids ():
+    """Give a forked worker its own prefix; it would otherwise repeat the parent's ids"""
+    global _HOST_ID,_trace_counter
+    _HOST_ID = uuid.uuid4 ().hex [:12]
+    _trace_counter = itertools.count ()
+
+
+if hasattr (os,"register_at_fork"):
+    os.register_at_fork (after_in_child=_reset_trace_ids)
+
+
+def _new_trace_id () -> str:
+    return f"{_HOST_ID}-{next (_trace_counter):x}"
+
+
+def _env_int (name: str,default: int,minimum: int = 1) -> int:
+    """Integer of at least minimum from the environment, with an error naming the variable"""
+    raw = os.getenv (name)
+    if raw is None:
+        return default
+    try:
+        value = int (raw)
+    except ValueError:
+        raise ValueError (f"{name} must be an integer >= {minimum}, got {raw!r}") from None
+    if value < minimum:
+        raise ValueError (f"{name} must be an integer >= {minimum}, got {raw!r}")
+    return value
+
+
+def _env_wire_format () -> Tuple [Callable,Dict [str,str]]:
+    """(encode, properties) for UIS_WIRE_FORMAT, with an error listing the formats"""
+    name = os.getenv ("UIS_WIRE_FORMAT","msgpack")
+    if name not in _WIRE_FORMATS:
+        raise ValueError (f"UIS_WIRE_FORMAT must be one of {', '.join (_WIRE_FORMATS)}, got {name!r}")
+    return _WIRE_FORMATS [name]
+
+
+def _settle_on_loop (loop: asyncio.AbstractEventLoop,future: asyncio.Future) -> Callable:
+    """send_async callback that settles an asyncio future from the client's I/O thread"""
+
+    def settle (res,msg_id):
+        if future.done ():
+            return
+        if res == pulsar.Result.Ok:
+            future.set_result (msg_id)
+        else:
+            future.set_exception (pulsar.PulsarException (res))
+
+    return lambda res,msg_id:loop.call_soon_threadsafe (settle,res,msg_id)
+
+
+# (name,system) per code; both are pure functions of the code, so they are
+# resolved through the shared translator once and read from here afterwards
+_CODE_INFO: Dict [int,Tuple [str,str]] = {}
+
+
+def _code_info (code: int) -> Tuple [str,str]:
+    """Name and system for a code, cached for the life of the process"""
+    info = _CODE_INFO.get (code)
+    if info is None:
+        info = _CODE_INFO [code] = (
+            streamlined_translator.translate_code (code),
+            streamlined_translator.get_system_for_code (code)
+            )
+    return info
+
+
+def _decode_event (msg) -> WireEvent:
+    """Decode a received message according to its content_type"""
+    if msg.properties ().get ("content_type") == _CONTENT_TYPE:
+        return _DECODER.decode (msg.data ())
+    return _JSON_DECODER.decode (msg.data ())
+
+
 class UniversalSystem:
     """The main system with comprehensive monitoring and observability"""
 
@@ -24,20 +161,41 @@ class UniversalSystem:
         self._config: Optional [PulsarConfig] = None
         self._connection: Optional [PulsarConnectionManager] = None
         self._manager: Optional [PulsarManager] = None
-        self._handlers: Dict [int,List [Callable]] = {}
+        # code -> (sync handlers, async handlers), split once at registration
+        self._handlers: Dict [int,Tuple [List [Callable],List [Callable]]] = {}
         self._running = False
-        self._consumers = []
+        self._consumers: List [asyncio.Task] = []
+        # Consumer tasks still running, kept by done callbacks for health_check
+        self._active_consumers = 0
+        self._encode,self._properties = _env_wire_format ()
+        # code -> topic for every code in the defined ranges; built by configure()
+        self._code_to_topic: List [str] = []
+        # Sync handlers run on this pool so they never block the event loop;
+        # start() creates it and stop() shuts it down
+        self._handler_threads = _env_int ("UIS_HANDLER_THREADS",32)
+        self._handler_pool: Optional [ThreadPoolExecutor] = None
 
         # Setup logging
         logging=Logger ()
 
-        # Setup metrics
+        # Setup metrics; Prometheus scrapes the health server's /metrics
+        # instead of a separate start_http_server thread. The server comes up
+        # on the first event loop that constructs, configures, sends or starts
         self.metrics = Metrics (port=metrics_port)
-        if enable_metrics:
-            self.metrics.start_server ()
+        self.health_server = HealthServer (self,port=metrics_port) if enable_metrics else None
+        self._health_task: Optional [asyncio.Task] = None
+        self._metrics_served = self.health_server is None
 
         # Bind logger with context
         self.logger = logger.bind (component="universal_system")
+        # Operation-scoped loggers; per-message paths only add the trace context
+        self._send_logger = self.logger.bind (operation="send")
+        self._consume_logger = self.logger.bind (operation="consume")
+        # Per-message success logs: 0 = off, N = log one in N. Errors are never sampled
+        self._log_sample = _env_int ("UIS_LOG_SAMPLE",0,minimum=0)
+        self._log_counter = itertools.count ()
+
+        self._serve_metrics ()
 
         self.logger.info (
             "Universal Integer System initialized",
@@ -47,15 +205,17 @@ class UniversalSystem:
 
     def configure (self,**kwargs):
         """Configure with observability"""
-        trace_id = str (uuid.uuid4 ())
+        trace_id = _new_trace_id ()
         config_logger = self.logger.bind (trace_id=trace_id,operation="configure")
 
         config_logger.info ("Configuring system",config=kwargs)
+        self._serve_metrics ()
 
         try:
             self._config = Config.from_env (**kwargs)
             self._connection = PulsarConnectionManager (self._config,self.metrics)
             self._manager = PulsarManager (self._connection,self._config,self.metrics)
+            self._code_to_topic = self._build_code_to_topic ()
             self._configured = True
 
             config_logger.info (
@@ -70,79 +230,105 @@ class UniversalSystem:
             config_logger.error ("Configuration failed",error=str (e))
             raise
 
+    @staticmethod
+    def _get_topic_for_code (code: int) -> str:
+        """Events are published to a topic per system"""
+        return streamlined_translator.get_system_for_code (code)
+
+    @staticmethod
+    def _build_code_to_topic () -> List [str]:
+        """Topic for every code up to the end of the last defined range"""
+        ranges = streamlined_translator.range_definitions
+        table = ["unknown_range"]*(max (r ["end"] for r in ranges.values ()) + 1)
+        # Filled last to first so the first matching range wins, as in discovery
+        for system,r in reversed (list (ranges.items ())):
+            table [r ["start"]:r ["end"] + 1] = [system]*(r ["end"] - r ["start"] + 1)
+        return table
+
+    async def start_health_server (self):
+        """Serve /health, /ready, /metrics and /metrics/prom on the metrics port"""
+        if self.health_server is not None:
+            self._metrics_served = True
+            await self.health_server.start ()
+
+    def _serve_metrics (self):
+        """Start the health server on the running loop; a no-op outside one or once started"""
+        if self._metrics_served:
+            return
+        try:
+            loop = asyncio.get_running_loop ()
+        except RuntimeError:
+            return
+        self._metrics_served = True
+        self._health_task = loop.create_task (self.health_server.start ())
+        self._health_task.add_done_callback (self._health_server_done)
+
+    def _health_server_done (self,task: asyncio.Task):
+        if not task.cancelled () and task.exception () is not None:
+            self.metrics.errors.labels (type='health_server',operation='start').inc ()
+            self.logger.error ("Health server failed to start",error=str (task.exception ()))
+
     async def send (self,code: int,data: Dict [str,Any],topic: str = None):
         """Send event with full metrics and tracing"""
+        # configure() is synchronous, so concurrent first sends on this loop
+        # cannot interleave between the check and the configuration
         if not self._configured:
             self.configure ()
+        if not self._metrics_served:
+            self._serve_metrics ()
 
         # Create trace context
-        trace_id = str (uuid.uuid4 ())
-        message_logger = self.logger.bind (
-            trace_id=trace_id,
-            code=code,
-            operation="send"
-            )
+        trace_id = _new_trace_id ()
+        message_logger = self._send_logger.bind (trace_id=trace_id,code=code)
 
-        start_time = time.time ()
+        loop = asyncio.get_running_loop ()
+        start_time = loop.time ()
 
         try:
             # Determine topic
             if topic is None:
-                topic = self._get_topic_for_code (code)
-
-            # Translate code
-            code_name = StreamlinedDiscoveryTranslator ().translate_code (code)
-            system = StreamlinedDiscoveryTranslator ().get_system_for_code (code)
-
-            # Track translation
-            self.metrics.code_translations.labels (code=str (code),system=system).inc ()
+                table = self._code_to_topic
+                topic = table [code] if 0 <= code < len (table) else self._get_topic_for_code (code)
 
             # Get producer
             producer = self._manager.get_producer (topic)
 
             # Create event with trace ID
-            event = {
-                "code":code,
-                "name":code_name,
-                "data":data,
-                "timestamp":time.time (),
-                "version":"1.0",
-                "trace_id":trace_id
-                }
-
-            # Send with metrics
-            send_start = time.time ()
-            await asyncio.get_event_loop ().run_in_executor (
-                None,
-                producer.send,
-                json.dumps (event).encode ('utf-8')
-                )
+            event = self._make_event (code,data,trace_id)
+            code_name = event.name
+
+            # Send with metrics; the client batches the message and settles
+            # the future from its I/O thread, so no executor thread is tied up
+            send_start = loop.time ()
+            sent = loop.create_future ()
+            producer.send_async (self._encode (event),_settle_on_loop (loop,sent),properties=self._properties)
+            await sent
 
             # Update metrics
-            send_duration = time.time () - send_start
-            self.metrics.send_latency.labels (topic=topic).observe (send_duration)
-            self.metrics.messages_sent.labels (
+            send_duration = loop.time () - send_start
+            self.metrics.child (self.metrics.send_latency,topic).observe (send_duration)
+            self.metrics.record_sent (
                 code=str (code),
                 topic=topic,
                 status='success'
-                ).inc ()
-
-            total_duration = time.time () - start_time
-            message_logger.info (
-                "Message sent successfully",
-                topic=topic,
-                code_name=code_name,
-                send_duration=send_duration,
-                total_duration=total_duration
                 )
 
+            if self._log_sample and next (self._log_counter)%self._log_sample == 0:
+                message_logger.info (
+                    "Message sent successfully",
+                    topic=topic,
+                    code_name=code_name,
+                    send_duration=send_duration,
+                    total_duration=loop.time () - start_time
+                    )
+
         except Exception as e:
-            self.metrics.messages_sent.labels (
+            self.metrics.record_sent (
                 code=str (code),
                 topic=topic or "unknown",
                 status='failed'
-                ).inc ()
-            self.metrics.errors.labels (type='send',operation='send').inc ()
+                )
+            self.metrics.child (self.metrics.errors,'send','send').inc ()
 
             message_logger.error (
                 "Failed to send message",
@@ -151,109 +337,233 @@ class UniversalSystem:
                 )
             raise
 
+    def send_nowait (self,code: int,data: Dict [str,Any],topic: str = None):
+        """Queue an event without waiting for the broker; the outcome is recorded in metrics"""
+        if not self._configured:
+            self.configure ()
+        if not self._metrics_served:
+            self._serve_metrics ()
+
+        trace_id = _new_trace_id ()
+
+        def on_sent (res,msg_id):
+            if res == pulsar.Result.Ok:
+                self.metrics.child (self.metrics.send_latency,topic).observe (time.perf_counter () - send_start)
+                self.metrics.record_sent (code=str (code),topic=topic,status='success')
+            else:
+                self.metrics.record_sent (code=str (code),topic=topic,status='failed')
+                self.metrics.child (self.metrics.errors,'send','send_nowait').inc ()
+
+        try:
+            if topic is None:
+                table = self._code_to_topic
+                topic = table [code] if 0 <= code < len (table) else self._get_topic_for_code (code)
+            producer = self._manager.get_producer (topic)
+            event = self._make_event (code,data,trace_id)
+            send_start = time.perf_counter ()
+            producer.send_async (self._encode (event),on_sent,properties=self._properties)
+
+        except Exception as e:
+            # Failures before the message is queued are counted as in send()
+            self.metrics.record_sent (code=str (code),topic=topic or "unknown",status='failed')
+            self.metrics.child (self.metrics.errors,'send','send_nowait').inc ()
+            self._send_logger.error (
+                "Failed to send message",
+                trace_id=trace_id,
+                code=code,
+                error=str (e),
+                topic=topic
+                )
+            raise
+
+    def on (self,code: int,handler: Callable):
+        """Register a handler, sync or async, for events with this code"""
+        sync_handlers,async_handlers = self._handlers.setdefault (code,([],[]))
+        if asyncio.iscoroutinefunction (handler):
+            async_handlers.append (handler)
+        else:
+            sync_handlers.append (handler)
+
+    def _make_event (self,code: int,data: Dict [str,Any],trace_id: str) -> WireEvent:
+        """Translate the code and build its wire event"""
+        code_name,system = _code_info (code)
+
+        # Track translation
+        self.metrics.child (self.metrics.code_translations,str (code),system).inc ()
+
+        return WireEvent (
+            code=code,
+            name=code_name,
+            data=data,
+            trace_id=trace_id
+            )
+
+    async def start (self,topics: List [str]):
+        """Start a consumer task per topic"""
+        if not self._configured:
+            self.configure ()
+
+        await self.start_health_server ()
+
+        if self._handler_pool is None:
+            self._handler_pool = ThreadPoolExecutor (
+                max_workers=self._handler_threads,
+                thread_name_prefix="uis-handler"
+                )
+
+        self._running = True
+        for topic in topics:
+            task = asyncio.create_task (self._consume_topic (topic))
+            self._active_consumers += 1
+            task.add_done_callback (self._consumer_done)
+            self._consumers.append (task)
+
+    async def stop (self):
+        """Stop consuming and wait for the consumer tasks to finish"""
+        self._running = False
+        await asyncio.gather (*self._consumers,return_exceptions=True)
+        self._consumers.clear ()
+        # Handlers still running finish on their threads; nothing new is queued
+        if self._handler_pool is not None:
+            self._handler_pool.shutdown (wait=False)
+            self._handler_pool = None
+
+    def _consumer_done (self,task: asyncio.Task):
+        self._active_consumers -= 1
+
     async def _consume_topic (self,topic: str):
         """Consume with comprehensive monitoring"""
-        consumer_logger = self.logger.bind (
-            topic=topic,
-            operation="consume"
-            )
+        consumer_logger = self._consume_logger.bind (topic=topic)
 
         subscription = f"{self._config.namespace}-subscription"
         consumer = self._manager.get_consumer ([topic],subscription)
 
         consumer_logger.info ("Starting consumer",subscription=subscription)
 
+        loop = asyncio.get_running_loop ()
+        backoff = _BACKOFF_INITIAL_S
         while self._running:
             try:
-                msg = await asyncio.get_event_loop ().run_in_executor (
-                    None,
-                    lambda:consumer.receive (timeout_millis=1000)
-                    )
+                # One executor hop per batch; the consumer's batch receive
+                # policy returns at most 500 messages / 1 MiB, or whatever
+                # arrived within 100 ms
+                msgs = await loop.run_in_executor (None,consumer.batch_receive)
+                backoff = _BACKOFF_INITIAL_S
 
-                if msg:
-                    receive_time = time.time ()
+                for msg in msgs:
+                    receive_time = loop.time ()
+                    # Settled exactly once below: ack only if every handler succeeded
+                    should_ack = False
 
                     try:
                         # Parse event
-                        event_data = json.loads (msg.data ().decode ('utf-8'))
-                        trace_id = event_data.get ('trace_id',str (uuid.uuid4 ()))
+                        wire = _decode_event (msg)
+                        trace_id = wire.trace_id or _new_trace_id ()
 
                         # Create logger with trace context
                         event_logger = consumer_logger.bind (
                             trace_id=trace_id,
-                            code=event_data ['code']
+                            code=wire.code
                             )
 
                         event = Event (
-                            code=event_data ['code'],
-                            data=event_data ['data'],
-                            metadata={
-                                'timestamp':event_data.get ('timestamp'),
-                                'version':event_data.get ('version'),
-                                'trace_id':trace_id
-                                }
+                            code=wire.code,
+                            data=wire.data,
+                            timestamp=msg.publish_timestamp ()/1000.0,
+                            version=_WIRE_VERSION,
+                            trace_id=trace_id
                             )
 
                         # Track receive
-                        self.metrics.messages_received.labels (
+                        self.metrics.record_received (
                             code=str (event.code),
                             topic=topic,
                             status='success'
-                            ).inc ()
+                            )
 
                         # Process handlers with timing
                         if event.code in self._handlers:
-                            for handler in self._handlers [event.code]:
-                                handler_start = time.time ()
-
-                                try:
-                                    if asyncio.iscoroutinefunction (handler):
-                                        await handler (event)
-                                    else:
-                                        handler (event)
-
-                                    handler_duration = time.time () - handler_start
-                                    self.metrics.message_processing_duration.labels (
-                                        code=str (event.code),
-                                        handler=handler.__name__
-                                        ).observe (handler_duration)
-
-                                except Exception as e:
-                                    self.metrics.errors.labels (
-                                        type='handler',
-                                        operation=handler.__name__
-                                        ).inc ()
-                                    event_logger.error (
-                                        "Handler failed",
-                                        handler=handler.__name__,
-                                        error=str (e)
-                                        )
-
-                        # Acknowledge
-                        consumer.acknowledge (msg)
+                            should_ack = await self._dispatch (event,event_logger,loop)
+                        else:
+                            should_ack = True
 
-                        processing_time = time.time () - receive_time
-                        event_logger.info (
-                            "Message processed",
-                            processing_time=processing_time
-                            )
+                        if should_ack and self._log_sample and next (self._log_counter)%self._log_sample == 0:
+                            event_logger.info (
+                                "Message processed",
+                                processing_time=loop.time () - receive_time
+                                )
 
                     except Exception as e:
-                        self.metrics.messages_received.labels (
+                        self.metrics.record_received (
                             code='unknown',
                             topic=topic,
                             status='failed'
-                            ).inc ()
+                            )
                         consumer_logger.error (
                             "Failed to process message",
                             error=str (e)
                             )
+
+                    # Redelivery of failed messages is left to the negative ack
+                    # delay; the client groups acks, so these are not one RPC each
+                    if should_ack:
+                        consumer.acknowledge (msg)
+                    else:
                         consumer.negative_acknowledge (msg)
 
             except Exception as e:
                 if self._running:
-                    consumer_logger.error ("Consumer error",error=str (e))
-                await asyncio.sleep (1)
+                    consumer_logger.error ("Consumer error",error=str (e),retry_in=backoff)
+                await asyncio.sleep (backoff + random.uniform (0,_BACKOFF_INITIAL_S))
+                backoff = min (_BACKOFF_MAX_S,backoff*2)
+
+    async def _dispatch (self,event,event_logger,loop: asyncio.AbstractEventLoop) -> bool:
+        """Run the event's handlers concurrently; sync ones on the handler pool. True if all succeeded"""
+        sync_handlers,async_handlers = self._handlers [event.code]
+
+        async def run_sync (handler):
+            handler_start = loop.time ()
+            await loop.run_in_executor (self._handler_pool,handler,event)
+            return loop.time () - handler_start
+
+        async def run_async (handler):
+            handler_start = loop.time ()
+            await handler (event)
+            return loop.time () - handler_start
+
+        handlers = sync_handlers + async_handlers
+        results = await asyncio.gather (
+            *map (run_sync,sync_handlers),
+            *map (run_async,async_handlers),
+            return_exceptions=True
+            )
+        succeeded = True
+        for handler,result in zip (handlers,results):
+            if isinstance (result,BaseException):
+                self._handler_failed (handler,result,event_logger)
+                succeeded = False
+            else:
+                self._handler_done (event,handler,result)
+        return succeeded
+
+    def _handler_done (self,event,handler: Callable,duration: float):
+        self.metrics.child (
+            self.metrics.message_processing_duration,
+            str (event.code),
+            handler.__name__
+            ).observe (duration)
+
+    def _handler_failed (self,handler: Callable,error: Exception,event_logger):
+        self.metrics.child (
+            self.metrics.errors,
+            'handler',
+            handler.__name__
+            ).inc ()
+        event_logger.error (
+            "Handler failed",
+            handler=handler.__name__,
+            error=str (error)
+            )
 
     async def health_check (self) -> dict:
         """Comprehensive health check"""
@@ -274,7 +584,7 @@ class UniversalSystem:
         # Check consumers
         health ["components"] ["consumers"] = {
             "total":len (self._consumers),
-            "active":sum (1 for c in self._consumers if not c.done ())
+            "active":self._active_consumers
             }
 
         # Overall status